@@ -1,69 +1,249 @@
 import json
-from datetime import datetime
-from typing import List, Optional
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
 from uuid import uuid4
 
 # PERF FIX: Pandas lazy-loaded inside functions that need it (saves 25+ seconds on startup)
 # import pandas as pd - MOVED TO FUNCTION SCOPE
 
 import streamlit as st
-import streamlit.components.v1 as components
 
 from modules.auth import validate_login
 from modules.gs1_client import parse_scan
-from modules.reports import (
-    export_csv,
-    export_excel,
-    export_excel_single,
-    export_excel_with_metadata,
-    export_pdf,
-    export_pdf_report,
-    to_dataframe,
-)
 from modules.settings import DEFAULT_SETTINGS, load_settings, save_settings
 from modules.storage import (
+    AUDIT_COLUMNS,
+    apply_line_changes,
     create_audit,
     create_line,
     create_session,
-    delete_line,
-    find_duplicates,
-    find_serial_duplicates,
     get_session,
     init_db,
     list_audit,
     list_lines,
+    list_lines_iter,
     list_sessions,
     update_line,
     update_session,
 )
-from modules.utils import expiry_status, normalize_sfda, safe_get
+from modules.utils import current_status, expiry_status, expiry_status_array, normalize_sfda, safe_get
 
 st.set_page_config(page_title="Pharmacy Inventory / Stock Count", layout="wide")
 
-# PERF FIX: init_db() moved to after login (saves 7s on login page load!)
-# init_db() - NOW CALLED IN main() AFTER LOGIN
+
+@st.cache_resource(show_spinner=False)
+def _ensure_db() -> bool:
+    # PERF: Runs init_db() once per process, shared across all users, tabs and reruns
+    init_db()
+    return True
+
+
+_COUNT_UNITS = ("BOX", "PACK", "BLISTER", "TABLET", "CAPSULE", "VIAL", "AMPOULE", "BOTTLE")
+_COUNT_UNIT_IDX = {unit: i for i, unit in enumerate(_COUNT_UNITS)}
 
 
 def _now_local() -> str:
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
 
+_SS_DEFAULTS = {
+    "user": None,
+    "session_id": None,
+    "last_parsed": None,
+    "duplicate_pending": None,
+    "read_only": False,
+}
+
+
 def _ensure_session_state():
-    if "user" not in st.session_state:
-        st.session_state.user = None
-    if "session_id" not in st.session_state:
-        st.session_state.session_id = None
-    if "last_parsed" not in st.session_state:
-        st.session_state.last_parsed = None
-    if "duplicate_pending" not in st.session_state:
-        st.session_state.duplicate_pending = None
-    if "read_only" not in st.session_state:
-        st.session_state.read_only = False
+    # PERF: After the first run nothing is missing, so the hot rerun path is one key scan and no writes
+    missing = {key: value for key, value in _SS_DEFAULTS.items() if key not in st.session_state}
+    if missing:
+        st.session_state.update(missing)
 
 
-def _inject_global_styles() -> None:
-    st.markdown(
-        """
+# Write counters behind the st.cache_data keys. st.cache_data is shared by the whole process,
+# so the counters must be too: a per-browser counter would restart at 0 on reload or for
+# another user and hit an entry cached before their writes.
+_REV_LOCK = threading.Lock()
+
+
+@st.cache_resource(show_spinner=False)
+def _revisions() -> Dict[str, Dict[str, int]]:
+    return {"lines": {}, "session": {}, "sessions": {}}
+
+
+def _rev(kind: str, key: str = "") -> int:
+    return _revisions()[kind].get(key, 0)
+
+
+def _bump_rev(kind: str, key: str = "") -> None:
+    counters = _revisions()[kind]
+    with _REV_LOCK:
+        counters[key] = counters.get(key, 0) + 1
+
+
+# Known line statuses lead the categorical's categories so their int codes are fixed
+_STATUS_ORDER = ("Valid", "Near Expiry", "Expired", "Unknown")
+# Bulk Edit choice that drops a manual status and goes back to the expiry-derived one
+_AUTO_STATUS = "Auto (from expiry)"
+
+
+# PERF: Lines are cached per (session_id, revision); every write path bumps the shared
+# revision so reruns triggered by unrelated widgets skip the backend round trip.
+@st.cache_data(show_spinner=False)
+def _cached_list_lines(session_id: str, rev: int) -> List[dict]:
+    return list_lines(session_id)
+
+
+@st.cache_data(show_spinner=False)
+def _lines_df(session_id: str, rev: int, near_months: int, today: date):
+    # PERF: Lazy-load pandas only when needed
+    import numpy as np
+    import pandas as pd
+
+    df = pd.DataFrame(_cached_list_lines(session_id, rev))
+    if "status" in df:
+        status = df["status"].to_numpy()
+        if "expiry_date" in df:
+            # Stored statuses go stale as days pass or the threshold changes; reclassify the
+            # whole column in one vectorized pass, keeping Unknown (no product data) and
+            # statuses set by hand in Bulk Edit as stored
+            keep = status == "Unknown"
+            if "status_override" in df:
+                keep |= df["status_override"].eq(True).to_numpy()
+            status = np.where(keep, status, expiry_status_array(df["expiry_date"], near_months, today))
+        # PERF: A handful of distinct values; int codes make isin/value_counts/sort cheap.
+        # Any unexpected stored status is appended after the known ones rather than dropped.
+        extra = sorted(set(pd.unique(pd.Series(status).dropna())) - set(_STATUS_ORDER))
+        df["status"] = pd.Categorical(status, categories=list(_STATUS_ORDER) + extra)
+    return df
+
+
+@st.cache_data(show_spinner=False)
+def _dup_index(session_id: str, rev: int) -> Tuple[Dict[tuple, List[dict]], Dict[str, List[dict]]]:
+    # PERF: Duplicate checks become dict lookups instead of two backend queries per scan
+    by_key: Dict[tuple, List[dict]] = {}
+    by_serial: Dict[str, List[dict]] = {}
+    for line in _cached_list_lines(session_id, rev):
+        key = (line.get("gtin") or "", line.get("batch_lot") or "", line.get("expiry_date") or "")
+        by_key.setdefault(key, []).append(line)
+        serial = line.get("serial")
+        if serial:
+            by_serial.setdefault(serial, []).append(line)
+    return by_key, by_serial
+
+
+_SUMMARY_KEYS = ["gtin", "batch_lot", "expiry_date"]
+_SUMMARY_FIRSTS = [
+    "trade_name",
+    "scientific_name",
+    "strength",
+    "dosage_form",
+    "unit_type",
+    "package_size",
+    "count_unit",
+    "sfda_code",
+    "status",
+]
+_SUMMARY_COLS = _SUMMARY_KEYS + _SUMMARY_FIRSTS[:6] + ["total_count"] + _SUMMARY_FIRSTS[6:]
+
+
+@st.cache_data(show_spinner=False)
+def _lines_summary(session_id: str, rev: int, near_months: int, today: date):
+    # PERF: Shared by Review and Finalize; grouped once per revision instead of per rerun.
+    # A numeric-only groupby sum plus drop_duplicates for the descriptive columns avoids
+    # the mixed-dtype .agg(...) slow path.
+    df = _lines_df(session_id, rev, near_months, today)
+    totals = (
+        df.groupby(_SUMMARY_KEYS, sort=False, observed=True)["on_hand_count"].sum().rename("total_count").reset_index()
+    )
+    firsts = df.drop_duplicates(_SUMMARY_KEYS)[_SUMMARY_KEYS + _SUMMARY_FIRSTS]
+    summary = firsts.merge(totals, on=_SUMMARY_KEYS).sort_values(_SUMMARY_KEYS, ignore_index=True)
+    return summary[_SUMMARY_COLS]
+
+
+_WARNING_STATUSES = ("Near Expiry", "Expired", "Unknown")
+_WARNING_CODES = [_STATUS_ORDER.index(s) for s in _WARNING_STATUSES]
+
+
+def _warning_rows(df):
+    # PERF: status is categorical with fixed leading categories; compare int codes directly
+    import numpy as np
+
+    return df[np.isin(df["status"].cat.codes.to_numpy(), _WARNING_CODES)]
+
+
+def _lines_rev(session_id: str) -> int:
+    return _rev("lines", session_id)
+
+
+def _lines_key(session_id: str) -> tuple:
+    # Cache key for status-dependent frames: revision, near-expiry threshold and day
+    return (session_id, _lines_rev(session_id), int(_run_settings()["near_expiry_months"]), date.today())
+
+
+def _run_settings() -> dict:
+    # PERF: main() reads settings once per run; helpers reuse that dict instead of
+    # unpickling another copy out of the load_settings cache on every call
+    settings = st.session_state.get("settings")
+    return settings if settings is not None else load_settings()
+
+
+@st.cache_data(show_spinner=False)
+def _cached_session(session_id: str, rev: int) -> Optional[dict]:
+    return get_session(session_id)
+
+
+def _get_session(session_id: str) -> Optional[dict]:
+    # PERF: Session header/pages read the session doc from cache until update_session bumps it
+    return _cached_session(session_id, _rev("session", session_id))
+
+
+def _update_session(session_id: str, updates: dict) -> None:
+    update_session(session_id, updates)
+    _bump_rev("session", session_id)
+    _bump_rev("sessions")
+
+
+# PERF: The sidebar picker reads the session list from cache; local writes bump the
+# revision and the TTL picks up sessions created from other browsers.
+@st.cache_data(show_spinner=False, ttl=60)
+def _session_options(rev: int) -> Dict[str, str]:
+    return {
+        f"{s['session_name'] or 'Session'} | {s['session_id']} | {s['status']}": s["session_id"]
+        for s in list_sessions()
+    }
+
+
+def _line_lookup(session_id: str) -> Tuple[Dict[str, dict], Dict[str, str]]:
+    # PERF: line_id -> line and picker label -> line_id maps kept in session state and
+    # rebuilt only when the revision moves
+    key = (session_id, _lines_rev(session_id))
+    cached = st.session_state.get("line_index")
+    if cached is None or cached[0] != key:
+        by_id = {l["line_id"]: l for l in _cached_list_lines(*key)}
+        labels = {f"{line_id} | {l.get('gtin','') or ''}": line_id for line_id, l in by_id.items()}
+        cached = (key, by_id, labels)
+        st.session_state.line_index = cached
+    return cached[1], cached[2]
+
+
+def _line_index(session_id: str) -> Dict[str, dict]:
+    return _line_lookup(session_id)[0]
+
+
+def _bump_lines_rev(session_id: Optional[str] = None) -> None:
+    session_id = session_id or st.session_state.session_id
+    _bump_rev("lines", session_id)
+
+
+# PERF: CSS payloads are built once per process and reused across reruns/sessions.
+@st.cache_resource
+def _global_css() -> str:
+    return """
         <style>
         :root {
             --primary: #1B6EF3;
@@ -243,21 +423,47 @@ def _inject_global_styles() -> None:
             margin: 14px 0;
         }
         </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    """
+
+
+@st.cache_resource
+def _enter_key_script(bind_scan: bool) -> str:
+    bindings = 'bind("On-hand Count", "Add to Inventory (Enter)");'
+    if bind_scan:
+        bindings = 'bind("Scan Input", "Parse (Enter)"); ' + bindings
+    return """
+        <script>
+        const doc = window.parent.document;
+        const bind = (label, buttonText) => {
+            const input = doc.querySelector(`input[aria-label="${label}"]`);
+            if (!input || input.dataset.enterBind) return;
+            input.dataset.enterBind = "1";
+            input.addEventListener("keydown", (e) => {
+                if (e.key === "Enter") {
+                    const buttons = Array.from(doc.querySelectorAll("button"));
+                    const target = buttons.find(b => b.textContent.trim() === buttonText);
+                    if (target) target.click();
+                }
+            });
+        };
+        const bindAll = () => { """ + bindings + """ };
+        if (window.parent.__enterKeyObserver) window.parent.__enterKeyObserver.disconnect();
+        window.parent.__enterKeyObserver = new MutationObserver(bindAll);
+        window.parent.__enterKeyObserver.observe(doc.body, { childList: true, subtree: true });
+        bindAll();
+        </script>
+    """
+
+
+def _inject_global_styles() -> None:
+    st.markdown(_global_css(), unsafe_allow_html=True)
+
+
+_BADGE_CLS = {"Valid": "badge-valid", "Near Expiry": "badge-near", "Expired": "badge-expired"}
 
 
 def _render_status_badge(status: str) -> str:
-    if status == "Valid":
-        cls = "badge-valid"
-    elif status == "Near Expiry":
-        cls = "badge-near"
-    elif status == "Expired":
-        cls = "badge-expired"
-    else:
-        cls = "badge-unknown"
-    return f'<span class="badge {cls}">{status}</span>'
+    return f'<span class="badge {_BADGE_CLS.get(status, "badge-unknown")}">{status}</span>'
 
 
 def _render_kpi(label: str, value: str, tone: str = "info") -> str:
@@ -269,34 +475,120 @@ def _render_kpi(label: str, value: str, tone: str = "info") -> str:
     )
 
 
+def _search_haystack(df):
+    # PERF: One lower-cased joined string per row; "\n" keeps matches from spanning
+    # column boundaries.
+    cols = [df[c].astype(str) for c in df.columns]
+    if not cols:
+        return None
+    return cols[0].str.cat(cols[1:], sep="\n", na_rep="").str.lower()
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _search_haystack_cached(_df, data_key: tuple):
+    return _search_haystack(_df)
+
+
+def _search_mask(df, search_text: str, haystack=None):
+    # PERF: One literal (regex=False) substring scan instead of a regex pass per column
+    if haystack is None:
+        haystack = _search_haystack(df)
+    if haystack is None:
+        return df.index.isin([])
+    return haystack.str.contains(search_text.lower(), regex=False, na=False)
+
+
+def _filter_sort(
+    df,
+    search_text: str,
+    status_filter: tuple,
+    sort_col: str,
+    ascending: bool,
+    data_key: Optional[tuple] = None,
+):
+    # PERF: Combine filters into one boolean mask and materialize once (no upfront copy)
+    mask = None
+    if search_text:
+        # With a data_key the joined haystack is reused across different search terms
+        haystack = _search_haystack_cached(df, data_key) if data_key is not None else None
+        mask = _search_mask(df, search_text, haystack)
+    if status_filter and "status" in df.columns:
+        status_mask = df["status"].isin(status_filter)
+        mask = status_mask if mask is None else (mask & status_mask)
+    df_view = df if mask is None else df.loc[mask]
+    if not df_view.empty and sort_col in df_view.columns:
+        df_view = df_view.sort_values(sort_col, ascending=ascending)
+    return df_view
+
+
+def _frame_signature(df) -> str:
+    import hashlib
+
+    import pandas as pd
+
+    # PERF: Content hash, so equal views share one cache entry whatever object holds them
+    digest = hashlib.md5(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    digest.update("\x1f".join(map(str, df.columns)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _export_csv_cached(_df, signature: str, filename: str) -> str:
+    from modules.reports import export_csv
+
+    return str(export_csv(_df, filename))
+
+
+def _export_view_csv(df, filename: str) -> str:
+    from pathlib import Path
+
+    signature = _frame_signature(df)
+    # Each cached path owns its file: exporting another view must not overwrite a cached one
+    stem, _, ext = filename.rpartition(".")
+    filename = f"{stem}_{signature[:12]}.{ext}"
+    path = _export_csv_cached(df, signature, filename)
+    # PERF: Repeat clicks on an unchanged view reuse the written file; rewrite only if it was removed
+    if not Path(path).exists():
+        _export_csv_cached.clear()
+        path = _export_csv_cached(df, signature, filename)
+    return path
+
+
+# PERF: The leading underscore keeps Streamlit from hashing the frame; data_key
+# (caller key + session revision) identifies its contents instead.
+@st.cache_data(show_spinner=False, max_entries=64)
+def _filter_sort_cached(_df, data_key: tuple, search_text: str, status_filter: tuple, sort_col: str, ascending: bool):
+    return _filter_sort(_df, search_text, status_filter, sort_col, ascending, data_key)
+
+
 def _table_controls(
     df,  # pd.DataFrame - pandas imported locally
     *,
     key: str,
     default_sort: str,
     status_options: Optional[List[str]] = None,
+    data_key: Optional[tuple] = None,
 ):
-    col_search, col_status, col_sort, col_order, col_page = st.columns([2, 1.2, 1.4, 1, 1])
-    search_text = col_search.text_input("Search", key=f"{key}_search")
-    if status_options:
-        status_filter = col_status.multiselect("Status", status_options, key=f"{key}_status")
-    else:
-        status_filter = []
+    col_filters, col_page = st.columns([5.6, 1])
+    # PERF: Filter inputs live in a form so typing a search term reruns once on Apply, not per keystroke
+    with col_filters.form(f"{key}_filters", clear_on_submit=False, border=False):
+        col_search, col_status, col_sort, col_order, col_apply = st.columns([2, 1.2, 1.4, 1, 0.6])
+        search_text = col_search.text_input("Search", key=f"{key}_search")
+        if status_options:
+            status_filter = col_status.multiselect("Status", status_options, key=f"{key}_status")
+        else:
+            status_filter = []
 
-    df_view = df.copy()
-    if search_text:
-        mask = df_view.apply(
-            lambda col: col.astype(str).str.contains(search_text, case=False, na=False)
-        )
-        df_view = df_view[mask.any(axis=1)]
-    if status_filter and "status" in df_view.columns:
-        df_view = df_view[df_view["status"].isin(status_filter)]
+        sort_cols = [default_sort] + [c for c in df.columns if c != default_sort]
+        sort_col = col_sort.selectbox("Sort by", sort_cols, key=f"{key}_sort")
+        sort_dir = col_order.selectbox("Order", ["Descending", "Ascending"], key=f"{key}_order")
+        col_apply.form_submit_button("Apply")
 
-    sort_cols = [default_sort] + [c for c in df_view.columns if c != default_sort]
-    sort_col = col_sort.selectbox("Sort by", sort_cols, key=f"{key}_sort")
-    sort_dir = col_order.selectbox("Order", ["Descending", "Ascending"], key=f"{key}_order")
-    if not df_view.empty and sort_col in df_view.columns:
-        df_view = df_view.sort_values(sort_col, ascending=(sort_dir == "Ascending"))
+    args = (search_text, tuple(status_filter), sort_col, sort_dir == "Ascending")
+    if data_key is None:
+        df_view = _filter_sort(df, *args)
+    else:
+        df_view = _filter_sort_cached(df, (key,) + tuple(data_key), *args)
 
     page_size = col_page.selectbox("Page size", [25, 50, 100], index=0, key=f"{key}_pagesize")
     total_rows = len(df_view)
@@ -307,11 +599,9 @@ def _table_controls(
     return df_view.iloc[start:end]
 
 
-def _apply_display_mode(settings: dict) -> None:
-    if settings.get("display_mode") != "Dark":
-        return
-    st.markdown(
-        """
+@st.cache_resource
+def _dark_css() -> str:
+    return """
         <style>
         :root, body, [data-testid="stAppViewContainer"] {
             background-color: #0f1115 !important;
@@ -369,21 +659,34 @@ def _apply_display_mode(settings: dict) -> None:
             color: #E6E6E6 !important;
         }
         </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    """
+
+
+def _apply_display_mode(settings: dict) -> None:
+    if settings.get("display_mode") != "Dark":
+        return
+    # Streamlit drops any element a rerun does not emit again, so the style block cannot be
+    # injected once per browser session; the string itself is built once per process.
+    st.markdown(_dark_css(), unsafe_allow_html=True)
+
+
+_STATUS_EMOJI = {
+    "Valid": "✅ Valid",
+    "Near Expiry": "⚠️ Near Expiry",
+    "Expired": "❌ Expired",
+    "Unknown": "❔ Unknown",
+}
+
+_STATUS_LABELS = {
+    "Valid": "🟢 Valid",
+    "Near Expiry": "🟡 Near Expiry",
+    "Expired": "🔴 Expired",
+    "Unknown": "⚪ Unknown",
+}
 
 
 def _status_badge(status: str) -> str:
-    if status == "Valid":
-        return "✅ Valid"
-    if status == "Near Expiry":
-        return "⚠️ Near Expiry"
-    if status == "Expired":
-        return "❌ Expired"
-    if status == "Unknown":
-        return "❔ Unknown"
-    return f"⚠️ {status}"
+    return _STATUS_EMOJI.get(status, f"⚠️ {status}")
 
 
 def _line_status(parsed: dict, settings: dict) -> str:
@@ -396,20 +699,22 @@ def _line_status(parsed: dict, settings: dict) -> str:
 def _require_login():
     if st.session_state.user:
         return True
-    st.title("Login")
-    with st.form("login_form", clear_on_submit=False):
-        username = st.text_input("Username")
-        password = st.text_input("Password", type="password")
-        submitted = st.form_submit_button("Login")
+    login_area = st.empty()
+    with login_area.container():
+        st.title("Login")
+        with st.form("login_form", clear_on_submit=False):
+            username = st.text_input("Username")
+            password = st.text_input("Password", type="password")
+            submitted = st.form_submit_button("Login")
     if submitted:
         if validate_login(username, password):
             st.session_state.user = username
             create_audit(username, "login_success")
-            st.success("Logged in")
-            st.rerun()
-        else:
-            create_audit(username or "unknown", "login_failure")
-            st.error("Invalid credentials")
+            # PERF: Render the app in this run instead of paying for a full st.rerun()
+            login_area.empty()
+            return True
+        create_audit(username or "unknown", "login_failure")
+        st.error("Invalid credentials")
     return False
 
 
@@ -439,100 +744,150 @@ def _session_header(session: dict):
 
 
 def _select_or_restore_session():
-    sessions = list_sessions()
-    if not sessions:
+    session_map = _session_options(_rev("sessions"))
+    if not session_map:
         return None
-    session_map = {
-        f"{s['session_name'] or 'Session'} | {s['session_id']} | {s['status']}": s["session_id"]
-        for s in sessions
-    }
     selection = st.sidebar.selectbox("Open Session", ["--"] + list(session_map.keys()))
     if selection != "--":
-        st.session_state.session_id = session_map[selection]
-        update_session(st.session_state.session_id, {"last_opened": _now_local()})
-        session = get_session(st.session_state.session_id)
+        # PERF: Only stamp last_opened when the selection actually changes, not on every rerun
+        if session_map[selection] != st.session_state.session_id:
+            st.session_state.session_id = session_map[selection]
+            _update_session(st.session_state.session_id, {"last_opened": _now_local()})
+        session = _get_session(st.session_state.session_id)
         st.session_state.read_only = bool(session and session.get("status") == "Finalized" and st.session_state.user != "admin")
 
 
+_LINE_FIELDS = (
+    ("gtin", "GTIN"),
+    ("trade_name", "Trade Name"),
+    ("scientific_name", "Scientific Name"),
+    ("batch_lot", "BATCH/LOT"),
+    ("expiry_date", "Expiry Date"),
+    ("serial", "SERIAL"),
+    ("unit_type", "UNIT_TYPE"),
+    ("granular_unit", "GRANULAR_UNIT"),
+    ("dosage_form", "DOSAGE_FORM"),
+    ("strength", "STRENGTH"),
+    ("roa", "ROA"),
+    ("package_type", "PACKAGE_TYPE"),
+    ("package_size", "PACKAGE_SIZE"),
+    ("category", "CATEGORY"),
+)
+
+
 def _build_line_data(parsed: dict, count: float, count_unit: str, settings: dict) -> dict:
-    sfda = parsed.get("SFDA Code")
-    status = _line_status(parsed, settings)
-    return {
-        "session_id": st.session_state.session_id,
-        "scan_timestamp": _now_local(),
-        "scanned_by": st.session_state.user,
-        "gtin": safe_get(parsed, "GTIN"),
-        "trade_name": safe_get(parsed, "Trade Name"),
-        "scientific_name": safe_get(parsed, "Scientific Name"),
-        "batch_lot": safe_get(parsed, "BATCH/LOT"),
-        "expiry_date": safe_get(parsed, "Expiry Date"),
-        "serial": safe_get(parsed, "SERIAL"),
-        "on_hand_count": float(count),
-        "count_unit": count_unit,
-        "unit_type": safe_get(parsed, "UNIT_TYPE"),
-        "granular_unit": safe_get(parsed, "GRANULAR_UNIT"),
-        "dosage_form": safe_get(parsed, "DOSAGE_FORM"),
-        "strength": safe_get(parsed, "STRENGTH"),
-        "roa": safe_get(parsed, "ROA"),
-        "package_type": safe_get(parsed, "PACKAGE_TYPE"),
-        "package_size": safe_get(parsed, "PACKAGE_SIZE"),
-        "category": safe_get(parsed, "CATEGORY"),
-        "price": parsed.get("PRICE"),
-        "sfda_code": normalize_sfda(sfda),
-        "status": status,
-        "notes": "",
-    }
+    data = {key: safe_get(parsed, parsed_key) for key, parsed_key in _LINE_FIELDS}
+    data.update(
+        session_id=st.session_state.session_id,
+        scan_timestamp=_now_local(),
+        scanned_by=st.session_state.user,
+        on_hand_count=float(count),
+        count_unit=count_unit,
+        price=parsed.get("PRICE"),
+        sfda_code=normalize_sfda(parsed.get("SFDA Code")),
+        status=_line_status(parsed, settings),
+        notes="",
+    )
+    return data
+
+
+# PERF: The card skeleton is built once; each rerun only fills the placeholders.
+_SCAN_CARD_TMPL = """
+        <div class="card">
+            <div style="font-size:20px;font-weight:700;">{trade_name}</div>
+            <div style="color:var(--muted);margin-bottom:8px;">{scientific_name}</div>
+            <div class="card-grid">
+                <div><div class="label">GTIN</div><div class="value">{gtin}</div></div>
+                <div><div class="label">Expiry</div><div class="value">{expiry} {status_badge}</div></div>
+                <div><div class="label">Batch/Lot</div><div class="value">{batch_lot}</div></div>
+                <div><div class="label">Serial</div><div class="value">{serial}</div></div>
+                <div><div class="label">Strength</div><div class="value">{strength}</div></div>
+                <div><div class="label">Dosage Form</div><div class="value">{dosage_form}</div></div>
+                <div><div class="label">Unit Type</div><div class="value">{unit_type} ({granular_unit})</div></div>
+                <div><div class="label">Package</div><div class="value">{package_type} {package_size}</div></div>
+                <div><div class="label">ROA</div><div class="value">{roa}</div></div>
+                <div><div class="label">Price</div><div class="value">{price}</div></div>
+                <div><div class="label">SFDA Code</div><div class="value">{sfda_display}</div></div>
+            </div>
+        </div>
+        """
+
+_SCAN_CARD_FIELDS = (
+    ("trade_name", "Trade Name"),
+    ("scientific_name", "Scientific Name"),
+    ("gtin", "GTIN"),
+    ("batch_lot", "BATCH/LOT"),
+    ("serial", "SERIAL"),
+    ("strength", "STRENGTH"),
+    ("dosage_form", "DOSAGE_FORM"),
+    ("unit_type", "UNIT_TYPE"),
+    ("granular_unit", "GRANULAR_UNIT"),
+    ("package_type", "PACKAGE_TYPE"),
+    ("package_size", "PACKAGE_SIZE"),
+    ("roa", "ROA"),
+    ("price", "PRICE"),
+)
+
+
+@contextmanager
+def _css_wrap(*classes: str):
+    # PERF: One opening and one closing delta, however many wrapper classes are nested
+    st.markdown("".join(f'<div class="{cls}">' for cls in classes), unsafe_allow_html=True)
+    try:
+        yield
+    finally:
+        st.markdown("</div>" * len(classes), unsafe_allow_html=True)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _scan_card_html(parsed_key: str, status: str) -> str:
+    # PERF: The parsed scan is unchanged between Enter-to-scan and Add-to-inventory; fill the card once
+    parsed = json.loads(parsed_key)
+    ctx = {name: safe_get(parsed, field) for name, field in _SCAN_CARD_FIELDS}
+    ctx["trade_name"] = ctx["trade_name"] or "Unknown GTIN"
+    ctx["expiry"] = parsed.get("Expiry Date", "")
+    ctx["status_badge"] = _render_status_badge(status)
+    ctx["sfda_display"] = normalize_sfda(parsed.get("SFDA Code"))
+    return _SCAN_CARD_TMPL.format_map(ctx)
 
 
 def _render_scan_card(parsed: dict, settings: dict):
     if not parsed:
         return
-    expiry = parsed.get("Expiry Date", "")
-    status = expiry_status(expiry, settings["near_expiry_months"])
     unknown_gtin = not parsed.get("Trade Name")
     sfda_codes = parsed.get("SFDA Code")
-    sfda_display = normalize_sfda(sfda_codes)
+
+    # PERF: last_parsed is the same dict between reruns of one scan; reuse its card without
+    # re-serializing it or re-evaluating the expiry status. Holding the dict in the entry keeps
+    # its identity from being recycled. Quick-add mutates the dict, so unknown GTINs skip this.
+    card_key = (settings["near_expiry_months"], date.today())
+    cached = st.session_state.get("scan_card")
+    if not unknown_gtin and cached is not None and cached[0] is parsed and cached[1] == card_key:
+        card_html = cached[2]
+    else:
+        status = expiry_status(parsed.get("Expiry Date", ""), settings["near_expiry_months"])
+        card_html = _scan_card_html(json.dumps(parsed, sort_keys=True, default=str), status)
+        st.session_state.scan_card = (parsed, card_key, card_html)
 
     st.markdown("### Scan Result")
-    st.markdown(
-        f"""
-        <div class="card">
-            <div style="font-size:20px;font-weight:700;">{safe_get(parsed, "Trade Name") or "Unknown GTIN"}</div>
-            <div style="color:var(--muted);margin-bottom:8px;">{safe_get(parsed, "Scientific Name")}</div>
-            <div class="card-grid">
-                <div><div class="label">GTIN</div><div class="value">{safe_get(parsed, "GTIN")}</div></div>
-                <div><div class="label">Expiry</div><div class="value">{expiry} {_render_status_badge(status)}</div></div>
-                <div><div class="label">Batch/Lot</div><div class="value">{safe_get(parsed, "BATCH/LOT")}</div></div>
-                <div><div class="label">Serial</div><div class="value">{safe_get(parsed, "SERIAL")}</div></div>
-                <div><div class="label">Strength</div><div class="value">{safe_get(parsed, "STRENGTH")}</div></div>
-                <div><div class="label">Dosage Form</div><div class="value">{safe_get(parsed, "DOSAGE_FORM")}</div></div>
-                <div><div class="label">Unit Type</div><div class="value">{safe_get(parsed, "UNIT_TYPE")} ({safe_get(parsed, "GRANULAR_UNIT")})</div></div>
-                <div><div class="label">Package</div><div class="value">{safe_get(parsed, "PACKAGE_TYPE")} {safe_get(parsed, "PACKAGE_SIZE")}</div></div>
-                <div><div class="label">ROA</div><div class="value">{safe_get(parsed, "ROA")}</div></div>
-                <div><div class="label">Price</div><div class="value">{safe_get(parsed, "PRICE")}</div></div>
-                <div><div class="label">SFDA Code</div><div class="value">{sfda_display}</div></div>
-            </div>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(card_html, unsafe_allow_html=True)
 
     gtin_value = safe_get(parsed, "GTIN")
     if gtin_value:
-        st.markdown('<div class="action-bar">', unsafe_allow_html=True)
-        st.markdown('<div class="btn-secondary">', unsafe_allow_html=True)
-        if st.button("Copy GTIN"):
-            components.html(
-                f"""
-                <script>
-                navigator.clipboard.writeText("{gtin_value}");
-                </script>
-                """,
-                height=0,
-            )
-            st.success("GTIN copied.")
-        st.markdown("</div>", unsafe_allow_html=True)
-        st.markdown("</div>", unsafe_allow_html=True)
+        with _css_wrap("action-bar", "btn-secondary"):
+            if st.button("Copy GTIN"):
+                # PERF: Lazy-load components only when needed
+                from streamlit.components.v1 import html as _components_html
+
+                _components_html(
+                    f"""
+                    <script>
+                    navigator.clipboard.writeText("{gtin_value}");
+                    </script>
+                    """,
+                    height=0,
+                )
+                st.success("GTIN copied.")
 
     if isinstance(sfda_codes, list) and len(sfda_codes) > 1:
         with st.expander("Show all SFDA codes"):
@@ -563,7 +918,7 @@ def _scan_and_count(settings: dict):
         st.info("Create or select a session first.")
         return
 
-    session = get_session(st.session_state.session_id)
+    session = _get_session(st.session_state.session_id)
     if not session:
         st.error("Session not found.")
         return
@@ -575,20 +930,22 @@ def _scan_and_count(settings: dict):
     if session.get("status") == "Finalized" and is_admin:
         st.warning("Session is finalized. Admin override enabled.")
 
+    # PERF: Lazy-load components only on the scan page
+    from streamlit.components.v1 import html as _components_html
+
+    scan_submitted = False
     if settings.get("auto_parse_on_enter", True):
         with st.form("scan_form", clear_on_submit=True):
-            st.markdown('<div class="scan-input">', unsafe_allow_html=True)
-            scan_text = st.text_input(
-                "Scan Input",
-                placeholder="Scan barcode here",
-                help="Scanner input",
-                key="scan_input",
-            )
-            st.markdown("</div>", unsafe_allow_html=True)
-            st.markdown('<div class="btn-primary">', unsafe_allow_html=True)
-            submitted = st.form_submit_button("Parse (Enter)")
-            st.markdown("</div>", unsafe_allow_html=True)
-        if submitted:
+            with _css_wrap("scan-input"):
+                scan_text = st.text_input(
+                    "Scan Input",
+                    placeholder="Scan barcode here",
+                    help="Scanner input",
+                    key="scan_input",
+                )
+            with _css_wrap("btn-primary"):
+                scan_submitted = st.form_submit_button("Parse (Enter)")
+        if scan_submitted:
             ok, data, err = parse_scan(scan_text)
             if ok:
                 st.session_state.last_parsed = data
@@ -596,74 +953,48 @@ def _scan_and_count(settings: dict):
                 st.session_state.last_parsed = None
                 st.error(err)
     else:
-        st.markdown('<div class="scan-input">', unsafe_allow_html=True)
-        scan_text = st.text_input(
-            "Scan Input",
-            placeholder="Scan barcode here",
-            help="Scanner input",
-            key="scan_input",
-        )
-        st.markdown("</div>", unsafe_allow_html=True)
-        st.markdown('<div class="btn-primary">', unsafe_allow_html=True)
-        if st.button("Parse"):
-            ok, data, err = parse_scan(scan_text)
-            if ok:
-                st.session_state.last_parsed = data
-            else:
-                st.session_state.last_parsed = None
-                st.error(err)
-        st.markdown("</div>", unsafe_allow_html=True)
+        with _css_wrap("scan-input"):
+            scan_text = st.text_input(
+                "Scan Input",
+                placeholder="Scan barcode here",
+                help="Scanner input",
+                key="scan_input",
+            )
+        with _css_wrap("btn-primary"):
+            scan_submitted = st.button("Parse")
+            if scan_submitted:
+                ok, data, err = parse_scan(scan_text)
+                if ok:
+                    st.session_state.last_parsed = data
+                else:
+                    st.session_state.last_parsed = None
+                    st.error(err)
 
     parsed = st.session_state.last_parsed
     _render_scan_card(parsed, settings)
 
-    if settings.get("auto_parse_on_enter", True):
-        components.html(
-            """
-            <script>
-            const scanInput = window.parent.document.querySelector('input[aria-label="Scan Input"]');
-            if (scanInput && !scanInput.dataset.enterBind) {
-                scanInput.dataset.enterBind = "1";
-                scanInput.addEventListener("keydown", (e) => {
-                    if (e.key === "Enter") {
-                        const buttons = Array.from(window.parent.document.querySelectorAll("button"));
-                        const target = buttons.find(b => b.textContent.trim() === "Parse (Enter)");
-                        if (target) target.click();
-                    }
-                });
-            }
-            </script>
-            """,
-            height=0,
-        )
+    # PERF: One iframe with a MutationObserver binds Enter on both inputs whenever they appear
+    _components_html(_enter_key_script(settings.get("auto_parse_on_enter", True)), height=0)
 
     if st.session_state.get("last_added"):
         st.info(f"Last Added: {st.session_state.last_added}")
 
     if parsed:
-        count_units = [
-            "BOX",
-            "PACK",
-            "BLISTER",
-            "TABLET",
-            "CAPSULE",
-            "VIAL",
-            "AMPOULE",
-            "BOTTLE",
-        ]
         default_unit = parsed.get("UNIT_TYPE") or "PACK"
-        if default_unit not in count_units:
-            count_units.append(default_unit)
+        if default_unit in _COUNT_UNIT_IDX:
+            count_units = _COUNT_UNITS
+            unit_index = _COUNT_UNIT_IDX[default_unit]
+        else:
+            count_units = _COUNT_UNITS + (default_unit,)
+            unit_index = len(_COUNT_UNITS)
 
         with st.form("count_form", clear_on_submit=True):
-            st.markdown('<div class="card">', unsafe_allow_html=True)
-            st.markdown('<div class="section-title">Count Input</div>', unsafe_allow_html=True)
-            count = st.number_input("On-hand Count", min_value=0.0, step=1.0)
-            unit = st.selectbox("Count Unit", count_units, index=count_units.index(default_unit))
-            st.markdown('<div class="btn-primary">', unsafe_allow_html=True)
-            add_clicked = st.form_submit_button("Add to Inventory (Enter)")
-            st.markdown("</div>", unsafe_allow_html=True)
-            st.markdown("</div>", unsafe_allow_html=True)
+            with _css_wrap("card"):
+                st.markdown('<div class="section-title">Count Input</div>', unsafe_allow_html=True)
+                count = st.number_input("On-hand Count", min_value=0.0, step=1.0)
+                unit = st.selectbox("Count Unit", count_units, index=unit_index)
+                with _css_wrap("btn-primary"):
+                    add_clicked = st.form_submit_button("Add to Inventory (Enter)")
 
         if add_clicked:
             if count <= 0:
@@ -677,25 +1008,6 @@ def _scan_and_count(settings: dict):
                 st.session_state.duplicate_pending = pending
                 st.session_state.focus_scan = True
 
-        components.html(
-            """
-            <script>
-            const countInput = window.parent.document.querySelector('input[aria-label="On-hand Count"]');
-            if (countInput && !countInput.dataset.enterBind) {
-                countInput.dataset.enterBind = "1";
-                countInput.addEventListener("keydown", (e) => {
-                    if (e.key === "Enter") {
-                        const buttons = Array.from(window.parent.document.querySelectorAll("button"));
-                        const target = buttons.find(b => b.textContent.trim() === "Add to Inventory (Enter)");
-                        if (target) target.click();
-                    }
-                });
-            }
-            </script>
-            """,
-            height=0,
-        )
-
     _handle_duplicate_flow(settings)
 
     st.subheader("Data Quality Panel")
@@ -704,8 +1016,11 @@ def _scan_and_count(settings: dict):
     st.subheader("Inventory Lines")
     _lines_table(settings, session)
 
-    if settings.get("auto_focus_scan_input") or st.session_state.get("focus_scan"):
-        components.html(
+    # PERF: Each injection mounts a new iframe; only focus when the page is first shown, after a
+    # scan, or when an add flips focus_scan, rather than on every widget rerun
+    auto_focus = settings.get("auto_focus_scan_input") and (scan_submitted or not st.session_state.get("scan_focused"))
+    if auto_focus or st.session_state.get("focus_scan"):
+        _components_html(
             """
             <script>
             const el = window.parent.document.querySelector('input[aria-label="Scan Input"]');
@@ -715,6 +1030,7 @@ def _scan_and_count(settings: dict):
             height=0,
         )
         st.session_state.focus_scan = False
+        st.session_state.scan_focused = True
 
 
 def _handle_duplicate_flow(settings: dict):
@@ -725,13 +1041,12 @@ def _handle_duplicate_flow(settings: dict):
     parsed = pending["parsed"]
     line_data = _build_line_data(parsed, pending["count"], pending["unit"], settings)
 
-    duplicates = find_duplicates(
-        st.session_state.session_id,
-        gtin=line_data["gtin"],
-        batch_lot=line_data["batch_lot"],
-        expiry_date=line_data["expiry_date"],
+    session_id = st.session_state.session_id
+    by_key, by_serial = _dup_index(session_id, _lines_rev(session_id))
+    duplicates = by_key.get(
+        (line_data["gtin"] or "", line_data["batch_lot"] or "", line_data["expiry_date"] or ""), []
     )
-    serial_duplicates = find_serial_duplicates(st.session_state.session_id, line_data["serial"])
+    serial_duplicates = by_serial.get(line_data["serial"], []) if line_data["serial"] else []
 
     if serial_duplicates and not settings["allow_duplicate_serial_override"]:
         create_audit(
@@ -767,29 +1082,30 @@ def _handle_duplicate_flow(settings: dict):
         horizontal=True,
         key="duplicate_action_choice",
     )
-    st.markdown('<div class="btn-primary">', unsafe_allow_html=True)
-    if st.button("Apply Duplicate Action"):
-        if action == "Aggregate":
-            target = duplicates[0]
-            new_count = float(target["on_hand_count"]) + float(line_data["on_hand_count"])
-            update_line(target["line_id"], {"on_hand_count": new_count})
-            create_audit(
-                st.session_state.user,
-                "aggregate_line",
-                session_id=st.session_state.session_id,
-                line_id=target["line_id"],
-                old_value=target,
-                new_value={"on_hand_count": new_count},
-            )
-            st.success("Quantity aggregated.")
-        else:
-            _commit_line(line_data)
-        st.session_state.duplicate_pending = None
-    st.markdown("</div>", unsafe_allow_html=True)
+    with _css_wrap("btn-primary"):
+        if st.button("Apply Duplicate Action"):
+            if action == "Aggregate":
+                target = duplicates[0]
+                new_count = float(target["on_hand_count"]) + float(line_data["on_hand_count"])
+                update_line(target["line_id"], {"on_hand_count": new_count})
+                _bump_lines_rev()
+                create_audit(
+                    st.session_state.user,
+                    "aggregate_line",
+                    session_id=st.session_state.session_id,
+                    line_id=target["line_id"],
+                    old_value=target,
+                    new_value={"on_hand_count": new_count},
+                )
+                st.success("Quantity aggregated.")
+            else:
+                _commit_line(line_data)
+            st.session_state.duplicate_pending = None
 
 
 def _commit_line(line_data: dict):
     line_id = create_line(line_data)
+    _bump_lines_rev()
     create_audit(
         st.session_state.user,
         "add_line",
@@ -801,25 +1117,30 @@ def _commit_line(line_data: dict):
     st.session_state.last_added = f"{line_data.get('gtin')} | {line_data.get('trade_name')}"
 
 
+@st.cache_data(show_spinner=False)
+def _quality_kpis(session_id: str, rev: int, near_months: int, today: date) -> Tuple[int, int, int, int, int, int]:
+    df = _lines_df(session_id, rev, near_months, today)
+    # PERF: KPIs come from pandas C paths (value_counts / drop_duplicates / duplicated),
+    # computed once per lines revision
+    if df.empty:
+        return 0, 0, 0, 0, 0, 0
+    status_counts = df["status"].value_counts()
+    serials = df["serial"].fillna("")
+    return (
+        len(df),
+        len(df.drop_duplicates(subset=["gtin", "batch_lot", "expiry_date"])),
+        int(status_counts.get("Near Expiry", 0)),
+        int(status_counts.get("Expired", 0)),
+        int(status_counts.get("Unknown", 0)),
+        int(serials[serials != ""].duplicated().sum()),
+    )
+
+
 def _quality_panel(settings: dict):
-    lines = list_lines(st.session_state.session_id)
-    total_scans = len(lines)
-    unique_items = len(
-        set(
-            (l.get("gtin"), l.get("batch_lot"), l.get("expiry_date"))
-            for l in lines
-        )
+    session_id = st.session_state.session_id
+    total_scans, unique_items, near_expiry, expired, unknown, dup_serial = _quality_kpis(
+        *_lines_key(session_id)
     )
-    near_expiry = sum(1 for l in lines if l.get("status") == "Near Expiry")
-    expired = sum(1 for l in lines if l.get("status") == "Expired")
-    unknown = sum(1 for l in lines if l.get("status") == "Unknown")
-    dup_serial = 0
-    seen_serial = set()
-    for l in lines:
-        serial = l.get("serial") or ""
-        if serial and serial in seen_serial:
-            dup_serial += 1
-        seen_serial.add(serial)
 
     cols = st.columns(6)
     cols[0].markdown(_render_kpi("Total Scans", str(total_scans), "info"), unsafe_allow_html=True)
@@ -830,78 +1151,118 @@ def _quality_panel(settings: dict):
     cols[5].markdown(_render_kpi("Duplicate Serials", str(dup_serial), "warning"), unsafe_allow_html=True)
 
 
-def _lines_table(settings: dict, session: dict):
-    # PERF: Lazy-load pandas only when needed
-    import pandas as pd
+_LINES_DISPLAY_COLS = [
+    "line_id",
+    "scan_timestamp",
+    "scanned_by",
+    "gtin",
+    "trade_name",
+    "scientific_name",
+    "batch_lot",
+    "expiry_date",
+    "serial",
+    "on_hand_count",
+    "count_unit",
+    "unit_type",
+    "granular_unit",
+    "dosage_form",
+    "strength",
+    "roa",
+    "package_type",
+    "package_size",
+    "category",
+    "price",
+    "sfda_code",
+    "status",
+    "notes",
+]
+# PERF: Static editor schema; only the count and notes columns are editable
+_LINES_EDITOR_CONFIG = {col: st.column_config.Column(disabled=True) for col in _LINES_DISPLAY_COLS}
+_LINES_EDITOR_CONFIG["on_hand_count"] = st.column_config.NumberColumn(min_value=0.0)
+_LINES_EDITOR_CONFIG["notes"] = st.column_config.TextColumn()
+
+
+@st.cache_data(show_spinner=False)
+def _lines_display_df(session_id: str, rev: int, near_months: int, today: date):
+    # PERF: Column selection and status labels are applied once per revision, not per rerun
+    df = _lines_df(session_id, rev, near_months, today)[_LINES_DISPLAY_COLS]
+    # PERF: Relabel the handful of categories rather than mapping every row
+    df["status"] = df["status"].cat.rename_categories(lambda value: _STATUS_LABELS.get(value, str(value)))
+    return df
+
+
+@st.cache_data(show_spinner=False)
+def _lines_search_blob(session_id: str, rev: int, near_months: int, today: date):
+    # PERF: Joined row text is built once per revision instead of once per search
+    return _search_haystack(_lines_display_df(session_id, rev, near_months, today))
+
 
-    lines = list_lines(st.session_state.session_id)
-    if not lines:
+def _lines_table(settings: dict, session: dict):
+    session_id = st.session_state.session_id
+    if not _line_index(session_id):
         st.info("No lines yet.")
         return
     is_finalized = session.get("status") == "Finalized"
     is_admin = st.session_state.user == "admin"
+    _lines_interactive(session_id, is_finalized, is_admin)
+
+
+def _rerun_with_messages(*messages: Tuple[str, str]) -> None:
+    # Messages survive the full-app rerun that refreshes KPIs after a write inside a fragment
+    st.session_state.lines_flash = [m for m in messages if m[1]]
+    st.rerun()
+
+
+def _show_messages(*messages: Tuple[str, str]) -> None:
+    # Nothing was written, so report in place without a rerun
+    for level, message in messages:
+        if message:
+            getattr(st, level)(message)
+
+
+# PERF: Filter/sort/paginate/edit reruns are scoped to this fragment; KPIs and the scan
+# card above are only rebuilt when a write forces a full-app rerun.
+@st.fragment
+def _lines_interactive(session_id: str, is_finalized: bool, is_admin: bool):
+    # PERF: Lazy-load pandas only when needed
+    import pandas as pd
+
+    data_key = _lines_key(session_id)
+    line_by_id = _line_index(session_id)
     allow_edit = (not is_finalized) or is_admin
+    df = _lines_display_df(*data_key)
 
-    df = pd.DataFrame(lines)
-    display_cols = [
-        "line_id",
-        "scan_timestamp",
-        "scanned_by",
-        "gtin",
-        "trade_name",
-        "scientific_name",
-        "batch_lot",
-        "expiry_date",
-        "serial",
-        "on_hand_count",
-        "count_unit",
-        "unit_type",
-        "granular_unit",
-        "dosage_form",
-        "strength",
-        "roa",
-        "package_type",
-        "package_size",
-        "category",
-        "price",
-        "sfda_code",
-        "status",
-        "notes",
-    ]
-    df = df[display_cols]
-    if "status" in df.columns:
-        def _status_label(value: str) -> str:
-            if value == "Valid":
-                return "🟢 Valid"
-            if value == "Near Expiry":
-                return "🟡 Near Expiry"
-            if value == "Expired":
-                return "🔴 Expired"
-            if value == "Unknown":
-                return "⚪ Unknown"
-            return str(value)
-
-        df["status"] = df["status"].apply(_status_label)
+    for level, message in st.session_state.pop("lines_flash", []):
+        getattr(st, level)(message)
 
     st.markdown("### Filters")
     col_search, col_status, col_sort, col_order, col_page = st.columns([2, 1.2, 1.4, 1, 1])
     search_text = col_search.text_input("Search", key="lines_search")
-    status_options = sorted({str(l.get("status") or "") for l in lines if l.get("status")})
+    status_options = sorted(pd.unique(df["status"].dropna().astype(str)))
     status_filter = col_status.multiselect("Status", status_options, key="lines_status_filter")
 
-    df_view = df.copy()
-    if search_text:
-        mask = df_view.apply(
-            lambda col: col.astype(str).str.contains(search_text, case=False, na=False)
-        )
-        df_view = df_view[mask.any(axis=1)]
+    # Filtering/sorting below always produce new frames, so no defensive copy is needed
+    df_view = df
+    # PERF: Active filters are combined into one boolean mask so the frame is indexed once
+    mask = None
+    # PERF: A single character matches nearly every row; skip the scan until the query narrows
+    if len(search_text) >= 2:
+        mask = _search_mask(df, search_text, _lines_search_blob(*data_key))
     if status_filter:
-        df_view = df_view[df_view["status"].isin(status_filter)]
+        status_mask = df["status"].isin(status_filter)
+        mask = status_mask if mask is None else mask & status_mask
+    if mask is not None:
+        df_view = df.loc[mask]
 
     sort_col = col_sort.selectbox("Sort by", ["scan_timestamp"] + [c for c in df_view.columns if c != "scan_timestamp"])
     sort_dir = col_order.selectbox("Order", ["Descending", "Ascending"])
     if not df_view.empty and sort_col in df_view.columns:
-        df_view = df_view.sort_values(sort_col, ascending=(sort_dir == "Ascending"))
+        if sort_col == "scan_timestamp":
+            # PERF: Storage already returns lines newest-first; reuse that order instead of sorting
+            if sort_dir == "Ascending":
+                df_view = df_view.iloc[::-1]
+        else:
+            df_view = df_view.sort_values(sort_col, ascending=(sort_dir == "Ascending"))
 
     page_size = col_page.selectbox("Page size", [25, 50, 100], index=0)
     total_rows = len(df_view)
@@ -913,54 +1274,94 @@ def _lines_table(settings: dict, session: dict):
 
     if is_finalized and not is_admin:
         st.info("Session is finalized. Line edits are disabled.")
-    st.markdown('<div class="table-wrap">', unsafe_allow_html=True)
-    edited = st.data_editor(
-        df_view,
-        num_rows="dynamic",
-        width="stretch",
-        disabled=[c for c in df_view.columns if c not in ("on_hand_count", "notes")] if allow_edit else True,
-        key="lines_editor",
-    )
-    st.markdown("</div>", unsafe_allow_html=True)
+    # PERF: The read-only st.dataframe is much lighter than st.data_editor; only pay for the
+    # editor (schema + edit state round trip) when the user asks to edit
+    edit_mode = allow_edit and st.toggle("Enable line editing", key="lines_edit_mode")
+    with _css_wrap("table-wrap"):
+        if edit_mode:
+            edited = st.data_editor(
+                df_view,
+                num_rows="dynamic",
+                width="stretch",
+                column_config=_LINES_EDITOR_CONFIG,
+                key="lines_editor",
+            )
+        else:
+            st.dataframe(df_view, width="stretch")
 
-    if allow_edit and st.button("Save Line Edits"):
+    if edit_mode and st.button("Save Line Edits"):
         blocked = 0
-        for _, row in edited.iterrows():
-            line_id = row["line_id"]
-            original = next((l for l in lines if l["line_id"] == line_id), None)
+        # PERF: Diff the editable columns as vectors and only visit rows that actually changed
+        editable = ["on_hand_count", "notes"]
+        before = df_view.set_index("line_id")[editable]
+        after = edited.dropna(subset=["line_id"]).set_index("line_id")[editable]
+        after = after[after.index.isin(before.index)]
+        before = before.loc[after.index]
+        count_after = after["on_hand_count"].astype(float)
+        count_before = before["on_hand_count"].astype(float)
+        # NaN never equals NaN; a count left blank on both sides is not an edit
+        count_changed = count_after.ne(count_before) & ~(count_after.isna() & count_before.isna())
+        # A count cleared to blank is rejected rather than stored as NaN
+        count_cleared = count_changed & count_after.isna()
+        cleared = int(count_cleared.sum())
+        count_changed &= ~count_cleared
+        notes_changed = after["notes"].fillna("").astype(str).ne(before["notes"].fillna("").astype(str))
+        any_changed = (count_changed | notes_changed).to_numpy()
+        # PERF: Collect writes and flush them as one bulk update + one bulk audit insert
+        pending_updates = {}
+        pending_audits = []
+        for line_id, count, notes, count_diff, notes_diff in zip(
+            after.index[any_changed],
+            after["on_hand_count"].to_numpy()[any_changed],
+            after["notes"].to_numpy()[any_changed],
+            count_changed.to_numpy()[any_changed],
+            notes_changed.to_numpy()[any_changed],
+        ):
+            original = line_by_id.get(line_id)
             if not original:
                 continue
             if original.get("locked") and not is_admin:
                 blocked += 1
                 continue
             updates = {}
-            if float(row["on_hand_count"]) != float(original["on_hand_count"]):
-                updates["on_hand_count"] = float(row["on_hand_count"])
-            if str(row["notes"]) != str(original.get("notes") or ""):
-                updates["notes"] = row["notes"]
+            if count_diff:
+                updates["on_hand_count"] = float(count)
+            if notes_diff:
+                updates["notes"] = notes
             if updates:
-                update_line(line_id, updates)
-                create_audit(
-                    st.session_state.user,
-                    "edit_line",
-                    session_id=st.session_state.session_id,
-                    line_id=line_id,
-                    old_value=original,
-                    new_value=updates,
+                pending_updates[line_id] = updates
+                pending_audits.append(
+                    dict(
+                        username=st.session_state.user,
+                        action_type="edit_line",
+                        session_id=st.session_state.session_id,
+                        line_id=line_id,
+                        old_value=original,
+                        new_value=updates,
+                    )
                 )
-        st.success("Edits saved.")
-        if blocked:
-            st.warning(f"Skipped {blocked} locked line(s).")
+        notices = (
+            ("warning", f"Skipped {blocked} locked line(s)." if blocked else ""),
+            ("warning", f"Ignored {cleared} blank count(s); enter 0 to zero a line." if cleared else ""),
+        )
+        # An empty save must not bump the revision: that would drop every cached frame
+        if pending_updates:
+            apply_line_changes(updates=pending_updates, audits=pending_audits)
+            _bump_lines_rev(session_id)
+            _rerun_with_messages(("success", "Edits saved."), *notices)
+        _show_messages(("info", "No changes to save."), *notices)
 
     st.markdown("### Export Current View")
     st.markdown('<div class="export-toolbar">', unsafe_allow_html=True)
     st.markdown('<div class="btn-secondary">', unsafe_allow_html=True)
     if st.button("Export Current View CSV"):
-        path = export_csv(df_view, f"lines_view_{st.session_state.session_id}.csv")
+        path = _export_view_csv(df_view, f"lines_view_{st.session_state.session_id}.csv")
         st.success(f"Saved: {path}")
     st.markdown("</div>", unsafe_allow_html=True)
     st.markdown('<div class="btn-secondary">', unsafe_allow_html=True)
     if st.button("Export Current View Excel"):
+        from modules.reports import export_excel_with_metadata
+
         meta = {
             "Session ID": st.session_state.session_id,
             "Export Type": "Inventory Lines View",
@@ -981,67 +1382,59 @@ def _lines_table(settings: dict, session: dict):
         delete_clicked = False
     if allow_edit and delete_clicked:
         blocked = 0
+        pending_deletes = []
+        pending_audits = []
         for line_id in delete_ids:
-            original = next((l for l in lines if l["line_id"] == line_id), None)
+            original = line_by_id.get(line_id)
             if original and original.get("locked") and not is_admin:
                 blocked += 1
                 continue
-            delete_line(line_id)
-            create_audit(
-                st.session_state.user,
-                "delete_line",
-                session_id=st.session_state.session_id,
-                line_id=line_id,
-                old_value=original,
+            pending_deletes.append(line_id)
+            pending_audits.append(
+                dict(
+                    username=st.session_state.user,
+                    action_type="delete_line",
+                    session_id=st.session_state.session_id,
+                    line_id=line_id,
+                    old_value=original,
+                )
             )
-        st.success("Deleted selected lines.")
-        if blocked:
-            st.warning(f"Skipped {blocked} locked line(s).")
+        notice = ("warning", f"Skipped {blocked} locked line(s)." if blocked else "")
+        if pending_deletes:
+            apply_line_changes(deletes=pending_deletes, audits=pending_audits)
+            _bump_lines_rev(session_id)
+            _rerun_with_messages(("success", "Deleted selected lines."), notice)
+        _show_messages(("info", "No lines selected for deletion."), notice)
 
 
 def _review_page(settings: dict):
-    # PERF: Lazy-load pandas only when needed
-    import pandas as pd
-
     st.header("Review & Reconcile")
     if not st.session_state.session_id:
         st.info("Create or select a session first.")
         return
-    session = get_session(st.session_state.session_id)
+    session = _get_session(st.session_state.session_id)
     if not session:
         st.error("Session not found.")
         return
     is_finalized = session.get("status") == "Finalized"
     is_admin = st.session_state.user == "admin"
-    lines = list_lines(st.session_state.session_id)
-    if not lines:
+    session_id = st.session_state.session_id
+    line_by_id = _line_index(session_id)
+    if not line_by_id:
         st.info("No lines to review.")
         return
-    df = pd.DataFrame(lines)
-    group_cols = ["gtin", "batch_lot", "expiry_date"]
-    summary = (
-        df.groupby(group_cols)
-        .agg(
-            trade_name=("trade_name", "first"),
-            scientific_name=("scientific_name", "first"),
-            strength=("strength", "first"),
-            dosage_form=("dosage_form", "first"),
-            unit_type=("unit_type", "first"),
-            package_size=("package_size", "first"),
-            total_count=("on_hand_count", "sum"),
-            count_unit=("count_unit", "first"),
-            sfda_code=("sfda_code", "first"),
-            status=("status", "first"),
-        )
-        .reset_index()
-    )
+    data_key = _lines_key(session_id)
+    df = _lines_df(*data_key)
+    # PERF: One pass over the status column feeds every status KPI
+    status_counts = df["status"].value_counts()
+    summary = _lines_summary(*data_key)
     kpi_cols = st.columns(4)
     kpi_cols[0].markdown(_render_kpi("Total Lines", str(len(df)), "info"), unsafe_allow_html=True)
     kpi_cols[1].markdown(_render_kpi("Unique Items", str(len(summary)), "info"), unsafe_allow_html=True)
-    kpi_cols[2].markdown(_render_kpi("Near Expiry", str((df["status"] == "Near Expiry").sum()), "warning"), unsafe_allow_html=True)
-    kpi_cols[3].markdown(_render_kpi("Expired", str((df["status"] == "Expired").sum()), "error"), unsafe_allow_html=True)
+    kpi_cols[2].markdown(_render_kpi("Near Expiry", str(int(status_counts.get("Near Expiry", 0))), "warning"), unsafe_allow_html=True)
+    kpi_cols[3].markdown(_render_kpi("Expired", str(int(status_counts.get("Expired", 0))), "error"), unsafe_allow_html=True)
     st.subheader("Aggregated View")
-    summary_view = _table_controls(summary, key="review_summary", default_sort="gtin")
+    summary_view = _table_controls(summary, key="review_summary", default_sort="gtin", data_key=data_key)
     st.markdown('<div class="card">', unsafe_allow_html=True)
     st.dataframe(summary_view, width="stretch")
     st.markdown("</div>", unsafe_allow_html=True)
@@ -1051,6 +1444,7 @@ def _review_page(settings: dict):
         df,
         key="review_detailed",
         default_sort="scan_timestamp",
+        data_key=data_key,
         status_options=sorted(df["status"].dropna().unique().tolist()) if "status" in df else None,
     )
     st.markdown('<div class="card">', unsafe_allow_html=True)
@@ -1058,12 +1452,13 @@ def _review_page(settings: dict):
     st.markdown("</div>", unsafe_allow_html=True)
 
     st.subheader("Warnings")
-    warnings = df[df["status"].isin(["Near Expiry", "Expired", "Unknown"])]
+    warnings = _warning_rows(df)
     warnings_view = _table_controls(
         warnings,
         key="review_warnings",
         default_sort="scan_timestamp",
-        status_options=["Near Expiry", "Expired", "Unknown"],
+        data_key=data_key,
+        status_options=list(_WARNING_STATUSES),
     )
     st.markdown('<div class="card">', unsafe_allow_html=True)
     st.dataframe(warnings_view, width="stretch")
@@ -1074,21 +1469,29 @@ def _review_page(settings: dict):
     col1, col2, col3, col4 = st.columns(4)
     st.markdown('<div class="btn-secondary">', unsafe_allow_html=True)
     if col1.button("Export Summary CSV"):
+        from modules.reports import export_csv
+
         path = export_csv(summary_view, f"summary_view_{st.session_state.session_id}.csv")
         st.success(f"Saved: {path}")
     st.markdown("</div>", unsafe_allow_html=True)
     st.markdown('<div class="btn-secondary">', unsafe_allow_html=True)
     if col2.button("Export Detailed CSV"):
+        from modules.reports import export_csv
+
         path = export_csv(detailed_view, f"detailed_view_{st.session_state.session_id}.csv")
         st.success(f"Saved: {path}")
     st.markdown("</div>", unsafe_allow_html=True)
     st.markdown('<div class="btn-secondary">', unsafe_allow_html=True)
     if col3.button("Export Warnings CSV"):
+        from modules.reports import export_csv
+
         path = export_csv(warnings_view, f"warnings_view_{st.session_state.session_id}.csv")
         st.success(f"Saved: {path}")
     st.markdown("</div>", unsafe_allow_html=True)
     st.markdown('<div class="btn-secondary">', unsafe_allow_html=True)
     if col4.button("Export Summary Excel"):
+        from modules.reports import export_excel_with_metadata
+
         meta = {
             "Session ID": st.session_state.session_id,
             "Export Type": "Review Summary View",
@@ -1101,6 +1504,8 @@ def _review_page(settings: dict):
     col5, col6 = st.columns(2)
     st.markdown('<div class="btn-secondary">', unsafe_allow_html=True)
     if col5.button("Export Detailed Excel"):
+        from modules.reports import export_excel_with_metadata
+
         meta = {
             "Session ID": st.session_state.session_id,
             "Export Type": "Review Detailed View",
@@ -1112,6 +1517,8 @@ def _review_page(settings: dict):
     st.markdown("</div>", unsafe_allow_html=True)
     st.markdown('<div class="btn-secondary">', unsafe_allow_html=True)
     if col6.button("Export Warnings Excel"):
+        from modules.reports import export_excel_with_metadata
+
         meta = {
             "Session ID": st.session_state.session_id,
             "Export Type": "Review Warnings View",
@@ -1124,16 +1531,22 @@ def _review_page(settings: dict):
     col7, col8, col9 = st.columns(3)
     st.markdown('<div class="btn-secondary">', unsafe_allow_html=True)
     if col7.button("Export Summary PDF"):
+        from modules.reports import export_pdf
+
         path = export_pdf("Review Summary", summary_view, f"summary_view_{st.session_state.session_id}.pdf")
         st.success(f"Saved: {path}")
     st.markdown("</div>", unsafe_allow_html=True)
     st.markdown('<div class="btn-secondary">', unsafe_allow_html=True)
     if col8.button("Export Detailed PDF"):
+        from modules.reports import export_pdf
+
         path = export_pdf("Review Detailed", detailed_view, f"detailed_view_{st.session_state.session_id}.pdf")
         st.success(f"Saved: {path}")
     st.markdown("</div>", unsafe_allow_html=True)
     st.markdown('<div class="btn-secondary">', unsafe_allow_html=True)
     if col9.button("Export Warnings PDF"):
+        from modules.reports import export_pdf
+
         path = export_pdf("Review Warnings", warnings_view, f"warnings_view_{st.session_state.session_id}.pdf")
         st.success(f"Saved: {path}")
     st.markdown("</div>", unsafe_allow_html=True)
@@ -1148,21 +1561,27 @@ def _review_page(settings: dict):
             col1, col2, col3 = st.columns(3)
             bulk_status = col1.selectbox(
                 "Set Status",
-                ["--", "Valid", "Near Expiry", "Expired", "Unknown"],
+                ["--", _AUTO_STATUS, *_STATUS_ORDER],
                 index=0,
+                help=f"A status set here is kept as-is; {_AUTO_STATUS} derives it from the expiry date again.",
             )
             bulk_notes = col2.text_input("Append Note")
             bulk_lock = col3.selectbox("Lock Lines", ["--", "Lock", "Unlock"], index=0)
 
             st.markdown('<div class="btn-primary">', unsafe_allow_html=True)
             if st.button("Apply Bulk Edit"):
+                pending_updates = {}
+                pending_audits = []
                 for line_id in bulk_ids:
-                    original = next((l for l in lines if l["line_id"] == line_id), None)
+                    original = line_by_id.get(line_id)
                     if not original:
                         continue
                     updates = {}
-                    if bulk_status != "--":
+                    if bulk_status == _AUTO_STATUS:
+                        updates["status_override"] = False
+                    elif bulk_status != "--":
                         updates["status"] = bulk_status
+                        updates["status_override"] = True
                     if bulk_notes:
                         existing = original.get("notes") or ""
                         updates["notes"] = (existing + " " + bulk_notes).strip()
@@ -1174,16 +1593,23 @@ def _review_page(settings: dict):
                             continue
                         updates["locked"] = False
                     if updates:
-                        update_line(line_id, updates)
-                        create_audit(
-                            st.session_state.user,
-                            "bulk_edit_line",
-                            session_id=st.session_state.session_id,
-                            line_id=line_id,
-                            old_value=original,
-                            new_value=updates,
+                        pending_updates[line_id] = updates
+                        pending_audits.append(
+                            dict(
+                                username=st.session_state.user,
+                                action_type="bulk_edit_line",
+                                session_id=st.session_state.session_id,
+                                line_id=line_id,
+                                old_value=original,
+                                new_value=updates,
+                            )
                         )
-                st.success("Bulk edit applied.")
+                if pending_updates:
+                    apply_line_changes(updates=pending_updates, audits=pending_audits)
+                    _bump_lines_rev()
+                    st.success("Bulk edit applied.")
+                else:
+                    st.info("No bulk changes selected.")
             st.markdown("</div>", unsafe_allow_html=True)
 
     st.subheader("Session Notes")
@@ -1194,7 +1620,7 @@ def _review_page(settings: dict):
         disabled=is_finalized and not is_admin,
     )
     if st.button("Save Session Notes", disabled=is_finalized and not is_admin):
-        update_session(st.session_state.session_id, {"notes": session_notes})
+        _update_session(st.session_state.session_id, {"notes": session_notes})
         create_audit(
             st.session_state.user,
             "update_session_notes",
@@ -1207,47 +1633,81 @@ def _review_page(settings: dict):
         st.info("Session is finalized. Notes are read-only for non-admin users.")
 
     st.subheader("Lock Lines (Optional)")
-    line_map = {f"{l['line_id']} | {l.get('gtin','') or ''}": l for l in lines}
+    line_map = _line_lookup(session_id)[1]
     selection = st.multiselect("Select lines", list(line_map.keys()))
     if selection:
-        lock_ids = [line_map[s]["line_id"] for s in selection]
+        lock_ids = [line_map[s] for s in selection]
         cols = st.columns(2)
         if cols[0].button("Lock Selected", disabled=is_finalized and not is_admin):
-            for line_id in lock_ids:
-                update_line(line_id, {"locked": True})
-                create_audit(
-                    st.session_state.user,
-                    "lock_line",
-                    session_id=st.session_state.session_id,
-                    line_id=line_id,
-                    new_value={"locked": True},
-                )
+            apply_line_changes(
+                updates={line_id: {"locked": True} for line_id in lock_ids},
+                audits=[
+                    dict(
+                        username=st.session_state.user,
+                        action_type="lock_line",
+                        session_id=st.session_state.session_id,
+                        line_id=line_id,
+                        new_value={"locked": True},
+                    )
+                    for line_id in lock_ids
+                ],
+            )
+            _bump_lines_rev()
             st.success("Lines locked.")
         if cols[1].button("Unlock Selected"):
             if not is_admin:
                 st.error("Only admin can unlock lines.")
             else:
-                for line_id in lock_ids:
-                    update_line(line_id, {"locked": False})
-                    create_audit(
-                        st.session_state.user,
-                        "unlock_line",
-                        session_id=st.session_state.session_id,
-                        line_id=line_id,
-                        new_value={"locked": False},
-                    )
+                apply_line_changes(
+                    updates={line_id: {"locked": False} for line_id in lock_ids},
+                    audits=[
+                        dict(
+                            username=st.session_state.user,
+                            action_type="unlock_line",
+                            session_id=st.session_state.session_id,
+                            line_id=line_id,
+                            new_value={"locked": False},
+                        )
+                        for line_id in lock_ids
+                    ],
+                )
+                _bump_lines_rev()
                 st.success("Lines unlocked.")
 
 
-def _finalize_page():
-    # PERF: Lazy-load pandas only when needed
-    import pandas as pd
+def _report_metadata(session: dict) -> Dict[str, str]:
+    return {
+        "Session ID": session.get("session_id", ""),
+        "Session Name": session.get("session_name", ""),
+        "Location": session.get("location", ""),
+        "Counter Name": session.get("counter_name", ""),
+        "Generated At": _now_local(),
+        "Generated By": st.session_state.user,
+        "Status": session.get("status", ""),
+    }
+
 
+# PERF: Only the PDF export needs these; built on click and shared across clicks per revision
+@st.cache_data(show_spinner=False)
+def _report_kpis(session_id: str, rev: int, near_months: int, today: date) -> Dict[str, str]:
+    df = _lines_df(session_id, rev, near_months, today)
+    status_counts = df["status"].value_counts()
+    return {
+        "Total Unique Items": str(len(_lines_summary(session_id, rev, near_months, today))),
+        "Total Lines": str(len(df)),
+        "Total Quantity": str(float(df["on_hand_count"].sum())) if not df.empty else "0",
+        "Near Expiry Count": str(int(status_counts.get("Near Expiry", 0))),
+        "Expired Count": str(int(status_counts.get("Expired", 0))),
+        "Unknown GTIN Count": str(int(status_counts.get("Unknown", 0))),
+    }
+
+
+def _finalize_page():
     st.header("Finalize & Reports")
     if not st.session_state.session_id:
         st.info("Create or select a session first.")
         return
-    session = get_session(st.session_state.session_id)
+    session = _get_session(st.session_state.session_id)
     if not session:
         st.error("Session not found.")
         return
@@ -1255,114 +1715,153 @@ def _finalize_page():
     if session.get("status") != "Finalized":
         st.markdown('<div class="btn-danger">', unsafe_allow_html=True)
         if st.button("Finalize / Lock Session"):
-            update_session(st.session_state.session_id, {"status": "Finalized"})
+            _update_session(st.session_state.session_id, {"status": "Finalized"})
             create_audit(st.session_state.user, "finalize_session", session_id=st.session_state.session_id)
             st.success("Session finalized.")
             st.rerun()
         st.markdown("</div>", unsafe_allow_html=True)
 
-    lines = list_lines(st.session_state.session_id)
-    if not lines:
+    session_id = st.session_state.session_id
+    if not _line_index(session_id):
         st.info("No lines to report.")
         return
-    df = pd.DataFrame(lines)
-    group_cols = ["gtin", "batch_lot", "expiry_date"]
-    summary = (
-        df.groupby(group_cols)
-        .agg(
-            trade_name=("trade_name", "first"),
-            scientific_name=("scientific_name", "first"),
-            strength=("strength", "first"),
-            dosage_form=("dosage_form", "first"),
-            unit_type=("unit_type", "first"),
-            package_size=("package_size", "first"),
-            total_count=("on_hand_count", "sum"),
-            count_unit=("count_unit", "first"),
-            sfda_code=("sfda_code", "first"),
-            status=("status", "first"),
-        )
-        .reset_index()
-    )
+    data_key = _lines_key(session_id)
+    df = _lines_df(*data_key)
+    # PERF: One pass over the status column feeds every status KPI
+    status_counts = df["status"].value_counts()
+    summary = _lines_summary(*data_key)
 
-    warnings = df[df["status"].isin(["Near Expiry", "Expired", "Unknown"])]
+    warnings = _warning_rows(df)
     kpi_cols = st.columns(4)
     kpi_cols[0].markdown(_render_kpi("Total Lines", str(len(df)), "info"), unsafe_allow_html=True)
     kpi_cols[1].markdown(_render_kpi("Unique Items", str(len(summary)), "info"), unsafe_allow_html=True)
     kpi_cols[2].markdown(_render_kpi("Warnings", str(len(warnings)), "warning"), unsafe_allow_html=True)
-    kpi_cols[3].markdown(_render_kpi("Unknown GTIN", str((df["status"] == "Unknown").sum()), "info"), unsafe_allow_html=True)
+    kpi_cols[3].markdown(_render_kpi("Unknown GTIN", str(int(status_counts.get("Unknown", 0))), "info"), unsafe_allow_html=True)
 
     st.subheader("Warnings")
     warnings_view = _table_controls(
         warnings,
         key="finalize_warnings",
         default_sort="scan_timestamp",
-        status_options=["Near Expiry", "Expired", "Unknown"],
+        data_key=data_key,
+        status_options=list(_WARNING_STATUSES),
     )
     st.markdown('<div class="card">', unsafe_allow_html=True)
     st.dataframe(warnings_view, width="stretch")
     st.markdown("</div>", unsafe_allow_html=True)
 
     st.subheader("Exports")
-    detailed_df = df.copy()
-    summary_df = summary.copy()
-    warnings_df = warnings.copy()
-    metadata = {
-        "Session ID": session.get("session_id", ""),
-        "Session Name": session.get("session_name", ""),
-        "Location": session.get("location", ""),
-        "Counter Name": session.get("counter_name", ""),
-        "Generated At": _now_local(),
-        "Generated By": st.session_state.user,
-        "Status": session.get("status", ""),
-    }
-    kpis = {
-        "Total Unique Items": str(len(summary_df)),
-        "Total Lines": str(len(detailed_df)),
-        "Total Quantity": str(float(detailed_df["on_hand_count"].sum())) if not detailed_df.empty else "0",
-        "Near Expiry Count": str((detailed_df["status"] == "Near Expiry").sum()) if "status" in detailed_df else "0",
-        "Expired Count": str((detailed_df["status"] == "Expired").sum()) if "status" in detailed_df else "0",
-        "Unknown GTIN Count": str((detailed_df["status"] == "Unknown").sum()) if "status" in detailed_df else "0",
-    }
-
     st.markdown('<div class="card">', unsafe_allow_html=True)
     st.markdown('<div class="section-title">Export Options</div>', unsafe_allow_html=True)
-    st.markdown('<div class="export-toolbar">', unsafe_allow_html=True)
-    col1, col2, col3, col4 = st.columns(4)
-    st.markdown('<div class="btn-secondary">', unsafe_allow_html=True)
-    if col1.button("Export CSV"):
-        path = export_csv(detailed_df, f"detailed_{st.session_state.session_id}.csv")
-        st.success(f"Saved: {path}")
-    st.markdown("</div>", unsafe_allow_html=True)
-    st.markdown('<div class="btn-secondary">', unsafe_allow_html=True)
-    if col2.button("Export Excel"):
-        path = export_excel_with_metadata(
-            detailed_df,
-            summary_df,
-            warnings_df,
-            metadata,
-            f"report_{st.session_state.session_id}.xlsx",
-        )
-        st.success(f"Saved: {path}")
-    st.markdown("</div>", unsafe_allow_html=True)
-    st.markdown('<div class="btn-secondary">', unsafe_allow_html=True)
-    if col3.button("Export PDF (Detailed)"):
-        path = export_pdf_report(
-            "Inventory Stock Count Report",
-            detailed_df,
-            summary_df,
-            warnings_df,
-            metadata,
-            kpis,
-            f"report_{st.session_state.session_id}.pdf",
-        )
-        st.success(f"Saved: {path}")
-    st.markdown("</div>", unsafe_allow_html=True)
-    st.markdown('<div class="btn-secondary">', unsafe_allow_html=True)
-    if col4.button("Export PDF (Summary)"):
-        path = export_pdf("Inventory Summary Report", summary_df, f"summary_{st.session_state.session_id}.pdf")
+    # PERF: One form and one dispatch instead of four buttons; nothing reruns until Export is pressed
+    with st.form("finalize_exports", border=False):
+        col_format, col_submit = st.columns([3, 1])
+        export_format = col_format.selectbox("Format", list(_FINALIZE_EXPORTS))
+        with _css_wrap("btn-secondary"):
+            submitted = col_submit.form_submit_button("Export")
+    if submitted:
+        from pathlib import Path
+
+        key = (export_format, data_key, session.get("status", ""), st.session_state.user)
+        path = _finalize_export_cached(session, key)
+        # The cached file is reused only while it is still on disk
+        if not Path(path).exists():
+            _finalize_export_cached.clear()
+            path = _finalize_export_cached(session, key)
         st.success(f"Saved: {path}")
     st.markdown("</div>", unsafe_allow_html=True)
-    st.markdown("</div>", unsafe_allow_html=True)
+
+
+# Exporters only read the cached frames, so they are passed through without defensive copies
+def _export_detailed_csv(session: dict, data_key: tuple, tag: str):
+    from modules.reports import export_csv_stream
+
+    session_id, near_months = data_key[0], data_key[2]
+    return export_csv_stream(
+        (
+            {
+                **line,
+                "status": current_status(
+                    line.get("status"), line.get("expiry_date") or "", near_months, bool(line.get("status_override"))
+                ),
+            }
+            for line in list_lines_iter(session_id)
+        ),
+        list(_lines_df(*data_key).columns),
+        f"detailed_{session_id}_{tag}.csv",
+    )
+
+
+def _export_report_excel(session: dict, data_key: tuple, tag: str):
+    from modules.reports import export_excel_with_metadata
+
+    df = _lines_df(*data_key)
+    return export_excel_with_metadata(
+        df,
+        _lines_summary(*data_key),
+        _warning_rows(df),
+        _report_metadata(session),
+        f"report_{data_key[0]}_{tag}.xlsx",
+    )
+
+
+def _export_report_pdf(session: dict, data_key: tuple, tag: str):
+    from modules.reports import export_pdf_report
+
+    df = _lines_df(*data_key)
+    return export_pdf_report(
+        "Inventory Stock Count Report",
+        df,
+        _lines_summary(*data_key),
+        _warning_rows(df),
+        _report_metadata(session),
+        _report_kpis(*data_key),
+        f"report_{data_key[0]}_{tag}.pdf",
+    )
+
+
+def _export_summary_pdf(session: dict, data_key: tuple, tag: str):
+    from modules.reports import export_pdf
+
+    return export_pdf("Inventory Summary Report", _lines_summary(*data_key), f"summary_{data_key[0]}_{tag}.pdf")
+
+
+_FINALIZE_EXPORTS = {
+    "CSV": _export_detailed_csv,
+    "Excel": _export_report_excel,
+    "PDF (Detailed)": _export_report_pdf,
+    "PDF (Summary)": _export_summary_pdf,
+}
+
+
+# PERF: The lines revision in the key pins the report contents, so exporting the same format
+# again for unchanged data returns the file already written instead of rebuilding it.
+# Session status and user are keyed too because they appear in the report metadata.
+# The file name carries a hash of the key so no other entry can overwrite a cached file.
+@st.cache_data(show_spinner=False, max_entries=16)
+def _finalize_export_cached(_session: dict, key: tuple) -> str:
+    import hashlib
+
+    export_format, data_key = key[0], key[1]
+    tag = hashlib.md5(repr(key).encode("utf-8")).hexdigest()[:12]
+    return str(_FINALIZE_EXPORTS[export_format](_session, data_key, tag))
+
+
+# PERF: The audit query and frame build are cached. Local writes move one of the revisions
+# in the key; the TTL picks up records written from other browsers.
+@st.cache_data(show_spinner=False, ttl=30)
+def _audit_df(session_id: Optional[str], lines_rev: int, session_rev: int, sessions_rev: int):
+    # PERF: Lazy-load pandas only when needed
+    import pandas as pd
+
+    # PERF: The audit schema is fixed, so columns are not discovered by scanning every record's keys
+    df = pd.DataFrame.from_records(list_audit(session_id), columns=AUDIT_COLUMNS)
+    # PERF: Nested dict payloads become JSON text so the Arrow conversion behind st.dataframe
+    # takes the plain string path instead of falling back on mixed-object columns
+    for col in ("old_value", "new_value"):
+        if col in df:
+            df[col] = df[col].map(lambda v: json.dumps(v, default=str) if isinstance(v, (dict, list)) else v)
+    return df
 
 
 def _audit_page():
@@ -1370,11 +1869,18 @@ def _audit_page():
     import pandas as pd
 
     st.header("Audit & Logs")
-    records = list_audit(st.session_state.session_id)
-    if not records:
+    session_id = st.session_state.session_id
+    if st.button("Refresh Audit Log"):
+        _audit_df.clear()
+    df = _audit_df(
+        session_id,
+        _lines_rev(session_id) if session_id else 0,
+        _rev("session", session_id) if session_id else 0,
+        _rev("sessions"),
+    )
+    if df.empty:
         st.info("No audit logs yet.")
         return
-    df = pd.DataFrame(records)
     st.markdown('<div class="card">', unsafe_allow_html=True)
     st.markdown('<div class="section-title">Audit Records</div>', unsafe_allow_html=True)
     audit_view = _table_controls(df, key="audit", default_sort="timestamp")
@@ -1383,11 +1889,15 @@ def _audit_page():
     col1, col2 = st.columns(2)
     st.markdown('<div class="btn-secondary">', unsafe_allow_html=True)
     if col1.button("Export Audit CSV"):
+        from modules.reports import export_csv
+
         path = export_csv(audit_view, f"audit_{st.session_state.session_id or 'all'}.csv")
         st.success(f"Saved: {path}")
     st.markdown("</div>", unsafe_allow_html=True)
     st.markdown('<div class="btn-secondary">', unsafe_allow_html=True)
     if col2.button("Export Audit Excel"):
+        from modules.reports import export_excel_with_metadata
+
         meta = {
             "Session ID": st.session_state.session_id or "all",
             "Export Type": "Audit View",
@@ -1400,13 +1910,12 @@ def _audit_page():
     st.markdown("</div>", unsafe_allow_html=True)
 
 
-def _settings_page():
+def _settings_page(settings: dict):
     st.header("Settings")
     if st.session_state.user != "admin":
         st.error("Admin only.")
         return
 
-    settings = load_settings()
     current_backend = settings.get("persistence_backend", "MongoDB")
     with st.form("settings_form"):
         near_expiry_months = st.number_input("Near Expiry threshold (months)", min_value=1, step=1, value=int(settings["near_expiry_months"]))
@@ -1470,6 +1979,7 @@ def _session_setup_page():
             }
         )
         st.session_state.session_id = session_id
+        _bump_rev("sessions")
         create_audit(st.session_state.user, "create_session", session_id=session_id)
         st.success("Session created.")
         st.rerun()
@@ -1477,18 +1987,15 @@ def _session_setup_page():
 
 def main():
     _ensure_session_state()
+    _ensure_db()
     settings = load_settings()
+    st.session_state.settings = settings
     _inject_global_styles()
     _apply_display_mode(settings)
 
     if not _require_login():
         return
 
-    # PERF FIX: Initialize database only after successful login (saves 7s on login page!)
-    if 'db_initialized' not in st.session_state:
-        init_db()
-        st.session_state.db_initialized = True
-
     st.sidebar.title("Navigation")
     _select_or_restore_session()
 
@@ -1505,10 +2012,14 @@ def main():
     )
 
     if st.session_state.session_id:
-        session = get_session(st.session_state.session_id)
+        session = _get_session(st.session_state.session_id)
         if session:
             _session_header(session)
 
+    if page != "Scan & Count":
+        # The scan input is rebuilt on return, so it needs focusing again
+        st.session_state.scan_focused = False
+
     if page == "Session Setup":
         _session_setup_page()
     elif page == "Scan & Count":
@@ -1520,7 +2031,7 @@ def main():
     elif page == "Audit & Logs":
         _audit_page()
     elif page == "Settings":
-        _settings_page()
+        _settings_page(settings)
 
 
 if __name__ == "__main__":
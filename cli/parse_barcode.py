@@ -4,9 +4,11 @@ Simple CLI for parsing GS1 barcodes without separators.
 
 Usage:
     python parse_barcode.py "01062867400002491728043010GB2C2171490437969853"
+    python parse_barcode.py --batch barcodes.txt    (use - to read stdin)
 
 Output:
     Clean JSON with human-readable field names
+    (batch mode: one compact JSON object per input line)
 """
 
 import sys
@@ -16,7 +18,32 @@ from pathlib import Path
 # Add parent directory to path to import gs1_parser
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from gs1_parser import parse_gs1_to_json
+from gs1_parser import parse_gs1_to_dict, parse_gs1_to_json
+from gs1_parser.formatters import NO_FIELDS_ERROR, write_json_line
+
+
+def run_batch(source: str) -> int:
+    """Parse one barcode per line, writing one JSON object per line."""
+    handle = sys.stdin if source == "-" else open(source, "r", encoding="utf-8")
+    failed = False
+    try:
+        for line in handle:
+            barcode_data = line.strip()
+            if not barcode_data:
+                continue
+            try:
+                output = parse_gs1_to_dict(barcode_data)
+                if not output:
+                    raise ValueError(NO_FIELDS_ERROR)
+            except Exception as e:
+                output = {"error": str(e), "input": barcode_data}
+                failed = True
+            write_json_line(output)
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+    sys.stdout.flush()
+    return 1 if failed else 0
 
 
 def main():
@@ -25,8 +52,16 @@ def main():
         print("Usage: python parse_barcode.py <barcode_data>")
         print("\nExample:")
         print('  python parse_barcode.py "01062867400002491728043010GB2C2171490437969853"')
+        print("  python parse_barcode.py --batch barcodes.txt")
         sys.exit(1)
 
+    # PERF: One process (imports + AI dictionary load) for a whole file of barcodes
+    if sys.argv[1] == "--batch":
+        if len(sys.argv) < 3:
+            print("Usage: python parse_barcode.py --batch <file|->")
+            sys.exit(1)
+        sys.exit(run_batch(sys.argv[2]))
+
     barcode_data = sys.argv[1]
 
     try:
@@ -3,8 +3,10 @@ CLI interface for GS1 Parser.
 
 Usage:
     python -m gs1_parser "<barcode text>" [options]
+    python -m gs1_parser --batch FILE [options]   (FILE may be - for stdin)
     
 Options:
+    --batch FILE          Parse one barcode per line in a single process
     --show-alternatives    Show alternative parse results
     --strict              Fail on validation errors
     --json                Output as JSON
@@ -17,8 +19,9 @@ import sys
 from pathlib import Path
 from typing import Optional
 
-from .parser import parse_gs1, ParseOptions, ParseResult
+from .core.parser import parse_gs1, ParseOptions, ParseResult
 from .lookup import lookup_gtin
+from .formatters.json_formatter import NO_FIELDS_ERROR, write_json_line
 
 
 def format_element(element: dict, indent: int = 2) -> str:
@@ -133,17 +136,76 @@ def build_simple_json(result: ParseResult) -> dict:
                 if len(iso) == 10 and iso[4] == "-" and iso[7] == "-":
                     value = f"{iso[8:10]}/{iso[5:7]}/{iso[0:4]}"
             elif len(element.raw_value) == 6 and element.raw_value.isdigit():
-                yy = int(element.raw_value[0:2])
-                mm = int(element.raw_value[2:4])
-                dd = int(element.raw_value[4:6])
-                year = 1900 + yy if yy >= 51 else 2000 + yy
-                value = f"{dd:02d}/{mm:02d}/{year:04d}"
+                # YYMMDD -> DD/MM/YYYY by slicing; two-digit strings compare like their ints
+                raw = element.raw_value
+                century = "19" if raw[0:2] >= "51" else "20"
+                value = f"{raw[4:6]}/{raw[2:4]}/{century}{raw[0:2]}"
         if key in output:
             raise ValueError(f"Duplicate AI field in output: {key}")
         output[key] = value
     return output
 
 
+def build_json_output(result: ParseResult, lookup: bool = False, db_path: Optional[Path] = None) -> dict:
+    """Build the JSON output dict, optionally merged with the GTIN lookup record."""
+    output = build_simple_json(result)
+
+    if lookup:
+        gtin_value = output.get("GTIN") or output.get("GTIN Code")
+
+        if not gtin_value:
+            output["_lookup_error"] = "GTIN not found in parsed result"
+        else:
+            record = lookup_gtin(gtin_value, db_path=db_path)
+            if record:
+                for k, v in record.items():
+                    if k == "GTIN Code":
+                        continue
+                    output[k] = v
+            else:
+                output["_lookup_error"] = f"GTIN not found in database: {gtin_value}"
+
+    return output
+
+
+def run_batch(source: str, options: ParseOptions, args: argparse.Namespace) -> int:
+    """Parse one barcode per line; with --json, emit one compact JSON object per line."""
+    db_path = Path(args.lookup_db) if args.lookup_db else None
+    handle = sys.stdin if source == "-" else open(source, "r", encoding="utf-8")
+    all_confident = True
+    try:
+        for line in handle:
+            barcode = line.strip()
+            if not barcode:
+                continue
+            # One bad line yields an error record instead of aborting the rest of the batch
+            try:
+                result = parse_gs1(barcode, options=options)
+                if args.json:
+                    output = build_json_output(result, lookup=args.lookup, db_path=db_path)
+                    if not output:
+                        raise ValueError(NO_FIELDS_ERROR)
+                else:
+                    output = format_result(result, show_alternatives=args.show_alternatives)
+            except Exception as e:
+                all_confident = False
+                if args.json:
+                    write_json_line({"error": str(e), "input": barcode})
+                else:
+                    sys.stdout.write(f"Error: {e} (input: {barcode})\n")
+                continue
+            all_confident = all_confident and result.confidence > 0.5
+            if args.json:
+                write_json_line(output)
+            else:
+                sys.stdout.write(output + "\n")
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+    sys.stdout.flush()
+    return 0 if all_confident else 1
+
+
 def main(argv: Optional[list] = None) -> int:
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -153,8 +215,15 @@ def main(argv: Optional[list] = None) -> int:
     
     parser.add_argument(
         'barcode',
+        nargs='?',
         help='Barcode data to parse'
     )
+
+    parser.add_argument(
+        '--batch',
+        metavar='FILE',
+        help='Parse one barcode per line from FILE (- for stdin) in a single process'
+    )
     
     parser.add_argument(
         '--show-alternatives',
@@ -200,6 +269,8 @@ def main(argv: Optional[list] = None) -> int:
     )
     
     args = parser.parse_args(argv)
+    if args.barcode is None and args.batch is None:
+        parser.error('a barcode or --batch FILE is required')
     
     # Configure options
     options = ParseOptions(
@@ -208,29 +279,17 @@ def main(argv: Optional[list] = None) -> int:
         max_alternatives=args.max_alternatives,
     )
     
+    # PERF: Batch mode pays interpreter start-up and dictionary load once for many barcodes
+    if args.batch is not None:
+        return run_batch(args.batch, options, args)
+
     # Parse input
     result = parse_gs1(args.barcode, options=options)
     
     # Output result
     if args.json:
-        output = build_simple_json(result)
-
-        if args.lookup:
-            gtin_value = output.get("GTIN") or output.get("GTIN Code")
-            db_path = Path(args.lookup_db) if args.lookup_db else None
-
-            if not gtin_value:
-                output["_lookup_error"] = "GTIN not found in parsed result"
-            else:
-                record = lookup_gtin(gtin_value, db_path=db_path)
-                if record:
-                    for k, v in record.items():
-                        if k == "GTIN Code":
-                            continue
-                        output[k] = v
-                else:
-                    output["_lookup_error"] = f"GTIN not found in database: {gtin_value}"
-
+        db_path = Path(args.lookup_db) if args.lookup_db else None
+        output = build_json_output(result, lookup=args.lookup, db_path=db_path)
         print(json.dumps(output, indent=2, ensure_ascii=False))
     else:
         print(format_result(result, show_alternatives=args.show_alternatives))
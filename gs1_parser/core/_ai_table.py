@@ -0,0 +1,757 @@
+"""
+Pregenerated GS1 AI table.
+
+Generated by scripts/generate_ai_table.py from RAW_AI_DICTIONARY - do not edit.
+Row layout: ai_dictionary_loader.AI_TABLE_FIELDS.
+"""
+
+SOURCE_DIGEST = '0a6037ad7b065e5abc6069464d647e98d4630727'
+
+AI_TABLE = (
+    ('00', 'SSCC', 18, 18, 18, 'N', False, '^\\d{18}$', True, None, None, (), (), (('N', 18, 18, ('csum', 'gcppos2')),), True),
+    ('01', 'GTIN', 14, 14, 14, 'N', False, '^\\d{14}$', True, None, None, (), ('255', '37'), (('N', 14, 14, ('csum', 'gcppos2')),), True),
+    ('02', 'CONTENT', 14, 14, 14, 'N', False, '^\\d{14}$', True, None, None, ('37',), ('01', '03'), (('N', 14, 14, ('csum', 'gcppos2')),), False),
+    ('10', 'BATCH/LOT', None, 20, 1, 'X', True, '^[!-z]{1,20}$', False, None, None, ('01', '02', '03', '8006', '8026'), (), (('X', 1, 20, ()),), False),
+    ('11', 'PROD DATE', 6, 6, 6, 'N', False, '^\\d{6}$', False, None, 'YYMMD0', ('01', '02', '03', '8006', '8026'), (), (('N', 6, 6, ('yymmd0',)),), False),
+    ('12', 'DUE DATE', 6, 6, 6, 'N', False, '^\\d{6}$', False, None, 'YYMMD0', ('8020',), (), (('N', 6, 6, ('yymmd0',)),), False),
+    ('13', 'PACK DATE', 6, 6, 6, 'N', False, '^\\d{6}$', False, None, 'YYMMD0', ('01', '02', '03', '8006', '8026'), (), (('N', 6, 6, ('yymmd0',)),), False),
+    ('15', 'BEST BEFORE or BEST BY', 6, 6, 6, 'N', False, '^\\d{6}$', False, None, 'YYMMD0', ('01', '02', '03', '8006', '8026'), (), (('N', 6, 6, ('yymmd0',)),), False),
+    ('16', 'SELL BY', 6, 6, 6, 'N', False, '^\\d{6}$', False, None, 'YYMMD0', ('01', '02', '03', '8006', '8026'), (), (('N', 6, 6, ('yymmd0',)),), False),
+    ('17', 'USE BY or EXPIRY', 6, 6, 6, 'N', False, '^\\d{6}$', False, None, 'YYMMD0', ('01', '02', '03', '8006', '8026'), (), (('N', 6, 6, ('yymmd0',)),), False),
+    ('20', 'VARIANT', 2, 2, 2, 'N', False, '^\\d{2}$', False, None, None, ('01', '02'), (), (('N', 2, 2, ()),), False),
+    ('21', 'SERIAL', None, 20, 1, 'X', True, '^[!-z]{1,20}$', False, None, None, ('01', '8006'), (), (('X', 1, 20, ()),), False),
+    ('22', 'CPV', None, 20, 1, 'X', True, '^[!-z]{1,20}$', False, None, None, ('01',), (), (('X', 1, 20, ()),), False),
+    ('235', 'TPX', None, 28, 1, 'X', True, '^[!-z]{1,28}$', False, None, None, ('01',), ('21',), (('X', 1, 28, ()),), False),
+    ('240', 'ADDITIONAL ID', None, 30, 1, 'X', True, '^[!-z]{1,30}$', False, None, None, ('01', '02'), (), (('X', 1, 30, ()),), False),
+    ('241', 'CUST. PART No.', None, 30, 1, 'X', True, '^[!-z]{1,30}$', False, None, None, ('01', '02'), (), (('X', 1, 30, ()),), False),
+    ('242', 'MTO VARIANT', None, 6, 1, 'N', True, '^\\d{1,6}$', False, None, None, ('01',), (), (('N', 1, 6, ()),), False),
+    ('243', 'PCN', None, 20, 1, 'X', True, '^[!-z]{1,20}$', False, None, None, ('01',), (), (('X', 1, 20, ()),), False),
+    ('250', 'SECONDARY SERIAL', None, 30, 1, 'X', True, '^[!-z]{1,30}$', False, None, None, ('01',), (), (('X', 1, 30, ()),), False),
+    ('251', 'REF. TO SOURCE', None, 30, 1, 'X', True, '^[!-z]{1,30}$', False, None, None, ('01',), (), (('X', 1, 30, ()),), False),
+    ('253', 'GDTI', None, 13, 13, 'N', True, '^\\d{13,13}$', True, None, None, (), (), (('N', 13, 13, ('csum', 'key')),), True),
+    ('254', 'GLN EXTENSION COMPONENT', None, 20, 1, 'X', True, '^[!-z]{1,20}$', False, None, None, ('414', '417'), (), (('X', 1, 20, ()),), False),
+    ('255', 'GCN', None, 13, 13, 'N', True, '^\\d{13,13}$', True, None, None, (), ('01', '02'), (('N', 13, 13, ('csum', 'key')),), True),
+    ('30', 'VAR. COUNT', None, 8, 1, 'N', True, '^\\d{1,8}$', False, None, None, ('01', '02'), (), (('N', 1, 8, ()),), False),
+    ('3100', 'NET WEIGHT (kg)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('01', '02'), ('320n',), (('N', 6, 6, ()),), False),
+    ('3101', 'NET WEIGHT (kg)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('01', '02'), ('320n',), (('N', 6, 6, ()),), False),
+    ('3102', 'NET WEIGHT (kg)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('01', '02'), ('320n',), (('N', 6, 6, ()),), False),
+    ('3103', 'NET WEIGHT (kg)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('01', '02'), ('320n',), (('N', 6, 6, ()),), False),
+    ('3104', 'NET WEIGHT (kg)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('01', '02'), ('320n',), (('N', 6, 6, ()),), False),
+    ('3105', 'NET WEIGHT (kg)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('01', '02'), ('320n',), (('N', 6, 6, ()),), False),
+    ('3106', 'NET WEIGHT (kg)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('01', '02'), ('320n',), (('N', 6, 6, ()),), False),
+    ('3107', 'NET WEIGHT (kg)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('01', '02'), ('320n',), (('N', 6, 6, ()),), False),
+    ('3108', 'NET WEIGHT (kg)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('01', '02'), ('320n',), (('N', 6, 6, ()),), False),
+    ('3109', 'NET WEIGHT (kg)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('01', '02'), ('320n',), (('N', 6, 6, ()),), False),
+    ('3110', 'LENGTH (m)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('01', '02'), ('321n',), (('N', 6, 6, ()),), False),
+    ('3111', 'LENGTH (m)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('01', '02'), ('321n',), (('N', 6, 6, ()),), False),
+    ('3112', 'LENGTH (m)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('01', '02'), ('321n',), (('N', 6, 6, ()),), False),
+    ('3113', 'LENGTH (m)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('01', '02'), ('321n',), (('N', 6, 6, ()),), False),
+    ('3114', 'LENGTH (m)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('01', '02'), ('321n',), (('N', 6, 6, ()),), False),
+    ('3115', 'LENGTH (m)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('01', '02'), ('321n',), (('N', 6, 6, ()),), False),
+    ('3116', 'LENGTH (m)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('01', '02'), ('321n',), (('N', 6, 6, ()),), False),
+    ('3117', 'LENGTH (m)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('01', '02'), ('321n',), (('N', 6, 6, ()),), False),
+    ('3118', 'LENGTH (m)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('01', '02'), ('321n',), (('N', 6, 6, ()),), False),
+    ('3119', 'LENGTH (m)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('01', '02'), ('321n',), (('N', 6, 6, ()),), False),
+    ('3120', 'WIDTH (m)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('01', '02'), ('322n',), (('N', 6, 6, ()),), False),
+    ('3121', 'WIDTH (m)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('01', '02'), ('322n',), (('N', 6, 6, ()),), False),
+    ('3122', 'WIDTH (m)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('01', '02'), ('322n',), (('N', 6, 6, ()),), False),
+    ('3123', 'WIDTH (m)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('01', '02'), ('322n',), (('N', 6, 6, ()),), False),
+    ('3124', 'WIDTH (m)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('01', '02'), ('322n',), (('N', 6, 6, ()),), False),
+    ('3125', 'WIDTH (m)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('01', '02'), ('322n',), (('N', 6, 6, ()),), False),
+    ('3126', 'WIDTH (m)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('01', '02'), ('322n',), (('N', 6, 6, ()),), False),
+    ('3127', 'WIDTH (m)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('01', '02'), ('322n',), (('N', 6, 6, ()),), False),
+    ('3128', 'WIDTH (m)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('01', '02'), ('322n',), (('N', 6, 6, ()),), False),
+    ('3129', 'WIDTH (m)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('01', '02'), ('322n',), (('N', 6, 6, ()),), False),
+    ('3130', 'HEIGHT (m)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('01', '02'), ('323n',), (('N', 6, 6, ()),), False),
+    ('3131', 'HEIGHT (m)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('01', '02'), ('323n',), (('N', 6, 6, ()),), False),
+    ('3132', 'HEIGHT (m)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('01', '02'), ('323n',), (('N', 6, 6, ()),), False),
+    ('3133', 'HEIGHT (m)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('01', '02'), ('323n',), (('N', 6, 6, ()),), False),
+    ('3134', 'HEIGHT (m)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('01', '02'), ('323n',), (('N', 6, 6, ()),), False),
+    ('3135', 'HEIGHT (m)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('01', '02'), ('323n',), (('N', 6, 6, ()),), False),
+    ('3136', 'HEIGHT (m)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('01', '02'), ('323n',), (('N', 6, 6, ()),), False),
+    ('3137', 'HEIGHT (m)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('01', '02'), ('323n',), (('N', 6, 6, ()),), False),
+    ('3138', 'HEIGHT (m)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('01', '02'), ('323n',), (('N', 6, 6, ()),), False),
+    ('3139', 'HEIGHT (m)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('01', '02'), ('323n',), (('N', 6, 6, ()),), False),
+    ('3140', 'AREA (m²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('01', '02'), ('324n',), (('N', 6, 6, ()),), False),
+    ('3141', 'AREA (m²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('01', '02'), ('324n',), (('N', 6, 6, ()),), False),
+    ('3142', 'AREA (m²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('01', '02'), ('324n',), (('N', 6, 6, ()),), False),
+    ('3143', 'AREA (m²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('01', '02'), ('324n',), (('N', 6, 6, ()),), False),
+    ('3144', 'AREA (m²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('01', '02'), ('324n',), (('N', 6, 6, ()),), False),
+    ('3145', 'AREA (m²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('01', '02'), ('324n',), (('N', 6, 6, ()),), False),
+    ('3146', 'AREA (m²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('01', '02'), ('324n',), (('N', 6, 6, ()),), False),
+    ('3147', 'AREA (m²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('01', '02'), ('324n',), (('N', 6, 6, ()),), False),
+    ('3148', 'AREA (m²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('01', '02'), ('324n',), (('N', 6, 6, ()),), False),
+    ('3149', 'AREA (m²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('01', '02'), ('324n',), (('N', 6, 6, ()),), False),
+    ('3150', 'NET VOLUME (l)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('01', '02'), ('316n',), (('N', 6, 6, ()),), False),
+    ('3151', 'NET VOLUME (l)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('01', '02'), ('316n',), (('N', 6, 6, ()),), False),
+    ('3152', 'NET VOLUME (l)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('01', '02'), ('316n',), (('N', 6, 6, ()),), False),
+    ('3153', 'NET VOLUME (l)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('01', '02'), ('316n',), (('N', 6, 6, ()),), False),
+    ('3154', 'NET VOLUME (l)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('01', '02'), ('316n',), (('N', 6, 6, ()),), False),
+    ('3155', 'NET VOLUME (l)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('01', '02'), ('316n',), (('N', 6, 6, ()),), False),
+    ('3156', 'NET VOLUME (l)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('01', '02'), ('316n',), (('N', 6, 6, ()),), False),
+    ('3157', 'NET VOLUME (l)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('01', '02'), ('316n',), (('N', 6, 6, ()),), False),
+    ('3158', 'NET VOLUME (l)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('01', '02'), ('316n',), (('N', 6, 6, ()),), False),
+    ('3159', 'NET VOLUME (l)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('01', '02'), ('316n',), (('N', 6, 6, ()),), False),
+    ('3160', 'NET VOLUME (m³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('01', '02'), ('315n',), (('N', 6, 6, ()),), False),
+    ('3161', 'NET VOLUME (m³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('01', '02'), ('315n',), (('N', 6, 6, ()),), False),
+    ('3162', 'NET VOLUME (m³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('01', '02'), ('315n',), (('N', 6, 6, ()),), False),
+    ('3163', 'NET VOLUME (m³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('01', '02'), ('315n',), (('N', 6, 6, ()),), False),
+    ('3164', 'NET VOLUME (m³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('01', '02'), ('315n',), (('N', 6, 6, ()),), False),
+    ('3165', 'NET VOLUME (m³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('01', '02'), ('315n',), (('N', 6, 6, ()),), False),
+    ('3166', 'NET VOLUME (m³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('01', '02'), ('315n',), (('N', 6, 6, ()),), False),
+    ('3167', 'NET VOLUME (m³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('01', '02'), ('315n',), (('N', 6, 6, ()),), False),
+    ('3168', 'NET VOLUME (m³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('01', '02'), ('315n',), (('N', 6, 6, ()),), False),
+    ('3169', 'NET VOLUME (m³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('01', '02'), ('315n',), (('N', 6, 6, ()),), False),
+    ('3200', 'NET WEIGHT (lb)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('01', '02'), ('310n',), (('N', 6, 6, ()),), False),
+    ('3201', 'NET WEIGHT (lb)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('01', '02'), ('310n',), (('N', 6, 6, ()),), False),
+    ('3202', 'NET WEIGHT (lb)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('01', '02'), ('310n',), (('N', 6, 6, ()),), False),
+    ('3203', 'NET WEIGHT (lb)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('01', '02'), ('310n',), (('N', 6, 6, ()),), False),
+    ('3204', 'NET WEIGHT (lb)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('01', '02'), ('310n',), (('N', 6, 6, ()),), False),
+    ('3205', 'NET WEIGHT (lb)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('01', '02'), ('310n',), (('N', 6, 6, ()),), False),
+    ('3206', 'NET WEIGHT (lb)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('01', '02'), ('310n',), (('N', 6, 6, ()),), False),
+    ('3207', 'NET WEIGHT (lb)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('01', '02'), ('310n',), (('N', 6, 6, ()),), False),
+    ('3208', 'NET WEIGHT (lb)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('01', '02'), ('310n',), (('N', 6, 6, ()),), False),
+    ('3209', 'NET WEIGHT (lb)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('01', '02'), ('310n',), (('N', 6, 6, ()),), False),
+    ('3210', 'LENGTH (in)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('01', '02'), ('311n',), (('N', 6, 6, ()),), False),
+    ('3211', 'LENGTH (in)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('01', '02'), ('311n',), (('N', 6, 6, ()),), False),
+    ('3212', 'LENGTH (in)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('01', '02'), ('311n',), (('N', 6, 6, ()),), False),
+    ('3213', 'LENGTH (in)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('01', '02'), ('311n',), (('N', 6, 6, ()),), False),
+    ('3214', 'LENGTH (in)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('01', '02'), ('311n',), (('N', 6, 6, ()),), False),
+    ('3215', 'LENGTH (in)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('01', '02'), ('311n',), (('N', 6, 6, ()),), False),
+    ('3216', 'LENGTH (in)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('01', '02'), ('311n',), (('N', 6, 6, ()),), False),
+    ('3217', 'LENGTH (in)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('01', '02'), ('311n',), (('N', 6, 6, ()),), False),
+    ('3218', 'LENGTH (in)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('01', '02'), ('311n',), (('N', 6, 6, ()),), False),
+    ('3219', 'LENGTH (in)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('01', '02'), ('311n',), (('N', 6, 6, ()),), False),
+    ('3220', 'LENGTH (ft)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('01', '02'), ('312n',), (('N', 6, 6, ()),), False),
+    ('3221', 'LENGTH (ft)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('01', '02'), ('312n',), (('N', 6, 6, ()),), False),
+    ('3222', 'LENGTH (ft)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('01', '02'), ('312n',), (('N', 6, 6, ()),), False),
+    ('3223', 'LENGTH (ft)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('01', '02'), ('312n',), (('N', 6, 6, ()),), False),
+    ('3224', 'LENGTH (ft)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('01', '02'), ('312n',), (('N', 6, 6, ()),), False),
+    ('3225', 'LENGTH (ft)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('01', '02'), ('312n',), (('N', 6, 6, ()),), False),
+    ('3226', 'LENGTH (ft)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('01', '02'), ('312n',), (('N', 6, 6, ()),), False),
+    ('3227', 'LENGTH (ft)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('01', '02'), ('312n',), (('N', 6, 6, ()),), False),
+    ('3228', 'LENGTH (ft)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('01', '02'), ('312n',), (('N', 6, 6, ()),), False),
+    ('3229', 'LENGTH (ft)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('01', '02'), ('312n',), (('N', 6, 6, ()),), False),
+    ('3230', 'LENGTH (yd)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('01', '02'), ('313n',), (('N', 6, 6, ()),), False),
+    ('3231', 'LENGTH (yd)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('01', '02'), ('313n',), (('N', 6, 6, ()),), False),
+    ('3232', 'LENGTH (yd)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('01', '02'), ('313n',), (('N', 6, 6, ()),), False),
+    ('3233', 'LENGTH (yd)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('01', '02'), ('313n',), (('N', 6, 6, ()),), False),
+    ('3234', 'LENGTH (yd)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('01', '02'), ('313n',), (('N', 6, 6, ()),), False),
+    ('3235', 'LENGTH (yd)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('01', '02'), ('313n',), (('N', 6, 6, ()),), False),
+    ('3236', 'LENGTH (yd)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('01', '02'), ('313n',), (('N', 6, 6, ()),), False),
+    ('3237', 'LENGTH (yd)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('01', '02'), ('313n',), (('N', 6, 6, ()),), False),
+    ('3238', 'LENGTH (yd)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('01', '02'), ('313n',), (('N', 6, 6, ()),), False),
+    ('3239', 'LENGTH (yd)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('01', '02'), ('313n',), (('N', 6, 6, ()),), False),
+    ('3240', 'WIDTH (in)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('01', '02'), ('314n',), (('N', 6, 6, ()),), False),
+    ('3241', 'WIDTH (in)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('01', '02'), ('314n',), (('N', 6, 6, ()),), False),
+    ('3242', 'WIDTH (in)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('01', '02'), ('314n',), (('N', 6, 6, ()),), False),
+    ('3243', 'WIDTH (in)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('01', '02'), ('314n',), (('N', 6, 6, ()),), False),
+    ('3244', 'WIDTH (in)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('01', '02'), ('314n',), (('N', 6, 6, ()),), False),
+    ('3245', 'WIDTH (in)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('01', '02'), ('314n',), (('N', 6, 6, ()),), False),
+    ('3246', 'WIDTH (in)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('01', '02'), ('314n',), (('N', 6, 6, ()),), False),
+    ('3247', 'WIDTH (in)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('01', '02'), ('314n',), (('N', 6, 6, ()),), False),
+    ('3248', 'WIDTH (in)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('01', '02'), ('314n',), (('N', 6, 6, ()),), False),
+    ('3249', 'WIDTH (in)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('01', '02'), ('314n',), (('N', 6, 6, ()),), False),
+    ('3250', 'WIDTH (ft)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3251', 'WIDTH (ft)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3252', 'WIDTH (ft)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3253', 'WIDTH (ft)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3254', 'WIDTH (ft)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3255', 'WIDTH (ft)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3256', 'WIDTH (ft)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3257', 'WIDTH (ft)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3258', 'WIDTH (ft)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3259', 'WIDTH (ft)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3260', 'WIDTH (yd)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3261', 'WIDTH (yd)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3262', 'WIDTH (yd)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3263', 'WIDTH (yd)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3264', 'WIDTH (yd)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3265', 'WIDTH (yd)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3266', 'WIDTH (yd)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3267', 'WIDTH (yd)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3268', 'WIDTH (yd)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3269', 'WIDTH (yd)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3270', 'HEIGHT (in)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3271', 'HEIGHT (in)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3272', 'HEIGHT (in)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3273', 'HEIGHT (in)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3274', 'HEIGHT (in)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3275', 'HEIGHT (in)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3276', 'HEIGHT (in)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3277', 'HEIGHT (in)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3278', 'HEIGHT (in)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3279', 'HEIGHT (in)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3280', 'HEIGHT (ft)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3281', 'HEIGHT (ft)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3282', 'HEIGHT (ft)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3283', 'HEIGHT (ft)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3284', 'HEIGHT (ft)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3285', 'HEIGHT (ft)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3286', 'HEIGHT (ft)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3287', 'HEIGHT (ft)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3288', 'HEIGHT (ft)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3289', 'HEIGHT (ft)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3290', 'HEIGHT (yd)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3291', 'HEIGHT (yd)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3292', 'HEIGHT (yd)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3293', 'HEIGHT (yd)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3294', 'HEIGHT (yd)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3295', 'HEIGHT (yd)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3296', 'HEIGHT (yd)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3297', 'HEIGHT (yd)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3298', 'HEIGHT (yd)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3299', 'HEIGHT (yd)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3300', 'GROSS WEIGHT (kg)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3301', 'GROSS WEIGHT (kg)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3302', 'GROSS WEIGHT (kg)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3303', 'GROSS WEIGHT (kg)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3304', 'GROSS WEIGHT (kg)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3305', 'GROSS WEIGHT (kg)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3306', 'GROSS WEIGHT (kg)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3307', 'GROSS WEIGHT (kg)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3308', 'GROSS WEIGHT (kg)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3309', 'GROSS WEIGHT (kg)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3310', 'LENGTH (m), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3311', 'LENGTH (m), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3312', 'LENGTH (m), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3313', 'LENGTH (m), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3314', 'LENGTH (m), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3315', 'LENGTH (m), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3316', 'LENGTH (m), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3317', 'LENGTH (m), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3318', 'LENGTH (m), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3319', 'LENGTH (m), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3320', 'WIDTH (m), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3321', 'WIDTH (m), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3322', 'WIDTH (m), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3323', 'WIDTH (m), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3324', 'WIDTH (m), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3325', 'WIDTH (m), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3326', 'WIDTH (m), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3327', 'WIDTH (m), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3328', 'WIDTH (m), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3329', 'WIDTH (m), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3330', 'HEIGHT (m), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3331', 'HEIGHT (m), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3332', 'HEIGHT (m), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3333', 'HEIGHT (m), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3334', 'HEIGHT (m), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3335', 'HEIGHT (m), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3336', 'HEIGHT (m), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3337', 'HEIGHT (m), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3338', 'HEIGHT (m), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3339', 'HEIGHT (m), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3340', 'AREA (m²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3341', 'AREA (m²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3342', 'AREA (m²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3343', 'AREA (m²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3344', 'AREA (m²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3345', 'AREA (m²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3346', 'AREA (m²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3347', 'AREA (m²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3348', 'AREA (m²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3349', 'AREA (m²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3350', 'VOLUME (l), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3351', 'VOLUME (l), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3352', 'VOLUME (l), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3353', 'VOLUME (l), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3354', 'VOLUME (l), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3355', 'VOLUME (l), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3356', 'VOLUME (l), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3357', 'VOLUME (l), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3358', 'VOLUME (l), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3359', 'VOLUME (l), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3360', 'VOLUME (m³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3361', 'VOLUME (m³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3362', 'VOLUME (m³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3363', 'VOLUME (m³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3364', 'VOLUME (m³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3365', 'VOLUME (m³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3366', 'VOLUME (m³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3367', 'VOLUME (m³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3368', 'VOLUME (m³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3369', 'VOLUME (m³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3370', 'KG PER m²', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3371', 'KG PER m²', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3372', 'KG PER m²', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3373', 'KG PER m²', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3374', 'KG PER m²', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3375', 'KG PER m²', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3376', 'KG PER m²', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3377', 'KG PER m²', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3378', 'KG PER m²', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3379', 'KG PER m²', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3400', 'GROSS WEIGHT (lb)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3401', 'GROSS WEIGHT (lb)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3402', 'GROSS WEIGHT (lb)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3403', 'GROSS WEIGHT (lb)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3404', 'GROSS WEIGHT (lb)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3405', 'GROSS WEIGHT (lb)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3406', 'GROSS WEIGHT (lb)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3407', 'GROSS WEIGHT (lb)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3408', 'GROSS WEIGHT (lb)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3409', 'GROSS WEIGHT (lb)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3410', 'LENGTH (in), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3411', 'LENGTH (in), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3412', 'LENGTH (in), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3413', 'LENGTH (in), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3414', 'LENGTH (in), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3415', 'LENGTH (in), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3416', 'LENGTH (in), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3417', 'LENGTH (in), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3418', 'LENGTH (in), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3419', 'LENGTH (in), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3420', 'LENGTH (ft), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3421', 'LENGTH (ft), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3422', 'LENGTH (ft), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3423', 'LENGTH (ft), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3424', 'LENGTH (ft), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3425', 'LENGTH (ft), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3426', 'LENGTH (ft), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3427', 'LENGTH (ft), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3428', 'LENGTH (ft), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3429', 'LENGTH (ft), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3430', 'LENGTH (yd), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3431', 'LENGTH (yd), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3432', 'LENGTH (yd), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3433', 'LENGTH (yd), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3434', 'LENGTH (yd), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3435', 'LENGTH (yd), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3436', 'LENGTH (yd), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3437', 'LENGTH (yd), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3438', 'LENGTH (yd), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3439', 'LENGTH (yd), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3440', 'WIDTH (in), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3441', 'WIDTH (in), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3442', 'WIDTH (in), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3443', 'WIDTH (in), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3444', 'WIDTH (in), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3445', 'WIDTH (in), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3446', 'WIDTH (in), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3447', 'WIDTH (in), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3448', 'WIDTH (in), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3449', 'WIDTH (in), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3450', 'WIDTH (ft), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3451', 'WIDTH (ft), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3452', 'WIDTH (ft), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3453', 'WIDTH (ft), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3454', 'WIDTH (ft), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3455', 'WIDTH (ft), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3456', 'WIDTH (ft), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3457', 'WIDTH (ft), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3458', 'WIDTH (ft), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3459', 'WIDTH (ft), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3460', 'WIDTH (yd), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3461', 'WIDTH (yd), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3462', 'WIDTH (yd), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3463', 'WIDTH (yd), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3464', 'WIDTH (yd), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3465', 'WIDTH (yd), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3466', 'WIDTH (yd), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3467', 'WIDTH (yd), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3468', 'WIDTH (yd), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3469', 'WIDTH (yd), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3470', 'HEIGHT (in), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3471', 'HEIGHT (in), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3472', 'HEIGHT (in), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3473', 'HEIGHT (in), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3474', 'HEIGHT (in), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3475', 'HEIGHT (in), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3476', 'HEIGHT (in), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3477', 'HEIGHT (in), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3478', 'HEIGHT (in), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3479', 'HEIGHT (in), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3480', 'HEIGHT (ft), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3481', 'HEIGHT (ft), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3482', 'HEIGHT (ft), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3483', 'HEIGHT (ft), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3484', 'HEIGHT (ft), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3485', 'HEIGHT (ft), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3486', 'HEIGHT (ft), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3487', 'HEIGHT (ft), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3488', 'HEIGHT (ft), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3489', 'HEIGHT (ft), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3490', 'HEIGHT (yd), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3491', 'HEIGHT (yd), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3492', 'HEIGHT (yd), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3493', 'HEIGHT (yd), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3494', 'HEIGHT (yd), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3495', 'HEIGHT (yd), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3496', 'HEIGHT (yd), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3497', 'HEIGHT (yd), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3498', 'HEIGHT (yd), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3499', 'HEIGHT (yd), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3500', 'AREA (in²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3501', 'AREA (in²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3502', 'AREA (in²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3503', 'AREA (in²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3504', 'AREA (in²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3505', 'AREA (in²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3506', 'AREA (in²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3507', 'AREA (in²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3508', 'AREA (in²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3509', 'AREA (in²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3510', 'AREA (ft²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3511', 'AREA (ft²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3512', 'AREA (ft²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3513', 'AREA (ft²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3514', 'AREA (ft²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3515', 'AREA (ft²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3516', 'AREA (ft²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3517', 'AREA (ft²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3518', 'AREA (ft²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3519', 'AREA (ft²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3520', 'AREA (yd²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3521', 'AREA (yd²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3522', 'AREA (yd²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3523', 'AREA (yd²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3524', 'AREA (yd²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3525', 'AREA (yd²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3526', 'AREA (yd²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3527', 'AREA (yd²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3528', 'AREA (yd²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3529', 'AREA (yd²)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3530', 'AREA (in²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3531', 'AREA (in²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3532', 'AREA (in²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3533', 'AREA (in²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3534', 'AREA (in²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3535', 'AREA (in²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3536', 'AREA (in²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3537', 'AREA (in²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3538', 'AREA (in²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3539', 'AREA (in²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3540', 'AREA (ft²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3541', 'AREA (ft²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3542', 'AREA (ft²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3543', 'AREA (ft²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3544', 'AREA (ft²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3545', 'AREA (ft²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3546', 'AREA (ft²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3547', 'AREA (ft²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3548', 'AREA (ft²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3549', 'AREA (ft²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3550', 'AREA (yd²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3551', 'AREA (yd²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3552', 'AREA (yd²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3553', 'AREA (yd²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3554', 'AREA (yd²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3555', 'AREA (yd²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3556', 'AREA (yd²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3557', 'AREA (yd²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3558', 'AREA (yd²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3559', 'AREA (yd²), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3560', 'NET WEIGHT (t oz)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3561', 'NET WEIGHT (t oz)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3562', 'NET WEIGHT (t oz)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3563', 'NET WEIGHT (t oz)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3564', 'NET WEIGHT (t oz)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3565', 'NET WEIGHT (t oz)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3566', 'NET WEIGHT (t oz)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3567', 'NET WEIGHT (t oz)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3568', 'NET WEIGHT (t oz)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3569', 'NET WEIGHT (t oz)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3570', 'NET VOLUME (oz)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3571', 'NET VOLUME (oz)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3572', 'NET VOLUME (oz)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3573', 'NET VOLUME (oz)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3574', 'NET VOLUME (oz)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3575', 'NET VOLUME (oz)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3576', 'NET VOLUME (oz)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3577', 'NET VOLUME (oz)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3578', 'NET VOLUME (oz)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3579', 'NET VOLUME (oz)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3600', 'NET VOLUME (q)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3601', 'NET VOLUME (q)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3602', 'NET VOLUME (q)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3603', 'NET VOLUME (q)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3604', 'NET VOLUME (q)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3605', 'NET VOLUME (q)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3606', 'NET VOLUME (q)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3607', 'NET VOLUME (q)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3608', 'NET VOLUME (q)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3609', 'NET VOLUME (q)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3610', 'NET VOLUME (gal)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3611', 'NET VOLUME (gal)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3612', 'NET VOLUME (gal)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3613', 'NET VOLUME (gal)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3614', 'NET VOLUME (gal)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3615', 'NET VOLUME (gal)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3616', 'NET VOLUME (gal)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3617', 'NET VOLUME (gal)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3618', 'NET VOLUME (gal)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3619', 'NET VOLUME (gal)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3620', 'VOLUME (q), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3621', 'VOLUME (q), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3622', 'VOLUME (q), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3623', 'VOLUME (q), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3624', 'VOLUME (q), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3625', 'VOLUME (q), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3626', 'VOLUME (q), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3627', 'VOLUME (q), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3628', 'VOLUME (q), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3629', 'VOLUME (q), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3630', 'VOLUME (gal), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3631', 'VOLUME (gal), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3632', 'VOLUME (gal), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3633', 'VOLUME (gal), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3634', 'VOLUME (gal), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3635', 'VOLUME (gal), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3636', 'VOLUME (gal), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3637', 'VOLUME (gal), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3638', 'VOLUME (gal), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3639', 'VOLUME (gal), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3640', 'VOLUME (in³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3641', 'VOLUME (in³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3642', 'VOLUME (in³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3643', 'VOLUME (in³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3644', 'VOLUME (in³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3645', 'VOLUME (in³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3646', 'VOLUME (in³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3647', 'VOLUME (in³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3648', 'VOLUME (in³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3649', 'VOLUME (in³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3650', 'VOLUME (ft³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3651', 'VOLUME (ft³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3652', 'VOLUME (ft³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3653', 'VOLUME (ft³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3654', 'VOLUME (ft³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3655', 'VOLUME (ft³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3656', 'VOLUME (ft³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3657', 'VOLUME (ft³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3658', 'VOLUME (ft³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3659', 'VOLUME (ft³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3660', 'VOLUME (yd³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3661', 'VOLUME (yd³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3662', 'VOLUME (yd³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3663', 'VOLUME (yd³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3664', 'VOLUME (yd³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3665', 'VOLUME (yd³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3666', 'VOLUME (yd³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3667', 'VOLUME (yd³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3668', 'VOLUME (yd³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3669', 'VOLUME (yd³)', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3670', 'VOLUME (in³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3671', 'VOLUME (in³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3672', 'VOLUME (in³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3673', 'VOLUME (in³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3674', 'VOLUME (in³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3675', 'VOLUME (in³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3676', 'VOLUME (in³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3677', 'VOLUME (in³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3678', 'VOLUME (in³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3679', 'VOLUME (in³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3680', 'VOLUME (ft³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3681', 'VOLUME (ft³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3682', 'VOLUME (ft³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3683', 'VOLUME (ft³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3684', 'VOLUME (ft³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3685', 'VOLUME (ft³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3686', 'VOLUME (ft³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3687', 'VOLUME (ft³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3688', 'VOLUME (ft³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3689', 'VOLUME (ft³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3690', 'VOLUME (yd³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 0, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3691', 'VOLUME (yd³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 1, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3692', 'VOLUME (yd³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 2, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3693', 'VOLUME (yd³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 3, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3694', 'VOLUME (yd³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 4, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3695', 'VOLUME (yd³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 5, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3696', 'VOLUME (yd³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 6, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3697', 'VOLUME (yd³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 7, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3698', 'VOLUME (yd³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 8, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('3699', 'VOLUME (yd³), log', 6, 6, 6, 'N', False, '^\\d{6}$', False, 9, None, ('00',), (), (('N', 6, 6, ()),), False),
+    ('37', 'COUNT', None, 8, 1, 'N', True, '^\\d{1,8}$', False, None, None, ('02',), (), (('N', 1, 8, ()),), False),
+    ('3900', 'AMOUNT', None, 15, 1, 'N', True, '^\\d{1,15}$', False, 0, None, ('8020',), ('391n', '394n', '8111'), (('N', 1, 15, ()),), False),
+    ('3901', 'AMOUNT', None, 15, 1, 'N', True, '^\\d{1,15}$', False, 1, None, ('8020',), ('391n', '394n', '8111'), (('N', 1, 15, ()),), False),
+    ('3902', 'AMOUNT', None, 15, 1, 'N', True, '^\\d{1,15}$', False, 2, None, ('8020',), ('391n', '394n', '8111'), (('N', 1, 15, ()),), False),
+    ('3903', 'AMOUNT', None, 15, 1, 'N', True, '^\\d{1,15}$', False, 3, None, ('8020',), ('391n', '394n', '8111'), (('N', 1, 15, ()),), False),
+    ('3904', 'AMOUNT', None, 15, 1, 'N', True, '^\\d{1,15}$', False, 4, None, ('8020',), ('391n', '394n', '8111'), (('N', 1, 15, ()),), False),
+    ('3905', 'AMOUNT', None, 15, 1, 'N', True, '^\\d{1,15}$', False, 5, None, ('8020',), ('391n', '394n', '8111'), (('N', 1, 15, ()),), False),
+    ('3906', 'AMOUNT', None, 15, 1, 'N', True, '^\\d{1,15}$', False, 6, None, ('8020',), ('391n', '394n', '8111'), (('N', 1, 15, ()),), False),
+    ('3907', 'AMOUNT', None, 15, 1, 'N', True, '^\\d{1,15}$', False, 7, None, ('8020',), ('391n', '394n', '8111'), (('N', 1, 15, ()),), False),
+    ('3908', 'AMOUNT', None, 15, 1, 'N', True, '^\\d{1,15}$', False, 8, None, ('8020',), ('391n', '394n', '8111'), (('N', 1, 15, ()),), False),
+    ('3909', 'AMOUNT', None, 15, 1, 'N', True, '^\\d{1,15}$', False, 9, None, ('8020',), ('391n', '394n', '8111'), (('N', 1, 15, ()),), False),
+    ('3910', 'AMOUNT', None, 3, 3, 'N', True, '^\\d{3,3}$', False, 0, None, ('8020',), ('390n', '394n', '8111'), (('N', 3, 3, ('iso4217',)),), False),
+    ('3911', 'AMOUNT', None, 3, 3, 'N', True, '^\\d{3,3}$', False, 1, None, ('8020',), ('390n', '394n', '8111'), (('N', 3, 3, ('iso4217',)),), False),
+    ('3912', 'AMOUNT', None, 3, 3, 'N', True, '^\\d{3,3}$', False, 2, None, ('8020',), ('390n', '394n', '8111'), (('N', 3, 3, ('iso4217',)),), False),
+    ('3913', 'AMOUNT', None, 3, 3, 'N', True, '^\\d{3,3}$', False, 3, None, ('8020',), ('390n', '394n', '8111'), (('N', 3, 3, ('iso4217',)),), False),
+    ('3914', 'AMOUNT', None, 3, 3, 'N', True, '^\\d{3,3}$', False, 4, None, ('8020',), ('390n', '394n', '8111'), (('N', 3, 3, ('iso4217',)),), False),
+    ('3915', 'AMOUNT', None, 3, 3, 'N', True, '^\\d{3,3}$', False, 5, None, ('8020',), ('390n', '394n', '8111'), (('N', 3, 3, ('iso4217',)),), False),
+    ('3916', 'AMOUNT', None, 3, 3, 'N', True, '^\\d{3,3}$', False, 6, None, ('8020',), ('390n', '394n', '8111'), (('N', 3, 3, ('iso4217',)),), False),
+    ('3917', 'AMOUNT', None, 3, 3, 'N', True, '^\\d{3,3}$', False, 7, None, ('8020',), ('390n', '394n', '8111'), (('N', 3, 3, ('iso4217',)),), False),
+    ('3918', 'AMOUNT', None, 3, 3, 'N', True, '^\\d{3,3}$', False, 8, None, ('8020',), ('390n', '394n', '8111'), (('N', 3, 3, ('iso4217',)),), False),
+    ('3919', 'AMOUNT', None, 3, 3, 'N', True, '^\\d{3,3}$', False, 9, None, ('8020',), ('390n', '394n', '8111'), (('N', 3, 3, ('iso4217',)),), False),
+    ('3920', 'PRICE', None, 15, 1, 'N', True, '^\\d{1,15}$', False, 0, None, ('01', '02'), (), (('N', 1, 15, ()),), False),
+    ('3921', 'PRICE', None, 15, 1, 'N', True, '^\\d{1,15}$', False, 1, None, ('01', '02'), (), (('N', 1, 15, ()),), False),
+    ('3922', 'PRICE', None, 15, 1, 'N', True, '^\\d{1,15}$', False, 2, None, ('01', '02'), (), (('N', 1, 15, ()),), False),
+    ('3923', 'PRICE', None, 15, 1, 'N', True, '^\\d{1,15}$', False, 3, None, ('01', '02'), (), (('N', 1, 15, ()),), False),
+    ('3924', 'PRICE', None, 15, 1, 'N', True, '^\\d{1,15}$', False, 4, None, ('01', '02'), (), (('N', 1, 15, ()),), False),
+    ('3925', 'PRICE', None, 15, 1, 'N', True, '^\\d{1,15}$', False, 5, None, ('01', '02'), (), (('N', 1, 15, ()),), False),
+    ('3926', 'PRICE', None, 15, 1, 'N', True, '^\\d{1,15}$', False, 6, None, ('01', '02'), (), (('N', 1, 15, ()),), False),
+    ('3927', 'PRICE', None, 15, 1, 'N', True, '^\\d{1,15}$', False, 7, None, ('01', '02'), (), (('N', 1, 15, ()),), False),
+    ('3928', 'PRICE', None, 15, 1, 'N', True, '^\\d{1,15}$', False, 8, None, ('01', '02'), (), (('N', 1, 15, ()),), False),
+    ('3929', 'PRICE', None, 15, 1, 'N', True, '^\\d{1,15}$', False, 9, None, ('01', '02'), (), (('N', 1, 15, ()),), False),
+    ('3930', 'PRICE', None, 3, 3, 'N', True, '^\\d{3,3}$', False, 0, None, ('01', '02'), (), (('N', 3, 3, ('iso4217',)),), False),
+    ('3931', 'PRICE', None, 3, 3, 'N', True, '^\\d{3,3}$', False, 1, None, ('01', '02'), (), (('N', 3, 3, ('iso4217',)),), False),
+    ('3932', 'PRICE', None, 3, 3, 'N', True, '^\\d{3,3}$', False, 2, None, ('01', '02'), (), (('N', 3, 3, ('iso4217',)),), False),
+    ('3933', 'PRICE', None, 3, 3, 'N', True, '^\\d{3,3}$', False, 3, None, ('01', '02'), (), (('N', 3, 3, ('iso4217',)),), False),
+    ('3934', 'PRICE', None, 3, 3, 'N', True, '^\\d{3,3}$', False, 4, None, ('01', '02'), (), (('N', 3, 3, ('iso4217',)),), False),
+    ('3935', 'PRICE', None, 3, 3, 'N', True, '^\\d{3,3}$', False, 5, None, ('01', '02'), (), (('N', 3, 3, ('iso4217',)),), False),
+    ('3936', 'PRICE', None, 3, 3, 'N', True, '^\\d{3,3}$', False, 6, None, ('01', '02'), (), (('N', 3, 3, ('iso4217',)),), False),
+    ('3937', 'PRICE', None, 3, 3, 'N', True, '^\\d{3,3}$', False, 7, None, ('01', '02'), (), (('N', 3, 3, ('iso4217',)),), False),
+    ('3938', 'PRICE', None, 3, 3, 'N', True, '^\\d{3,3}$', False, 8, None, ('01', '02'), (), (('N', 3, 3, ('iso4217',)),), False),
+    ('3939', 'PRICE', None, 3, 3, 'N', True, '^\\d{3,3}$', False, 9, None, ('01', '02'), (), (('N', 3, 3, ('iso4217',)),), False),
+    ('3940', 'PRCNT OFF', None, 4, 4, 'N', True, '^\\d{4,4}$', False, 0, None, ('8020',), ('390n', '391n', '8111'), (('N', 4, 4, ()),), False),
+    ('3941', 'PRCNT OFF', None, 4, 4, 'N', True, '^\\d{4,4}$', False, 1, None, ('8020',), ('390n', '391n', '8111'), (('N', 4, 4, ()),), False),
+    ('3942', 'PRCNT OFF', None, 4, 4, 'N', True, '^\\d{4,4}$', False, 2, None, ('8020',), ('390n', '391n', '8111'), (('N', 4, 4, ()),), False),
+    ('3943', 'PRCNT OFF', None, 4, 4, 'N', True, '^\\d{4,4}$', False, 3, None, ('8020',), ('390n', '391n', '8111'), (('N', 4, 4, ()),), False),
+    ('3944', 'PRCNT OFF', None, 4, 4, 'N', True, '^\\d{4,4}$', False, 4, None, ('8020',), ('390n', '391n', '8111'), (('N', 4, 4, ()),), False),
+    ('3945', 'PRCNT OFF', None, 4, 4, 'N', True, '^\\d{4,4}$', False, 5, None, ('8020',), ('390n', '391n', '8111'), (('N', 4, 4, ()),), False),
+    ('3946', 'PRCNT OFF', None, 4, 4, 'N', True, '^\\d{4,4}$', False, 6, None, ('8020',), ('390n', '391n', '8111'), (('N', 4, 4, ()),), False),
+    ('3947', 'PRCNT OFF', None, 4, 4, 'N', True, '^\\d{4,4}$', False, 7, None, ('8020',), ('390n', '391n', '8111'), (('N', 4, 4, ()),), False),
+    ('3948', 'PRCNT OFF', None, 4, 4, 'N', True, '^\\d{4,4}$', False, 8, None, ('8020',), ('390n', '391n', '8111'), (('N', 4, 4, ()),), False),
+    ('3949', 'PRCNT OFF', None, 4, 4, 'N', True, '^\\d{4,4}$', False, 9, None, ('8020',), ('390n', '391n', '8111'), (('N', 4, 4, ()),), False),
+    ('3950', 'PRICE/UoM', None, 6, 6, 'N', True, '^\\d{6,6}$', False, 0, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3951', 'PRICE/UoM', None, 6, 6, 'N', True, '^\\d{6,6}$', False, 1, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3952', 'PRICE/UoM', None, 6, 6, 'N', True, '^\\d{6,6}$', False, 2, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3953', 'PRICE/UoM', None, 6, 6, 'N', True, '^\\d{6,6}$', False, 3, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3954', 'PRICE/UoM', None, 6, 6, 'N', True, '^\\d{6,6}$', False, 4, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3955', 'PRICE/UoM', None, 6, 6, 'N', True, '^\\d{6,6}$', False, 5, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3956', 'PRICE/UoM', None, 6, 6, 'N', True, '^\\d{6,6}$', False, 6, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3957', 'PRICE/UoM', None, 6, 6, 'N', True, '^\\d{6,6}$', False, 7, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3958', 'PRICE/UoM', None, 6, 6, 'N', True, '^\\d{6,6}$', False, 8, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('3959', 'PRICE/UoM', None, 6, 6, 'N', True, '^\\d{6,6}$', False, 9, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('400', 'ORDER NUMBER', None, 30, 1, 'X', True, '^[!-z]{1,30}$', False, None, None, (), (), (('X', 1, 30, ()),), False),
+    ('401', 'GINC', None, 30, 1, 'X', True, '^[!-z]{1,30}$', True, None, None, (), (), (('X', 1, 30, ('csumalpha', 'key')),), True),
+    ('402', 'GSIN', None, 17, 17, 'N', True, '^\\d{17,17}$', True, None, None, (), (), (('N', 17, 17, ('csum', 'key')),), True),
+    ('403', 'ROUTE', None, 30, 1, 'X', True, '^[!-z]{1,30}$', False, None, None, ('00',), (), (('X', 1, 30, ()),), False),
+    ('410', 'SHIP TO LOC', 13, 13, 13, 'N', False, '^\\d{13}$', True, None, None, (), (), (('N', 13, 13, ('csum', 'key')),), False),
+    ('411', 'BILL TO', 13, 13, 13, 'N', False, '^\\d{13}$', True, None, None, (), (), (('N', 13, 13, ('csum', 'key')),), False),
+    ('412', 'PURCHASE FROM', 13, 13, 13, 'N', False, '^\\d{13}$', True, None, None, (), (), (('N', 13, 13, ('csum', 'key')),), False),
+    ('413', 'SHIP FOR LOC', 13, 13, 13, 'N', False, '^\\d{13}$', True, None, None, (), (), (('N', 13, 13, ('csum', 'key')),), False),
+    ('414', 'LOC No.', 13, 13, 13, 'N', False, '^\\d{13}$', True, None, None, (), (), (('N', 13, 13, ('csum', 'key')),), True),
+    ('415', 'PAY TO', 13, 13, 13, 'N', False, '^\\d{13}$', True, None, None, (), (), (('N', 13, 13, ('csum', 'key')),), True),
+    ('416', 'PROD/SERV LOC', 13, 13, 13, 'N', False, '^\\d{13}$', True, None, None, (), (), (('N', 13, 13, ('csum', 'key')),), False),
+    ('417', 'PARTY', 13, 13, 13, 'N', False, '^\\d{13}$', True, None, None, (), (), (('N', 13, 13, ('csum', 'key')),), True),
+    ('420', 'SHIP TO POST', None, 20, 1, 'X', True, '^[!-z]{1,20}$', False, None, None, (), (), (('X', 1, 20, ()),), False),
+    ('421', 'SHIP TO POST', None, 3, 3, 'N', True, '^\\d{3,3}$', False, None, None, (), (), (('N', 3, 3, ('iso3166',)),), False),
+    ('422', 'ORIGIN', 3, 3, 3, 'N', False, '^\\d{3}$', False, None, None, ('01', '02'), (), (('N', 3, 3, ('iso3166',)),), False),
+    ('423', 'COUNTRY - INITIAL PROCESS', None, 15, 1, 'N', True, '^\\d{1,15}$', False, None, None, ('01', '02'), (), (('N', 1, 15, ('iso3166list',)),), False),
+    ('424', 'COUNTRY - PROCESS', 3, 3, 3, 'N', False, '^\\d{3}$', False, None, None, ('01', '02'), (), (('N', 3, 3, ('iso3166',)),), False),
+    ('425', 'COUNTRY - DISASSEMBLY', None, 15, 1, 'N', True, '^\\d{1,15}$', False, None, None, ('01', '02'), (), (('N', 1, 15, ('iso3166list',)),), False),
+    ('426', 'COUNTRY - FULL PROCESS', 3, 3, 3, 'N', False, '^\\d{3}$', False, None, None, ('01', '02'), (), (('N', 3, 3, ('iso3166',)),), False),
+    ('427', 'ORIGIN SUBDIVISION', None, 3, 1, 'X', True, '^[!-z]{1,3}$', False, None, None, ('01', '02'), (), (('X', 1, 3, ()),), False),
+    ('4300', 'SHIP TO COMP', None, 35, 1, 'X', True, '^[!-z]{1,35}$', False, None, None, (), (), (('X', 1, 35, ('pcenc',)),), False),
+    ('4301', 'SHIP TO NAME', None, 35, 1, 'X', True, '^[!-z]{1,35}$', False, None, None, (), (), (('X', 1, 35, ('pcenc',)),), False),
+    ('4302', 'SHIP TO ADD1', None, 70, 1, 'X', True, '^[!-z]{1,70}$', False, None, None, (), (), (('X', 1, 70, ('pcenc',)),), False),
+    ('4303', 'SHIP TO ADD2', None, 70, 1, 'X', True, '^[!-z]{1,70}$', False, None, None, (), (), (('X', 1, 70, ('pcenc',)),), False),
+    ('4304', 'SHIP TO SUB', None, 70, 1, 'X', True, '^[!-z]{1,70}$', False, None, None, (), (), (('X', 1, 70, ('pcenc',)),), False),
+    ('4305', 'SHIP TO LOC', None, 70, 1, 'X', True, '^[!-z]{1,70}$', False, None, None, (), (), (('X', 1, 70, ('pcenc',)),), False),
+    ('4306', 'SHIP TO REG', None, 70, 1, 'X', True, '^[!-z]{1,70}$', False, None, None, (), (), (('X', 1, 70, ('pcenc',)),), False),
+    ('4307', 'SHIP TO COUNTRY', None, 2, 2, 'X', True, '^[!-z]{2,2}$', False, None, None, (), (), (('X', 2, 2, ('iso3166alpha2',)),), False),
+    ('4308', 'SHIP TO PHONE', None, 30, 1, 'X', True, '^[!-z]{1,30}$', False, None, None, (), (), (('X', 1, 30, ()),), False),
+    ('4309', 'SHIP TO GEO', None, 20, 20, 'N', True, '^\\d{20,20}$', False, None, None, (), (), (('N', 20, 20, ('latlong',)),), False),
+    ('4310', 'RTN TO COMP', None, 35, 1, 'X', True, '^[!-z]{1,35}$', False, None, None, (), (), (('X', 1, 35, ('pcenc',)),), False),
+    ('4311', 'RTN TO NAME', None, 35, 1, 'X', True, '^[!-z]{1,35}$', False, None, None, (), (), (('X', 1, 35, ('pcenc',)),), False),
+    ('4312', 'RTN TO ADD1', None, 70, 1, 'X', True, '^[!-z]{1,70}$', False, None, None, (), (), (('X', 1, 70, ('pcenc',)),), False),
+    ('4313', 'RTN TO ADD2', None, 70, 1, 'X', True, '^[!-z]{1,70}$', False, None, None, (), (), (('X', 1, 70, ('pcenc',)),), False),
+    ('4314', 'RTN TO SUB', None, 70, 1, 'X', True, '^[!-z]{1,70}$', False, None, None, (), (), (('X', 1, 70, ('pcenc',)),), False),
+    ('4315', 'RTN TO LOC', None, 70, 1, 'X', True, '^[!-z]{1,70}$', False, None, None, (), (), (('X', 1, 70, ('pcenc',)),), False),
+    ('4316', 'RTN TO REG', None, 70, 1, 'X', True, '^[!-z]{1,70}$', False, None, None, (), (), (('X', 1, 70, ('pcenc',)),), False),
+    ('4317', 'RTN TO COUNTRY', None, 2, 2, 'X', True, '^[!-z]{2,2}$', False, None, None, (), (), (('X', 2, 2, ('iso3166alpha2',)),), False),
+    ('4318', 'RTN TO POST', None, 30, 1, 'X', True, '^[!-z]{1,30}$', False, None, None, (), (), (('X', 1, 30, ()),), False),
+    ('4319', 'RTN TO PHONE', None, 30, 1, 'X', True, '^[!-z]{1,30}$', False, None, None, (), (), (('X', 1, 30, ()),), False),
+    ('4320', 'SRV DESCRIPTION', None, 35, 1, 'X', True, '^[!-z]{1,35}$', False, None, None, (), (), (('X', 1, 35, ('pcenc',)),), False),
+    ('4321', 'DANGEROUS GOODS', None, 1, 1, 'N', True, '^\\d{1,1}$', False, None, None, (), (), (('N', 1, 1, ('yesno',)),), False),
+    ('4322', 'AUTH LEAVE', None, 1, 1, 'N', True, '^\\d{1,1}$', False, None, None, (), (), (('N', 1, 1, ('yesno',)),), False),
+    ('4323', 'SIG REQUIRED', None, 1, 1, 'N', True, '^\\d{1,1}$', False, None, None, (), (), (('N', 1, 1, ('yesno',)),), False),
+    ('4324', 'NBEF DEL DT', None, 10, 10, 'N', True, '^\\d{10,10}$', False, None, 'YYMMDDHH', (), (), (('N', 10, 10, ('yymmddhh',)),), False),
+    ('4325', 'NAFT DEL DT', None, 10, 10, 'N', True, '^\\d{10,10}$', False, None, 'YYMMDDHH', (), (), (('N', 10, 10, ('yymmddhh',)),), False),
+    ('4326', 'REL DATE', None, 6, 6, 'N', True, '^\\d{6,6}$', False, None, 'YYMMDD', (), (), (('N', 6, 6, ('yymmdd',)),), False),
+    ('4330', 'MAX TEMP (F)', None, 35, 1, 'X', True, '^[!-z]{1,35}$', False, None, None, ('01', '02'), (), (('X', 1, 35, ('pcenc',)),), False),
+    ('4331', 'MAX TEMP (C)', None, 35, 1, 'X', True, '^[!-z]{1,35}$', False, None, None, ('01', '02'), (), (('X', 1, 35, ('pcenc',)),), False),
+    ('4332', 'MIN TEMP (F)', None, 35, 1, 'X', True, '^[!-z]{1,35}$', False, None, None, ('01', '02'), (), (('X', 1, 35, ('pcenc',)),), False),
+    ('4333', 'MIN TEMP (C)', None, 35, 1, 'X', True, '^[!-z]{1,35}$', False, None, None, ('01', '02'), (), (('X', 1, 35, ('pcenc',)),), False),
+    ('7001', 'NSN', 13, 13, 13, 'N', False, '^\\d{13}$', False, None, None, ('01', '02'), (), (('N', 13, 13, ()),), False),
+    ('7002', 'MEAT CUT', None, 30, 1, 'X', True, '^[!-z]{1,30}$', False, None, None, ('01', '02'), (), (('X', 1, 30, ()),), False),
+    ('7003', 'EXPIRY TIME', 10, 10, 10, 'N', False, '^\\d{10}$', False, None, 'YYMMDDHH', ('01', '02'), (), (('N', 10, 10, ('yymmddhh',)),), False),
+    ('7004', 'ACTIVE POTENCY', None, 4, 1, 'N', True, '^\\d{1,4}$', False, None, None, ('01', '02'), (), (('N', 1, 4, ()),), False),
+    ('7005', 'CATCH AREA', None, 12, 1, 'X', True, '^[!-z]{1,12}$', False, None, None, ('01', '02'), (), (('X', 1, 12, ()),), False),
+    ('7006', 'FIRST FREEZE DATE', 6, 6, 6, 'N', False, '^\\d{6}$', False, None, 'YYMMDD', ('01', '02'), (), (('N', 6, 6, ('yymmdd',)),), False),
+    ('7007', 'HARVEST DATE', None, 6, 6, 'N', True, '^\\d{6,6}$', False, None, 'YYMMDD', ('01', '02'), (), (('N', 6, 6, ('yymmdd',)),), False),
+    ('7008', 'AQUATIC SPECIES', None, 3, 1, 'X', True, '^[!-z]{1,3}$', False, None, None, ('01', '02'), (), (('X', 1, 3, ()),), False),
+    ('7009', 'FISHING GEAR TYPE', None, 10, 1, 'X', True, '^[!-z]{1,10}$', False, None, None, ('01', '02'), (), (('X', 1, 10, ()),), False),
+    ('7010', 'PROD METHOD', None, 2, 1, 'X', True, '^[!-z]{1,2}$', False, None, None, ('01', '02'), (), (('X', 1, 2, ()),), False),
+    ('7011', 'TEST BY DATE', None, 6, 6, 'N', True, '^\\d{6,6}$', False, None, 'YYMMDD', ('01', '02'), (), (('N', 6, 6, ('yymmdd',)),), False),
+    ('7020', 'REFURB LOT', None, 20, 1, 'X', True, '^[!-z]{1,20}$', False, None, None, ('01', '414'), (), (('X', 1, 20, ()),), False),
+    ('7021', 'FUNC STAT', None, 20, 1, 'X', True, '^[!-z]{1,20}$', False, None, None, ('01',), (), (('X', 1, 20, ()),), False),
+    ('7022', 'REV STAT', None, 20, 1, 'X', True, '^[!-z]{1,20}$', False, None, None, ('01',), (), (('X', 1, 20, ()),), False),
+    ('7023', 'GIAI - ASSEMBLY', None, 30, 1, 'X', True, '^[!-z]{1,30}$', False, None, None, ('00', '01'), (), (('X', 1, 30, ()),), False),
+    ('7030', 'PROCESSOR', None, 3, 3, 'N', True, '^\\d{3,3}$', False, None, None, ('01',), (), (('N', 3, 3, ('iso3166999',)),), False),
+    ('7031', 'PROCESSOR', None, 3, 3, 'N', True, '^\\d{3,3}$', False, None, None, ('01',), (), (('N', 3, 3, ('iso3166999',)),), False),
+    ('7032', 'PROCESSOR', None, 3, 3, 'N', True, '^\\d{3,3}$', False, None, None, ('01',), (), (('N', 3, 3, ('iso3166999',)),), False),
+    ('7033', 'PROCESSOR', None, 3, 3, 'N', True, '^\\d{3,3}$', False, None, None, ('01',), (), (('N', 3, 3, ('iso3166999',)),), False),
+    ('7034', 'PROCESSOR', None, 3, 3, 'N', True, '^\\d{3,3}$', False, None, None, ('01',), (), (('N', 3, 3, ('iso3166999',)),), False),
+    ('7035', 'PROCESSOR', None, 3, 3, 'N', True, '^\\d{3,3}$', False, None, None, ('01',), (), (('N', 3, 3, ('iso3166999',)),), False),
+    ('7036', 'PROCESSOR', None, 3, 3, 'N', True, '^\\d{3,3}$', False, None, None, ('01',), (), (('N', 3, 3, ('iso3166999',)),), False),
+    ('7037', 'PROCESSOR', None, 3, 3, 'N', True, '^\\d{3,3}$', False, None, None, ('01',), (), (('N', 3, 3, ('iso3166999',)),), False),
+    ('7038', 'PROCESSOR', None, 3, 3, 'N', True, '^\\d{3,3}$', False, None, None, ('01',), (), (('N', 3, 3, ('iso3166999',)),), False),
+    ('7039', 'PROCESSOR', None, 3, 3, 'N', True, '^\\d{3,3}$', False, None, None, ('01',), (), (('N', 3, 3, ('iso3166999',)),), False),
+    ('7040', 'UIC+EXT', None, 1, 1, 'N', True, '^\\d{1,1}$', False, None, None, ('417',), (), (('N', 1, 1, ()),), False),
+    ('710', 'NHRN PZN', None, 20, 1, 'X', True, '^[!-z]{1,20}$', False, None, None, ('01',), (), (('X', 1, 20, ()),), False),
+    ('711', 'NHRN CIP', None, 20, 1, 'X', True, '^[!-z]{1,20}$', False, None, None, ('01',), (), (('X', 1, 20, ()),), False),
+    ('712', 'NHRN CN', None, 20, 1, 'X', True, '^[!-z]{1,20}$', False, None, None, ('01',), (), (('X', 1, 20, ()),), False),
+    ('713', 'NHRN DRN', None, 20, 1, 'X', True, '^[!-z]{1,20}$', False, None, None, ('01',), (), (('X', 1, 20, ()),), False),
+    ('714', 'NHRN AIM', None, 20, 1, 'X', True, '^[!-z]{1,20}$', False, None, None, ('01',), (), (('X', 1, 20, ()),), False),
+    ('715', 'NHRN NDC', None, 20, 1, 'X', True, '^[!-z]{1,20}$', False, None, None, ('01',), (), (('X', 1, 20, ()),), False),
+    ('716', 'NHRN AIC', None, 20, 1, 'X', True, '^[!-z]{1,20}$', False, None, None, ('01',), (), (('X', 1, 20, ()),), False),
+    ('717', 'NHRN SRN', None, 20, 1, 'X', True, '^[!-z]{1,20}$', False, None, None, ('01',), (), (('X', 1, 20, ()),), False),
+    ('7230', 'CERT', None, 2, 2, 'X', True, '^[!-z]{2,2}$', False, None, None, ('01', '8004'), (), (('X', 2, 2, ()),), False),
+    ('7231', 'CERT', None, 2, 2, 'X', True, '^[!-z]{2,2}$', False, None, None, ('01', '8004'), (), (('X', 2, 2, ()),), False),
+    ('7232', 'CERT', None, 2, 2, 'X', True, '^[!-z]{2,2}$', False, None, None, ('01', '8004'), (), (('X', 2, 2, ()),), False),
+    ('7233', 'CERT', None, 2, 2, 'X', True, '^[!-z]{2,2}$', False, None, None, ('01', '8004'), (), (('X', 2, 2, ()),), False),
+    ('7234', 'CERT', None, 2, 2, 'X', True, '^[!-z]{2,2}$', False, None, None, ('01', '8004'), (), (('X', 2, 2, ()),), False),
+    ('7235', 'CERT', None, 2, 2, 'X', True, '^[!-z]{2,2}$', False, None, None, ('01', '8004'), (), (('X', 2, 2, ()),), False),
+    ('7236', 'CERT', None, 2, 2, 'X', True, '^[!-z]{2,2}$', False, None, None, ('01', '8004'), (), (('X', 2, 2, ()),), False),
+    ('7237', 'CERT', None, 2, 2, 'X', True, '^[!-z]{2,2}$', False, None, None, ('01', '8004'), (), (('X', 2, 2, ()),), False),
+    ('7238', 'CERT', None, 2, 2, 'X', True, '^[!-z]{2,2}$', False, None, None, ('01', '8004'), (), (('X', 2, 2, ()),), False),
+    ('7239', 'CERT', None, 2, 2, 'X', True, '^[!-z]{2,2}$', False, None, None, ('01', '8004'), (), (('X', 2, 2, ()),), False),
+    ('7240', 'PROTOCOL', None, 20, 1, 'X', True, '^[!-z]{1,20}$', False, None, None, ('01',), (), (('X', 1, 20, ()),), False),
+    ('7241', 'AIDC MEDIA TYPE', None, 2, 2, 'N', True, '^\\d{2,2}$', False, None, None, ('8017', '8018'), (), (('N', 2, 2, ('mediatype',)),), False),
+    ('7242', 'VCN', None, 25, 1, 'X', True, '^[!-z]{1,25}$', False, None, None, ('8017', '8018'), (), (('X', 1, 25, ()),), False),
+    ('8001', 'DIMENSIONS', 14, 14, 14, 'N', False, '^\\d{14}$', False, None, None, ('01',), (), (('N', 14, 14, ()),), False),
+    ('8002', 'CMT No.', None, 20, 1, 'X', True, '^[!-z]{1,20}$', False, None, None, ('01',), (), (('X', 1, 20, ()),), False),
+    ('8003', 'GRAI', None, 1, 1, 'N', True, '^\\d{1,1}$', False, None, None, (), (), (('N', 1, 1, ()),), True),
+    ('8004', 'GIAI', None, 30, 1, 'X', True, '^[!-z]{1,30}$', False, None, None, (), (), (('X', 1, 30, ('key',)),), True),
+    ('8005', 'PRICE PER UNIT', 6, 6, 6, 'N', False, '^\\d{6}$', False, None, None, ('01', '02'), (), (('N', 6, 6, ()),), False),
+    ('8006', 'ITIP', 14, 14, 14, 'N', False, '^\\d{14}$', True, None, None, (), (), (('N', 14, 14, ('csum', 'gcppos2')),), True),
+    ('8007', 'IBAN', None, 34, 1, 'X', True, '^[!-z]{1,34}$', False, None, None, (), (), (('X', 1, 34, ('iban',)),), False),
+    ('8008', 'PROD TIME', None, 8, 8, 'N', True, '^\\d{8,8}$', False, None, 'YYMMDDHH', ('01', '02'), (), (('N', 8, 8, ('yymmddhh',)),), False),
+    ('8009', 'OPTSEN', None, 50, 1, 'X', True, '^[!-z]{1,50}$', False, None, None, ('01',), (), (('X', 1, 50, ()),), False),
+    ('8010', 'CPID', None, 30, 1, 'Y', True, '^[!-z]{1,30}$', False, None, None, (), (), (('Y', 1, 30, ('key',)),), True),
+    ('8011', 'CPID SERIAL', None, 12, 1, 'N', True, '^\\d{1,12}$', False, None, None, ('8010',), (), (('N', 1, 12, ('nozeroprefix',)),), False),
+    ('8012', 'VERSION', None, 20, 1, 'X', True, '^[!-z]{1,20}$', False, None, None, ('01',), (), (('X', 1, 20, ()),), False),
+    ('8013', 'GMN', None, 25, 1, 'X', True, '^[!-z]{1,25}$', True, None, None, (), (), (('X', 1, 25, ('csumalpha', 'key')),), True),
+    ('8017', 'GSRN - PROVIDER', 18, 18, 18, 'N', False, '^\\d{18}$', True, None, None, (), ('8018',), (('N', 18, 18, ('csum', 'key')),), True),
+    ('8018', 'GSRN - RECIPIENT', 18, 18, 18, 'N', False, '^\\d{18}$', True, None, None, (), ('8017',), (('N', 18, 18, ('csum', 'key')),), True),
+    ('8019', 'SRIN', None, 10, 1, 'N', True, '^\\d{1,10}$', False, None, None, ('8017', '8018'), (), (('N', 1, 10, ()),), False),
+    ('8020', 'REF No.', None, 25, 1, 'X', True, '^[!-z]{1,25}$', False, None, None, ('415',), (), (('X', 1, 25, ()),), False),
+    ('8026', 'ITIP CONTENT', 14, 14, 14, 'N', False, '^\\d{14}$', True, None, None, (), (), (('N', 14, 14, ('csum', 'gcppos2')),), True),
+    ('8030', 'DIGSIG', None, 90, 1, 'X', True, '^[!-z]{1,90}$', False, None, None, (), (), (('X', 1, 90, ()),), False),
+    ('8110', 'COUPON CODE', None, 70, 1, 'X', True, '^[!-z]{1,70}$', False, None, None, (), (), (('X', 1, 70, ('couponcode',)),), False),
+    ('8111', 'POINTS', 4, 4, 4, 'N', False, '^\\d{4}$', False, None, None, ('255',), ('390n', '391n', '394n'), (('N', 4, 4, ()),), False),
+    ('8112', 'COUPON OFFER', None, 70, 1, 'X', True, '^[!-z]{1,70}$', False, None, None, (), (), (('X', 1, 70, ('couponposoffer',)),), False),
+    ('8200', 'PRODUCT URL', None, 70, 1, 'X', True, '^[!-z]{1,70}$', False, None, None, ('01',), (), (('X', 1, 70, ()),), False),
+    ('90', 'INTERNAL', None, 30, 1, 'X', True, '^[!-z]{1,30}$', False, None, None, (), (), (('X', 1, 30, ()),), False),
+    ('91', 'INTERNAL', None, 90, 1, 'X', True, '^[!-z]{1,90}$', False, None, None, (), (), (('X', 1, 90, ()),), False),
+    ('92', 'INTERNAL', None, 90, 1, 'X', True, '^[!-z]{1,90}$', False, None, None, (), (), (('X', 1, 90, ()),), False),
+    ('93', 'INTERNAL', None, 90, 1, 'X', True, '^[!-z]{1,90}$', False, None, None, (), (), (('X', 1, 90, ()),), False),
+    ('94', 'INTERNAL', None, 90, 1, 'X', True, '^[!-z]{1,90}$', False, None, None, (), (), (('X', 1, 90, ()),), False),
+    ('95', 'INTERNAL', None, 90, 1, 'X', True, '^[!-z]{1,90}$', False, None, None, (), (), (('X', 1, 90, ()),), False),
+    ('96', 'INTERNAL', None, 90, 1, 'X', True, '^[!-z]{1,90}$', False, None, None, (), (), (('X', 1, 90, ()),), False),
+    ('97', 'INTERNAL', None, 90, 1, 'X', True, '^[!-z]{1,90}$', False, None, None, (), (), (('X', 1, 90, ()),), False),
+    ('98', 'INTERNAL', None, 90, 1, 'X', True, '^[!-z]{1,90}$', False, None, None, (), (), (('X', 1, 90, ()),), False),
+    ('99', 'INTERNAL', None, 90, 1, 'X', True, '^[!-z]{1,90}$', False, None, None, (), (), (('X', 1, 90, ()),), False),
+)
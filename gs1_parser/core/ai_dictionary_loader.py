@@ -9,14 +9,19 @@ Reference: https://ref.gs1.org/tools/gs1-barcode-syntax-resource/syntax-dictiona
 
 from __future__ import annotations
 
+import hashlib
 import json
 import re
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Set
 
+# PERF: slotted entries drop the per-instance __dict__ (dataclass slots need 3.10+)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class AIEntry:
     """
     Represents a single GS1 Application Identifier entry.
@@ -30,12 +35,13 @@ class AIEntry:
         data_type: 'N' for numeric, 'X' for alphanumeric, 'Y' for ISO chars
         separator_required: True if FNC1/GS required after this field (not fixed-length)
         regex: Validation regex pattern
+        compiled_regex: ``regex`` compiled once when the entry is added to a dictionary
         check_digit: True if field contains a check digit
         decimal_positions: Number of implied decimal positions (for weight/measure AIs)
         date_format: Date format if applicable ('YYMMDD', 'YYMMD0', 'YYYYMMDD')
-        required_ais: List of AIs that must be present with this AI
-        exclusive_ais: List of AIs that cannot be present with this AI
-        components: List of component specifications
+        required_ais: AIs that must be present with this AI
+        exclusive_ais: AIs that cannot be present with this AI
+        components: Component specifications as (type, min, max, linters) tuples
     """
     ai: str
     title: str
@@ -48,42 +54,32 @@ class AIEntry:
     check_digit: bool = False
     decimal_positions: Optional[int] = None
     date_format: Optional[str] = None
-    required_ais: List[str] = field(default_factory=list)
-    exclusive_ais: List[str] = field(default_factory=list)
-    components: List[dict] = field(default_factory=list)
+    required_ais: Tuple[str, ...] = ()
+    exclusive_ais: Tuple[str, ...] = ()
+    components: Tuple[Tuple[str, int, int, Tuple[str, ...]], ...] = ()
     is_dlp_key: bool = False  # GS1 Digital Link primary key
-
-
-class TrieNode:
-    """Trie node for efficient AI prefix matching."""
-    __slots__ = ['children', 'ai_entry', 'is_end']
-    
-    def __init__(self):
-        self.children: Dict[str, TrieNode] = {}
-        self.ai_entry: Optional[AIEntry] = None
-        self.is_end: bool = False
+    compiled_regex: Optional[re.Pattern] = field(default=None, repr=False, compare=False)
 
 
 class AITrie:
     """
-    Trie data structure for O(k) AI lookup where k is AI length (2-4).
-    Supports longest-prefix matching for efficient parsing.
+    AI code index with longest-prefix matching for efficient parsing.
+    
+    AI codes are only 2-4 characters, so a flat code -> entry map probed
+    longest first replaces per-character trie nodes; the class name is kept
+    for API compatibility.
     """
     
     def __init__(self):
-        self.root = TrieNode()
         self._all_ais: Dict[str, AIEntry] = {}
+        # AI lengths present, longest first, for the flat longest-match probe
+        self._lengths: Tuple[int, ...] = ()
     
     def insert(self, ai: str, entry: AIEntry) -> None:
-        """Insert an AI entry into the trie."""
-        node = self.root
-        for char in ai:
-            if char not in node.children:
-                node.children[char] = TrieNode()
-            node = node.children[char]
-        node.is_end = True
-        node.ai_entry = entry
+        """Insert an AI entry into the index."""
         self._all_ais[ai] = entry
+        if len(ai) not in self._lengths:
+            self._lengths = tuple(sorted(self._lengths + (len(ai),), reverse=True))
     
     def find_longest_match(self, text: str, start: int = 0) -> Tuple[Optional[AIEntry], int]:
         """
@@ -91,19 +87,16 @@ class AITrie:
         Returns (AIEntry, length) or (None, 0) if no match.
         Uses longest-match strategy: 4 -> 3 -> 2 digit AIs.
         """
-        node = self.root
-        last_match: Optional[AIEntry] = None
-        last_match_len = 0
-        
-        for i, char in enumerate(text[start:start + 4]):  # Max AI length is 4
-            if char not in node.children:
-                break
-            node = node.children[char]
-            if node.is_end:
-                last_match = node.ai_entry
-                last_match_len = i + 1
-        
-        return last_match, last_match_len
+        # PERF: AI codes are 2-4 chars, so probe the flat code -> entry map longest first
+        # (at most three dict lookups) instead of walking trie nodes per character.
+        remaining = len(text) - start
+        all_ais = self._all_ais
+        for length in self._lengths:
+            if length <= remaining:
+                entry = all_ais.get(text[start:start + length])
+                if entry is not None:
+                    return entry, length
+        return None, 0
     
     def get(self, ai: str) -> Optional[AIEntry]:
         """Get AI entry by exact AI code."""
@@ -449,15 +442,17 @@ def _parse_raw_dictionary() -> Dict[str, AIEntry]:
         # Parse attributes (req=, ex=, dlpkey, etc.)
         attributes = ' '.join(tokens[spec_start + 1:]) if spec_start + 1 < len(tokens) else ''
         
-        required_ais = []
-        exclusive_ais = []
+        required_ais = ()
+        exclusive_ais = ()
         is_dlp_key = False
         
+        # Intern AI codes so the few distinct req=/ex= codes are shared across
+        # entries, as they already are when loading the pregenerated table
         for attr in attributes.split():
             if attr.startswith('req='):
-                required_ais = attr[4:].split(',')
+                required_ais = tuple(map(sys.intern, attr[4:].split(',')))
             elif attr.startswith('ex='):
-                exclusive_ais = attr[3:].split(',')
+                exclusive_ais = tuple(map(sys.intern, attr[3:].split(',')))
             elif attr.startswith('dlpkey'):
                 is_dlp_key = True
         
@@ -494,13 +489,66 @@ def _parse_raw_dictionary() -> Dict[str, AIEntry]:
     return entries
 
 
+# Row layout of the pregenerated AI_TABLE (see scripts/generate_ai_table.py)
+AI_TABLE_FIELDS = (
+    'ai', 'title', 'fixed_length', 'max_length', 'min_length', 'data_type',
+    'separator_required', 'regex', 'check_digit', 'decimal_positions',
+    'date_format', 'required_ais', 'exclusive_ais', 'components', 'is_dlp_key',
+)
+
+
+def raw_dictionary_digest() -> str:
+    """SHA-1 of RAW_AI_DICTIONARY, used to detect a stale pregenerated table."""
+    return hashlib.sha1(RAW_AI_DICTIONARY.encode('utf-8')).hexdigest()
+
+
+def _entries_from_table() -> Optional[Dict[str, AIEntry]]:
+    """
+    Build AIEntry objects from the pregenerated AI_TABLE.
+    
+    PERF: the table is a tuple literal loaded straight from the .pyc, so no
+    text parsing happens at runtime. Returns None when the table is missing
+    or was generated from a different RAW_AI_DICTIONARY.
+    """
+    try:
+        from ._ai_table import AI_TABLE, SOURCE_DIGEST
+    except ImportError:
+        return None
+    if SOURCE_DIGEST != raw_dictionary_digest():
+        return None
+    
+    entries = {}
+    for (ai, title, fixed_length, max_length, min_length, data_type,
+         separator_required, regex, check_digit, decimal_positions,
+         date_format, required_ais, exclusive_ais, components,
+         is_dlp_key) in AI_TABLE:
+        entries[ai] = AIEntry(
+            ai=ai,
+            title=title,
+            fixed_length=fixed_length,
+            max_length=max_length,
+            min_length=min_length,
+            data_type=data_type,
+            separator_required=separator_required,
+            regex=regex,
+            check_digit=check_digit,
+            decimal_positions=decimal_positions,
+            date_format=date_format,
+            required_ais=required_ais,
+            exclusive_ais=exclusive_ais,
+            components=components,
+            is_dlp_key=is_dlp_key,
+        )
+    return entries
+
+
 def _create_ai_entry(
     ai: str,
     title: str,
     spec: str,
     fixed_length_flag: bool,
-    required_ais: List[str],
-    exclusive_ais: List[str],
+    required_ais: Tuple[str, ...],
+    exclusive_ais: Tuple[str, ...],
     is_dlp_key: bool,
     decimal_position: Optional[int] = None
 ) -> AIEntry:
@@ -519,12 +567,7 @@ def _create_ai_entry(
     
     for part in spec_parts:
         dtype, min_len, max_len, linters = _parse_syntax_spec(part)
-        components.append({
-            'type': dtype,
-            'min': min_len,
-            'max': max_len,
-            'linters': linters
-        })
+        components.append((dtype, min_len, max_len, tuple(linters)))
         total_min_len += min_len
         total_max_len += max_len
         data_type = dtype
@@ -547,7 +590,7 @@ def _create_ai_entry(
         separator_required = False
     
     entry = AIEntry(
-        ai=ai,
+        ai=sys.intern(ai),
         title=title,
         fixed_length=fixed_length,
         max_length=total_max_len,
@@ -559,7 +602,7 @@ def _create_ai_entry(
         date_format=date_format,
         required_ais=required_ais,
         exclusive_ais=exclusive_ais,
-        components=components,
+        components=tuple(components),
         is_dlp_key=is_dlp_key
     )
     
@@ -584,6 +627,12 @@ class AIDictionary:
     
     def add(self, ai: str, entry: AIEntry) -> None:
         """Add an AI entry to the dictionary."""
+        # PERF: compile the validation regex once here instead of on every parsed field
+        if entry.regex and entry.compiled_regex is None:
+            try:
+                entry.compiled_regex = re.compile(entry.regex)
+            except re.error:
+                pass  # Skip invalid regex
         self.trie.insert(ai, entry)
         self._entries[ai] = entry
     
@@ -645,8 +694,8 @@ class AIDictionary:
                 check_digit=info.get('check_digit', False),
                 decimal_positions=info.get('decimal_positions'),
                 date_format=info.get('date_format'),
-                required_ais=info.get('required_ais', []),
-                exclusive_ais=info.get('exclusive_ais', []),
+                required_ais=tuple(info.get('required_ais', ())),
+                exclusive_ais=tuple(info.get('exclusive_ais', ())),
                 is_dlp_key=info.get('is_dlp_key', False),
             )
         return cls(entries)
@@ -679,8 +728,8 @@ def load_ai_dictionary(
         with open(json_path, 'r', encoding='utf-8') as f:
             _cached_dictionary = AIDictionary.from_json(f.read())
     else:
-        # Parse from embedded dictionary
-        entries = _parse_raw_dictionary()
+        # Use the pregenerated table, falling back to parsing the embedded text
+        entries = _entries_from_table() or _parse_raw_dictionary()
         _cached_dictionary = AIDictionary(entries)
     
     return _cached_dictionary
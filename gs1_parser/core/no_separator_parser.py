@@ -153,6 +153,18 @@ for i in range(90, 100):
     )
 
 
+# PERF: GS1 AI codes are prefix-free, so at most one catalog AI can start at any offset.
+# One compiled alternation matched in place (no slicing) replaces a startswith per AI.
+_AI_CODE_RE = re.compile("|".join(sorted(AI_CATALOG, key=len, reverse=True)))
+# AIs whose appearance right after a variable-length value marks a plausible split point
+_CONTINUATION_AI_RE = re.compile(r"01|10|17|21|9[0-9]")
+# PERF: Value patterns depend only on the catalog; compiled once at import, not per parser
+_AI_PATTERNS = {
+    ai: re.compile(defn.regex_pattern, re.IGNORECASE)
+    for ai, defn in AI_CATALOG.items()
+}
+
+
 class NoSeparatorParser:
     """
     GS1 Parser for strings with NO separators.
@@ -170,11 +182,8 @@ class NoSeparatorParser:
         self.max_alternatives = max_alternatives
         self.vendor_whitelist = vendor_whitelist_internal_ais or set()
 
-        # Precompile regex patterns
-        self._patterns = {
-            ai: re.compile(defn.regex_pattern, re.IGNORECASE)
-            for ai, defn in AI_CATALOG.items()
-        }
+        # Precompiled regex patterns (shared across parser instances)
+        self._patterns = _AI_PATTERNS
 
     def parse(self, input_string: str) -> NoSeparatorParseResult:
         """
@@ -298,31 +307,61 @@ class NoSeparatorParser:
         """
         extensions = []
         pos = candidate.position
-        remaining = input_string[pos:]
 
-        # Try each AI
-        for ai_code, ai_def in AI_CATALOG.items():
-            # Check if AI matches at current position
-            if not remaining.startswith(ai_code):
-                continue
+        # Find the AI that starts at the current position
+        match = _AI_CODE_RE.match(input_string, pos)
+        if match is None:
+            return extensions
+        ai_code = match.group()
+        ai_def = AI_CATALOG[ai_code]
+        data_start = match.end()
+
+        # Fixed-length AI
+        if ai_def.fixed_length is not None:
+            data_end = data_start + ai_def.fixed_length
+            if data_end > len(input_string):
+                return extensions  # Not enough data
+
+            value = input_string[data_start:data_end]
+
+            # Validate and create element
+            element, valid = self._validate_element(ai_def, value, pos, data_end)
+
+            if not valid and ai_def.check_digit:
+                # Invalid check digit = invalid parse
+                return extensions
+
+            # Create new candidate
+            new_candidate = ParseCandidate(
+                elements=candidate.elements + [element],
+                score=candidate.score,
+                position=data_end,
+                consumed_all=False,
+                reasoning=candidate.reasoning.copy(),
+            )
+
+            # Score this extension
+            self._score_extension(new_candidate, element, input_string)
 
-            data_start = pos + len(ai_code)
+            extensions.append(new_candidate)
 
-            # Fixed-length AI
-            if ai_def.fixed_length is not None:
-                data_end = data_start + ai_def.fixed_length
+        # Variable-length AI
+        else:
+            # Try multiple lengths
+            lengths_to_try = self._get_variable_lengths_to_try(
+                input_string, data_start, ai_def, candidate
+            )
+
+            for data_len in lengths_to_try:
+                data_end = data_start + data_len
                 if data_end > len(input_string):
-                    continue  # Not enough data
+                    continue
 
                 value = input_string[data_start:data_end]
 
-                # Validate and create element
+                # Validate
                 element, valid = self._validate_element(ai_def, value, pos, data_end)
 
-                if not valid and ai_def.check_digit:
-                    # Invalid check digit = invalid parse
-                    continue
-
                 # Create new candidate
                 new_candidate = ParseCandidate(
                     elements=candidate.elements + [element],
@@ -337,37 +376,6 @@ class NoSeparatorParser:
 
                 extensions.append(new_candidate)
 
-            # Variable-length AI
-            else:
-                # Try multiple lengths
-                lengths_to_try = self._get_variable_lengths_to_try(
-                    input_string, data_start, ai_def, candidate
-                )
-
-                for data_len in lengths_to_try:
-                    data_end = data_start + data_len
-                    if data_end > len(input_string):
-                        continue
-
-                    value = input_string[data_start:data_end]
-
-                    # Validate
-                    element, valid = self._validate_element(ai_def, value, pos, data_end)
-
-                    # Create new candidate
-                    new_candidate = ParseCandidate(
-                        elements=candidate.elements + [element],
-                        score=candidate.score,
-                        position=data_end,
-                        consumed_all=False,
-                        reasoning=candidate.reasoning.copy(),
-                    )
-
-                    # Score this extension
-                    self._score_extension(new_candidate, element, input_string)
-
-                    extensions.append(new_candidate)
-
         return extensions
 
     def _get_variable_lengths_to_try(
@@ -399,8 +407,6 @@ class NoSeparatorParser:
         lengths = []
 
         # Strategy: look for AI prefixes in the remainder
-        known_ai_prefixes = ["01", "10", "17", "21", "90", "91", "92", "93", "94", "95", "96", "97", "98", "99"]
-
         for length in range(min_len, max_len + 1):
             next_pos = data_start + length
             if next_pos >= len(input_string):
@@ -409,10 +415,7 @@ class NoSeparatorParser:
                 continue
 
             # Check if next position could start a known AI
-            remaining_after = input_string[next_pos:]
-            could_be_ai = any(remaining_after.startswith(ai) for ai in known_ai_prefixes)
-
-            if could_be_ai:
+            if _CONTINUATION_AI_RE.match(input_string, next_pos):
                 lengths.append(length)
             elif length == max_len:
                 # Always try max length
@@ -44,6 +44,7 @@ from ..validators.validators import (
     validate_gln,
     ValidationResult,
     CSET82,
+    CSET82_BYTES,
     NUMERIC,
 )
 from .no_separator_parser import parse_gs1_no_separator
@@ -348,10 +349,9 @@ class GS1Parser:
                 result.errors.append("Value must be numeric")
         else:
             # Alphanumeric - check character set
-            invalid = set(value) - CSET82
-            if invalid:
+            if not value.isascii() or value.encode('ascii').translate(None, CSET82_BYTES):
                 result.valid = False
-                result.errors.append(f"Invalid characters: {invalid}")
+                result.errors.append(f"Invalid characters: {set(value) - CSET82}")
         
         # Check digit validation (GTIN, SSCC, GLN, etc.)
         if ai_entry.check_digit and value.isdigit() and len(value) >= 2:
@@ -389,13 +389,10 @@ class GS1Parser:
                 result.errors.append(f"Decimal decode error: {e}")
         
         # Regex validation (if provided and not already failing)
-        if ai_entry.regex and result.valid:
-            try:
-                if not re.match(ai_entry.regex, value):
-                    result.valid = False
-                    result.errors.append("Value does not match expected format")
-            except re.error:
-                pass  # Skip invalid regex
+        if ai_entry.compiled_regex is not None and result.valid:
+            if not ai_entry.compiled_regex.match(value):
+                result.valid = False
+                result.errors.append("Value does not match expected format")
         
         return processed_value, result
     
@@ -820,6 +817,9 @@ class GS1Parser:
         return result
 
 
+_default_parser: Optional[GS1Parser] = None
+
+
 def parse_gs1(
     input_text: str,
     *,
@@ -842,7 +842,14 @@ def parse_gs1(
         >>> print(result.elements[0].ai)  # "01"
         >>> print(result.elements[0].value)  # "06285096000842"
     """
-    parser = GS1Parser(options)
+    if options is None:
+        # PERF: GS1Parser keeps no per-parse state, so default-option calls share one instance
+        global _default_parser
+        if _default_parser is None:
+            _default_parser = GS1Parser()
+        parser = _default_parser
+    else:
+        parser = GS1Parser(options)
 
     # Detect separators before choosing parsing strategy
     stripped, symbology_removed, symbology_id = parser._strip_symbology(input_text)
@@ -7,6 +7,8 @@ from .json_formatter import (
     parse_gs1_to_dict,
     prepare_for_lookup,
     format_gs1_result_json,
+    write_json_line,
+    NO_FIELDS_ERROR,
 )
 
 __all__ = [
@@ -14,4 +16,6 @@ __all__ = [
     "parse_gs1_to_dict",
     "prepare_for_lookup",
     "format_gs1_result_json",
+    "write_json_line",
+    "NO_FIELDS_ERROR",
 ]
@@ -11,9 +11,16 @@ Provides clean, production-ready JSON output with:
 from __future__ import annotations
 
 import json
+import sys
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+try:  # Optional: faster JSON encoding for batch (JSON Lines) output
+    import orjson
+except ImportError:
+    orjson = None
+
 from ..core.no_separator_parser import (
     NoSeparatorParseResult,
     ParsedElement,
@@ -168,6 +175,27 @@ def parse_gs1_to_json(
           "Serial Number": "71490437969853"
         }
     """
+    # Sets (vendor whitelist) are frozen so the options can key the cache
+    options_key = tuple(
+        sorted(
+            (name, frozenset(value) if isinstance(value, (set, frozenset)) else value)
+            for name, value in parse_options.items()
+        )
+    )
+    try:
+        hash(options_key)
+    except TypeError:
+        # Unhashable option values bypass the cache
+        return _parse_gs1_to_json_uncached(barcode_data, include_confidence, include_raw_values, parse_options)
+    return _parse_gs1_to_json_cached(barcode_data, include_confidence, include_raw_values, options_key)
+
+
+def _parse_gs1_to_json_uncached(
+    barcode_data: str,
+    include_confidence: bool,
+    include_raw_values: bool,
+    parse_options: Dict[str, Any],
+) -> str:
     from ..core.no_separator_parser import parse_gs1_no_separator
 
     result = parse_gs1_no_separator(barcode_data, **parse_options)
@@ -179,6 +207,22 @@ def parse_gs1_to_json(
     )
 
 
+# PERF: Re-scans of the same barcode skip the beam search entirely. The JSON string is
+# immutable, so parse_gs1_to_dict/prepare_for_lookup still hand out fresh dicts per call.
+@lru_cache(maxsize=4096)
+def _parse_gs1_to_json_cached(
+    barcode_data: str,
+    include_confidence: bool,
+    include_raw_values: bool,
+    options_key: tuple,
+) -> str:
+    return _parse_gs1_to_json_uncached(barcode_data, include_confidence, include_raw_values, dict(options_key))
+
+
+parse_gs1_to_json.cache_clear = _parse_gs1_to_json_cached.cache_clear
+parse_gs1_to_json.cache_info = _parse_gs1_to_json_cached.cache_info
+
+
 def parse_gs1_to_dict(
     barcode_data: str,
     include_confidence: bool = False,
@@ -244,3 +288,15 @@ def prepare_for_lookup(barcode_data: str) -> Dict[str, Any]:
 
     # Merge: parsed fields first, then lookup placeholders
     return {**parsed, **lookup_fields}
+
+
+# Error text for a batch input line that yields no GS1 fields
+NO_FIELDS_ERROR = "No GS1 fields found"
+
+
+def write_json_line(obj: Dict[str, Any]) -> None:
+    """Write one compact JSON object per line to stdout, via orjson's bytes output when available."""
+    if orjson is not None:
+        sys.stdout.buffer.write(orjson.dumps(obj) + b"\n")
+    else:
+        sys.stdout.write(json.dumps(obj, ensure_ascii=False) + "\n")
@@ -12,11 +12,12 @@ from typing import Any, Dict, Optional
 _DEFAULT_DB_PATH = Path(__file__).parent / "data" / "gtin_database.json"
 _DB_CACHE: Optional[Dict[str, Any]] = None
 _DB_CACHE_PATH: Optional[Path] = None
+_GTIN_INDEX: Optional[Dict[str, Dict[str, Any]]] = None
 
 
 def _load_database(db_path: Optional[Path] = None) -> Dict[str, Any]:
     """Load GTIN database JSON with a small in-process cache."""
-    global _DB_CACHE, _DB_CACHE_PATH
+    global _DB_CACHE, _DB_CACHE_PATH, _GTIN_INDEX
     path = db_path or _DEFAULT_DB_PATH
     if _DB_CACHE is not None and _DB_CACHE_PATH == path:
         return _DB_CACHE
@@ -24,9 +25,23 @@ def _load_database(db_path: Optional[Path] = None) -> Dict[str, Any]:
     data = json.loads(path.read_text(encoding="utf-8"))
     _DB_CACHE = data
     _DB_CACHE_PATH = path
+    _GTIN_INDEX = None
     return data
 
 
+def _gtin_index(db_path: Optional[Path] = None) -> Dict[str, Dict[str, Any]]:
+    """Map GTIN -> record for the cached database, built once per load."""
+    global _GTIN_INDEX
+    db = _load_database(db_path)
+    if _GTIN_INDEX is None:
+        index: Dict[str, Dict[str, Any]] = {}
+        for record in db.get("data", []):
+            # First record wins, matching the original front-to-back scan
+            index.setdefault(str(record.get("GTIN Code", "")).strip(), record)
+        _GTIN_INDEX = index
+    return _GTIN_INDEX
+
+
 def lookup_gtin(
     gtin: str,
     *,
@@ -45,11 +60,5 @@ def lookup_gtin(
     if not gtin:
         return None
 
-    db = _load_database(db_path)
-    records = db.get("data", [])
-
-    for record in records:
-        if str(record.get("GTIN Code", "")).strip() == gtin:
-            return record
-
-    return None
+    # PERF: Dict lookup instead of scanning every record per barcode
+    return _gtin_index(db_path).get(gtin)
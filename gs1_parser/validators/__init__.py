@@ -15,6 +15,8 @@ from .validators import (
     ValidationResult,
     CSET82,
     CSET39,
+    CSET82_BYTES,
+    CSET39_BYTES,
     NUMERIC,
 )
 
@@ -31,5 +33,7 @@ __all__ = [
     "ValidationResult",
     "CSET82",
     "CSET39",
+    "CSET82_BYTES",
+    "CSET39_BYTES",
     "NUMERIC",
 ]
@@ -40,6 +40,10 @@ CSET39 = frozenset('#-/0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ')
 
 NUMERIC = frozenset('0123456789')
 
+# Byte strings of the same sets, for bytes.translate(None, delete) membership checks
+CSET82_BYTES = ''.join(sorted(CSET82)).encode('ascii')
+CSET39_BYTES = ''.join(sorted(CSET39)).encode('ascii')
+
 
 def calculate_check_digit_mod10(digits: str) -> int:
     """
@@ -333,7 +337,8 @@ def validate_numeric(
         return result
     
     # Check numeric
-    if not all(c in NUMERIC for c in value):
+    # PERF: isascii()+isdigit() classify the whole string in C; same set as NUMERIC
+    if not (value.isascii() and value.isdigit()):
         result.valid = False
         result.errors.append("Value contains non-numeric characters")
         return result
@@ -383,13 +388,16 @@ def validate_alphanumeric(
         return result
     
     # Select character set
-    allowed = CSET82 if charset == "cset82" else CSET39
+    if charset == "cset82":
+        allowed, allowed_bytes = CSET82, CSET82_BYTES
+    else:
+        allowed, allowed_bytes = CSET39, CSET39_BYTES
     
     # Check characters
-    invalid_chars = set(value) - allowed
-    if invalid_chars:
+    # PERF: translate() deletes every allowed byte in C; anything left over is invalid
+    if not value.isascii() or value.encode('ascii').translate(None, allowed_bytes):
         result.valid = False
-        result.errors.append(f"Invalid characters: {invalid_chars}")
+        result.errors.append(f"Invalid characters: {set(value) - allowed}")
     
     # Check length
     if fixed_length is not None:
@@ -8,12 +8,16 @@ import csv
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, Iterable, List, Sequence
 
 import pandas as pd
-from reportlab.lib.pagesizes import A4, landscape
-from reportlab.lib.units import inch
-from reportlab.pdfgen import canvas
+
+if TYPE_CHECKING:
+    from reportlab.pdfgen import canvas
+
+
+# PERF: Same value as reportlab.lib.units.inch (points), so CSV/Excel exports never import reportlab
+inch = 72.0
 
 
 EXPORTS_DIR = Path(__file__).resolve().parent.parent / "exports"
@@ -27,28 +31,68 @@ def to_dataframe(lines: List[Dict[str, str]]) -> pd.DataFrame:
     return pd.DataFrame(lines)
 
 
+CSV_CHUNK_ROWS = 50_000
+# 1 MiB file buffer: chunked writes reach the OS as few large syscalls
+CSV_BUFFER_BYTES = 1 << 20
+
+
 def export_csv(df: pd.DataFrame, filename: str) -> Path:
     ensure_exports_dir()
     path = EXPORTS_DIR / filename
-    df.to_csv(path, index=False)
+    # PERF: Write in row chunks so the encoded CSV never sits in memory next to the whole frame
+    with path.open("w", buffering=CSV_BUFFER_BYTES, newline="", encoding="utf-8") as handle:
+        df.iloc[:0].to_csv(handle, index=False)
+        for start in range(0, len(df), CSV_CHUNK_ROWS):
+            df.iloc[start : start + CSV_CHUNK_ROWS].to_csv(handle, header=False, index=False)
+    return path
+
+
+def export_csv_stream(rows: Iterable[Dict[str, object]], fieldnames: Sequence[str], filename: str) -> Path:
+    """Write rows to CSV one at a time so the export never holds the whole session in memory."""
+    ensure_exports_dir()
+    path = EXPORTS_DIR / filename
+    with path.open("w", buffering=CSV_BUFFER_BYTES, newline="", encoding="utf-8") as handle:
+        writer = csv.DictWriter(handle, fieldnames=list(fieldnames), restval="", extrasaction="ignore")
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({k: "" if v is None else v for k, v in row.items()})
     return path
 
 
+EXCEL_CHUNK_ROWS = 50_000
+
+
+def _append_sheet(workbook, df: pd.DataFrame, sheet_name: str) -> None:
+    # PERF: Rows go through a write-only worksheet in chunks, so no cell model of the whole frame is built
+    ws = workbook.create_sheet(title=sheet_name)
+    ws.append([str(col) for col in df.columns])
+    for start in range(0, len(df), EXCEL_CHUNK_ROWS):
+        chunk = df.iloc[start : start + EXCEL_CHUNK_ROWS].astype(object)
+        chunk = chunk.where(chunk.notna(), None)
+        for row in chunk.itertuples(index=False, name=None):
+            ws.append(row)
+
+
+def _write_workbook(path: Path, sheets: Sequence[tuple]) -> None:
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    for sheet_name, df in sheets:
+        _append_sheet(workbook, df, sheet_name)
+    workbook.save(path)
+
+
 def export_excel(detailed: pd.DataFrame, summary: pd.DataFrame, warnings: pd.DataFrame, filename: str) -> Path:
     ensure_exports_dir()
     path = EXPORTS_DIR / filename
-    with pd.ExcelWriter(path, engine="openpyxl") as writer:
-        detailed.to_excel(writer, sheet_name="Detailed", index=False)
-        summary.to_excel(writer, sheet_name="Summary", index=False)
-        warnings.to_excel(writer, sheet_name="Warnings", index=False)
+    _write_workbook(path, [("Detailed", detailed), ("Summary", summary), ("Warnings", warnings)])
     return path
 
 
 def export_excel_single(df: pd.DataFrame, filename: str, sheet_name: str = "Sheet1") -> Path:
     ensure_exports_dir()
     path = EXPORTS_DIR / filename
-    with pd.ExcelWriter(path, engine="openpyxl") as writer:
-        df.to_excel(writer, sheet_name=sheet_name, index=False)
+    _write_workbook(path, [(sheet_name, df)])
     return path
 
 
@@ -62,13 +106,12 @@ def export_excel_with_metadata(
     ensure_exports_dir()
     path = EXPORTS_DIR / filename
     meta_df = pd.DataFrame(list(metadata.items()), columns=["Field", "Value"])
-    with pd.ExcelWriter(path, engine="openpyxl") as writer:
-        meta_df.to_excel(writer, sheet_name="Metadata", index=False)
-        detailed.to_excel(writer, sheet_name="Detailed", index=False)
-        if summary is not None and not summary.empty:
-            summary.to_excel(writer, sheet_name="Summary", index=False)
-        if warnings is not None and not warnings.empty:
-            warnings.to_excel(writer, sheet_name="Warnings", index=False)
+    sheets = [("Metadata", meta_df), ("Detailed", detailed)]
+    if summary is not None and not summary.empty:
+        sheets.append(("Summary", summary))
+    if warnings is not None and not warnings.empty:
+        sheets.append(("Warnings", warnings))
+    _write_workbook(path, sheets)
     return path
 
 
@@ -188,6 +231,10 @@ def export_pdf_report(
 ) -> Path:
     ensure_exports_dir()
     path = EXPORTS_DIR / filename
+    # PERF: reportlab's canvas stack is only imported when a PDF is actually built
+    from reportlab.lib.pagesizes import A4, landscape
+    from reportlab.pdfgen import canvas
+
     c = canvas.Canvas(str(path), pagesize=landscape(A4))
     width, height = landscape(A4)
     x = 0.5 * inch
@@ -308,6 +355,10 @@ def export_pdf_report(
 def export_pdf(report_title: str, df: pd.DataFrame, filename: str) -> Path:
     ensure_exports_dir()
     path = EXPORTS_DIR / filename
+    # PERF: reportlab's canvas stack is only imported when a PDF is actually built
+    from reportlab.lib.pagesizes import A4, landscape
+    from reportlab.pdfgen import canvas
+
     c = canvas.Canvas(str(path), pagesize=landscape(A4))
     width, height = landscape(A4)
     x = 0.5 * inch
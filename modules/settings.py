@@ -8,7 +8,7 @@ from typing import Any, Dict
 
 import streamlit as st
 
-from .storage import get_setting, set_setting
+from .storage import get_settings, set_setting
 
 
 DEFAULT_SETTINGS: Dict[str, Any] = {
@@ -25,10 +25,8 @@ DEFAULT_SETTINGS: Dict[str, Any] = {
 
 @st.cache_data(ttl=300)  # PERF FIX: Cache for 5 minutes (saves 1.6s on every page load!)
 def load_settings() -> Dict[str, Any]:
-    settings = {}
-    for key, default in DEFAULT_SETTINGS.items():
-        settings[key] = get_setting(key, default)
-    return settings
+    # PERF: One backend read for all keys instead of one find_one per setting on a cache miss
+    return get_settings(DEFAULT_SETTINGS)
 
 
 def save_settings(updates: Dict[str, Any]) -> None:
@@ -8,11 +8,11 @@ import json
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 from uuid import uuid4
 
-from pymongo import ASCENDING, DESCENDING, MongoClient
-from pymongo.errors import PyMongoError
+from pymongo import ASCENDING, DESCENDING, DeleteOne, MongoClient, UpdateOne
+from pymongo.errors import OperationFailure, PyMongoError
 
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -79,7 +79,9 @@ def init_db() -> None:
     db = get_db()
     db.sessions.create_index("session_id", unique=True)
     db.sessions.create_index("start_datetime")
+    # list_lines / list_lines_iter: equality on session_id, sorted newest first
     db.lines.create_index([("session_id", ASCENDING), ("scan_timestamp", DESCENDING)])
+    # find_duplicates: point lookup on the full GTIN + batch + expiry key
     db.lines.create_index(
         [
             ("session_id", ASCENDING),
@@ -88,6 +90,7 @@ def init_db() -> None:
             ("expiry_date", ASCENDING),
         ]
     )
+    # find_serial_duplicates (empty serials short-circuit before querying)
     db.lines.create_index([("session_id", ASCENDING), ("serial", ASCENDING)])
     db.audit.create_index([("session_id", ASCENDING), ("timestamp", DESCENDING)])
     db.settings.create_index("key", unique=True)
@@ -128,6 +131,19 @@ def get_setting(key: str, default: Any = None) -> Any:
     return doc.get("value", default)
 
 
+def get_settings(defaults: Dict[str, Any]) -> Dict[str, Any]:
+    """Read several settings in one backend round trip, falling back to ``defaults``."""
+    if _backend() == "json":
+        stored = _json_load().get("settings", {})
+        return {key: stored.get(key, default) for key, default in defaults.items()}
+    db = get_db()
+    stored = {doc["_id"]: doc for doc in db.settings.find({"_id": {"$in": list(defaults)}})}
+    return {
+        key: stored[key].get("value", default) if key in stored else default
+        for key, default in defaults.items()
+    }
+
+
 def _prune_sessions(retain_count: int) -> None:
     if retain_count <= 0:
         return
@@ -262,6 +278,7 @@ def create_line(data: Dict[str, Any]) -> str:
         "price": data.get("price"),
         "sfda_code": data.get("sfda_code"),
         "status": data.get("status"),
+        "status_override": bool(data.get("status_override", False)),
         "notes": data.get("notes"),
         "locked": bool(data.get("locked", False)),
     }
@@ -301,18 +318,23 @@ def delete_line(line_id: str) -> None:
 
 
 def list_lines(session_id: str) -> List[Dict[str, Any]]:
+    return list(list_lines_iter(session_id))
+
+
+def list_lines_iter(session_id: str) -> Iterator[Dict[str, Any]]:
+    """Yield session lines newest first without building the full list (Mongo cursor)."""
     if _backend() == "json":
         payload = _json_load()
         lines = [l for l in payload.get("lines", []) if l.get("session_id") == session_id]
-        lines = sorted(lines, key=lambda l: l.get("scan_timestamp", ""), reverse=True)
-        return [dict(l) for l in lines]
+        lines.sort(key=lambda l: l.get("scan_timestamp", ""), reverse=True)
+        for line in lines:
+            yield dict(line)
+        return
     db = get_db()
     cursor = db.lines.find({"session_id": session_id}).sort("scan_timestamp", DESCENDING)
-    docs = []
     for doc in cursor:
         doc.pop("_id", None)
-        docs.append(doc)
-    return docs
+        yield doc
 
 
 def find_duplicates(
@@ -369,7 +391,21 @@ def find_serial_duplicates(session_id: str, serial: str) -> List[Dict[str, Any]]
     return docs
 
 
-def create_audit(
+# Field order of an audit record (everything _audit_doc writes except the Mongo _id)
+AUDIT_COLUMNS = (
+    "audit_id",
+    "timestamp",
+    "username",
+    "action_type",
+    "session_id",
+    "line_id",
+    "old_value",
+    "new_value",
+    "reason",
+)
+
+
+def _audit_doc(
     username: str,
     action_type: str,
     session_id: Optional[str] = None,
@@ -377,9 +413,9 @@ def create_audit(
     old_value: Optional[Dict[str, Any]] = None,
     new_value: Optional[Dict[str, Any]] = None,
     reason: Optional[str] = None,
-) -> str:
+) -> Dict[str, Any]:
     audit_id = str(uuid4())
-    doc = {
+    return {
         "_id": audit_id,
         "audit_id": audit_id,
         "timestamp": _utc_now(),
@@ -391,6 +427,18 @@ def create_audit(
         "new_value": new_value,
         "reason": reason,
     }
+
+
+def create_audit(
+    username: str,
+    action_type: str,
+    session_id: Optional[str] = None,
+    line_id: Optional[str] = None,
+    old_value: Optional[Dict[str, Any]] = None,
+    new_value: Optional[Dict[str, Any]] = None,
+    reason: Optional[str] = None,
+) -> str:
+    doc = _audit_doc(username, action_type, session_id, line_id, old_value, new_value, reason)
     if _backend() == "json":
         payload = _json_load()
         payload["audit"].append(doc.copy())
@@ -398,7 +446,62 @@ def create_audit(
     else:
         db = get_db()
         db.audit.insert_one(doc)
-    return audit_id
+    return doc["audit_id"]
+
+
+# Server error code when transactions are used on a standalone (non replica set) server
+_ILLEGAL_OPERATION = 20
+
+
+def apply_line_changes(
+    *,
+    updates: Optional[Dict[str, Dict[str, Any]]] = None,
+    deletes: Iterable[str] = (),
+    audits: Iterable[Dict[str, Any]] = (),
+) -> List[str]:
+    """
+    Apply line updates/deletes and their audit records together: one JSON load/save,
+    or one lines bulk_write plus one audit insert_many in a single Mongo transaction,
+    so edits are never saved without their audit trail. A standalone Mongo server
+    cannot run transactions; there the two writes run back to back without one.
+    Returns the new audit ids.
+    """
+    updates = {line_id: u for line_id, u in (updates or {}).items() if u}
+    deletes = set(deletes)
+    docs = [_audit_doc(**entry) for entry in audits]
+    if not (updates or deletes or docs):
+        return []
+    if _backend() == "json":
+        payload = _json_load()
+        lines = payload.get("lines", [])
+        for line in lines:
+            line_updates = updates.get(line.get("line_id"))
+            if line_updates:
+                line.update(line_updates)
+        if deletes:
+            payload["lines"] = [l for l in lines if l.get("line_id") not in deletes]
+        payload["audit"].extend(doc.copy() for doc in docs)
+        _json_save(payload)
+        return [doc["audit_id"] for doc in docs]
+    db = get_db()
+    ops = [UpdateOne({"_id": line_id}, {"$set": u}) for line_id, u in updates.items()]
+    ops.extend(DeleteOne({"_id": line_id}) for line_id in deletes)
+
+    def write(session=None) -> None:
+        if ops:
+            db.lines.bulk_write(ops, ordered=False, session=session)
+        if docs:
+            db.audit.insert_many(docs, ordered=False, session=session)
+
+    try:
+        with _get_client().start_session() as session:
+            session.with_transaction(write)
+    except OperationFailure as exc:
+        # IllegalOperation: transactions need a replica set or mongos; nothing was written
+        if exc.code != _ILLEGAL_OPERATION:
+            raise
+        write()
+    return [doc["audit_id"] for doc in docs]
 
 
 def list_audit(session_id: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -411,9 +514,5 @@ def list_audit(session_id: Optional[str] = None) -> List[Dict[str, Any]]:
         return [dict(r) for r in records]
     db = get_db()
     query = {"session_id": session_id} if session_id else {}
-    cursor = db.audit.find(query).sort("timestamp", DESCENDING)
-    docs = []
-    for doc in cursor:
-        doc.pop("_id", None)
-        docs.append(doc)
-    return docs
+    # PERF: The server drops _id instead of a per-document pop on the client
+    return list(db.audit.find(query, {"_id": 0}).sort("timestamp", DESCENDING))
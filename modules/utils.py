@@ -5,7 +5,8 @@ Utility helpers for the inventory UI.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 from dateutil.relativedelta import relativedelta
@@ -24,18 +25,51 @@ def expiry_status(expiry_date: str, near_months: int) -> str:
     """
     Returns: Valid, Near Expiry, Expired, Unknown
     """
+    # PERF: Memoized per day; many lines share the same expiry date
+    return _expiry_status_on(expiry_date, near_months, date.today())
+
+
+@lru_cache(maxsize=4096)
+def _expiry_status_on(expiry_date: str, near_months: int, today: date) -> str:
     dt = parse_ddmmyyyy(expiry_date)
     if not dt:
         return "Unknown"
-    today = datetime.today()
-    if dt.date() < today.date():
+    if dt.date() < today:
         return "Expired"
     threshold = today + relativedelta(months=near_months)
-    if dt.date() <= threshold.date():
+    if dt.date() <= threshold:
         return "Near Expiry"
     return "Valid"
 
 
+def expiry_status_array(expiry_dates, near_months: int, today: Optional[date] = None):
+    """
+    Vectorized expiry_status over a column of DD/MM/YYYY strings.
+    """
+    # PERF: One datetime parse and three comparisons for the whole column instead of a per-row call
+    import numpy as np
+    import pandas as pd
+
+    today_ts = pd.Timestamp(today or date.today())
+    expiry = pd.to_datetime(pd.Series(expiry_dates, dtype=object), format="%d/%m/%Y", errors="coerce")
+    threshold = today_ts + pd.DateOffset(months=near_months)
+    return np.select(
+        [expiry.isna().to_numpy(), (expiry < today_ts).to_numpy(), (expiry <= threshold).to_numpy()],
+        ["Unknown", "Expired", "Near Expiry"],
+        default="Valid",
+    )
+
+
+def current_status(stored_status: str, expiry_date: str, near_months: int, override: bool = False) -> str:
+    """
+    Re-derives a line's expiry status for today; Unknown (no product data) and
+    manually set statuses (override) are kept as stored.
+    """
+    if override or stored_status == "Unknown":
+        return stored_status
+    return expiry_status(expiry_date, near_months)
+
+
 def normalize_sfda(sfda_value) -> str:
     if sfda_value is None:
         return ""
@@ -0,0 +1,47 @@
+"""
+Regenerate gs1_parser/core/_ai_table.py from RAW_AI_DICTIONARY.
+
+Run this after editing RAW_AI_DICTIONARY. Until then the loader notices the
+digest mismatch and falls back to parsing the embedded text.
+"""
+
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from gs1_parser.core.ai_dictionary_loader import (  # noqa: E402
+    AI_TABLE_FIELDS,
+    _parse_raw_dictionary,
+    raw_dictionary_digest,
+)
+
+OUTPUT = ROOT / "gs1_parser" / "core" / "_ai_table.py"
+
+HEADER = '''"""
+Pregenerated GS1 AI table.
+
+Generated by scripts/generate_ai_table.py from RAW_AI_DICTIONARY - do not edit.
+Row layout: ai_dictionary_loader.AI_TABLE_FIELDS.
+"""
+
+'''
+
+
+def _row(entry) -> tuple:
+    return tuple(getattr(entry, name) for name in AI_TABLE_FIELDS)
+
+
+def main() -> None:
+    entries = _parse_raw_dictionary()
+    lines = [HEADER, f"SOURCE_DIGEST = {raw_dictionary_digest()!r}\n\n", "AI_TABLE = (\n"]
+    lines.extend(f"    {_row(entry)!r},\n" for entry in entries.values())
+    lines.append(")\n")
+    OUTPUT.write_text("".join(lines), encoding="utf-8")
+    print(f"Wrote {len(entries)} AIs to {OUTPUT.relative_to(ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -458,6 +458,16 @@ class TestAIDictionary:
         assert batch.fixed_length is None
         assert batch.max_length == 20
         assert batch.separator_required is True
+    
+    def test_pregenerated_table_matches_raw_dictionary(self):
+        """Test the pregenerated AI table is current and parses identically."""
+        from gs1_parser.core import ai_dictionary_loader as loader
+        from gs1_parser.core._ai_table import SOURCE_DIGEST
+        
+        assert SOURCE_DIGEST == loader.raw_dictionary_digest(), (
+            "Run scripts/generate_ai_table.py after editing RAW_AI_DICTIONARY"
+        )
+        assert loader._entries_from_table() == loader._parse_raw_dictionary()
 
 
 class TestPerformance:
@@ -256,5 +256,39 @@ class TestProductionReadiness:
         assert gtin == "06286740000249"
 
 
+class TestParseCache:
+    """Test memoization of repeated parses."""
+
+    def test_repeat_parse_hits_cache(self):
+        """Test a re-scanned barcode is served from the cache."""
+        barcode = "01062867400002491728043010GB2C2171490437969853"
+        parse_gs1_to_json.cache_clear()
+
+        first = parse_gs1_to_json(barcode)
+        second = parse_gs1_to_json(barcode)
+
+        assert first == second
+        assert parse_gs1_to_json.cache_info().hits == 1
+
+    def test_cached_dicts_are_independent(self):
+        """Test callers mutating a result do not affect later parses."""
+        barcode = "01062867400002491728043010GB2C2171490437969853"
+
+        data = parse_gs1_to_dict(barcode)
+        data["GTIN Code"] = "changed"
+
+        assert parse_gs1_to_dict(barcode)["GTIN Code"] == "06286740000249"
+
+    def test_set_options_are_cacheable(self):
+        """Test set-valued parse options still go through the cache."""
+        barcode = "01062867400002491728043010GB2C2171490437969853"
+        parse_gs1_to_json.cache_clear()
+
+        parse_gs1_to_json(barcode, vendor_whitelist_internal_ais={"91"})
+        parse_gs1_to_json(barcode, vendor_whitelist_internal_ais={"91"})
+
+        assert parse_gs1_to_json.cache_info().hits == 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
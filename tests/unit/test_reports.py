@@ -0,0 +1,94 @@
+"""
+Tests for report exports.
+"""
+
+import csv
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from modules import reports
+
+
+@pytest.fixture
+def exports_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(reports, "EXPORTS_DIR", tmp_path)
+    return tmp_path
+
+
+class TestExportCsvStream:
+    """Tests for the streaming CSV writer."""
+
+    def test_round_trip(self, exports_dir):
+        """Test rows read back in order, with blanks for None and missing keys."""
+        rows = [
+            {"line_id": "L2", "gtin": "09506000134352", "on_hand_count": 2.5, "notes": "a, \"quoted\" note"},
+            {"line_id": "L1", "gtin": None, "extra": "ignored"},
+        ]
+        path = reports.export_csv_stream(iter(rows), ["line_id", "gtin", "on_hand_count", "notes"], "lines.csv")
+
+        assert path == exports_dir / "lines.csv"
+        with path.open(newline="", encoding="utf-8") as handle:
+            read = list(csv.DictReader(handle))
+        assert read == [
+            {"line_id": "L2", "gtin": "09506000134352", "on_hand_count": "2.5", "notes": "a, \"quoted\" note"},
+            {"line_id": "L1", "gtin": "", "on_hand_count": "", "notes": ""},
+        ]
+
+    def test_empty_rows_write_header(self, exports_dir):
+        """Test an empty session still yields a header-only file."""
+        path = reports.export_csv_stream(iter(()), ["line_id", "gtin"], "empty.csv")
+        assert path.read_text(encoding="utf-8").splitlines() == ["line_id,gtin"]
+
+
+class TestExportExcel:
+    """Tests for the write-only openpyxl workbook exports."""
+
+    @staticmethod
+    def _frame():
+        return pd.DataFrame(
+            {
+                "status": pd.Categorical(["Valid", "Expired", None], categories=["Valid", "Near Expiry", "Expired"]),
+                "on_hand_count": [1.5, float("nan"), 3.0],
+                "units": pd.array([4, None, 6], dtype="Int64"),
+                "scanned": pd.to_datetime(["2024-01-02 03:04:05", None, "2024-12-31 00:00:00"]),
+                "gtin": ["09506000134352", "", None],
+            }
+        )
+
+    @staticmethod
+    def _rows(sheet):
+        return [list(row) for row in sheet.iter_rows(values_only=True)]
+
+    def test_round_trip_with_metadata(self, exports_dir):
+        """Test sheet names, headers and cell values, with blanks for missing values."""
+        from openpyxl import load_workbook
+
+        df = self._frame()
+        path = reports.export_excel_with_metadata(
+            df, df.head(1), pd.DataFrame(), {"Session ID": "S1"}, "report.xlsx"
+        )
+
+        workbook = load_workbook(path)
+        assert workbook.sheetnames == ["Metadata", "Detailed", "Summary"]
+        assert self._rows(workbook["Metadata"]) == [["Field", "Value"], ["Session ID", "S1"]]
+        detailed = self._rows(workbook["Detailed"])
+        assert detailed[0] == ["status", "on_hand_count", "units", "scanned", "gtin"]
+        assert detailed[1:] == [
+            ["Valid", 1.5, 4, datetime(2024, 1, 2, 3, 4, 5), "09506000134352"],
+            ["Expired", None, None, None, None],
+            [None, 3.0, 6, datetime(2024, 12, 31), None],
+        ]
+        assert self._rows(workbook["Summary"]) == detailed[:2]
+
+    def test_export_excel_sheets(self, exports_dir):
+        """Test export_excel writes all three sheets, header-only when a frame is empty."""
+        from openpyxl import load_workbook
+
+        df = self._frame()
+        path = reports.export_excel(df, df, df.iloc[:0], "lines.xlsx")
+
+        workbook = load_workbook(path)
+        assert workbook.sheetnames == ["Detailed", "Summary", "Warnings"]
+        assert self._rows(workbook["Warnings"]) == [["status", "on_hand_count", "units", "scanned", "gtin"]]
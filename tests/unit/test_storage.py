@@ -0,0 +1,239 @@
+"""
+Tests for the inventory storage layer (JSON backend unless noted).
+
+Tests cover:
+- Batched line updates/deletes with their audit records (Mongo: one transaction)
+- Audit record columns
+- Streaming line listing order
+- Settings defaults
+"""
+
+import pytest
+
+from modules import storage
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """Point the storage module at an empty JSON file."""
+    monkeypatch.setattr(storage, "PERSISTENCE_BACKEND", "json")
+    monkeypatch.setattr(storage, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(storage, "JSON_PATH", tmp_path / "app.json")
+    storage.init_db()
+    return storage
+
+
+def _add_line(store, line_id, scan_timestamp, session_id="S1", **fields):
+    return store.create_line(
+        {"line_id": line_id, "session_id": session_id, "scan_timestamp": scan_timestamp, **fields}
+    )
+
+
+class TestApplyLineChanges:
+    """Tests for apply_line_changes."""
+
+    def test_mixed_updates_and_deletes(self, store):
+        """Test updates and deletes land in one call."""
+        _add_line(store, "L1", "2024-01-01T00:00:01Z", on_hand_count=1.0)
+        _add_line(store, "L2", "2024-01-01T00:00:02Z", on_hand_count=2.0)
+        _add_line(store, "L3", "2024-01-01T00:00:03Z", on_hand_count=3.0)
+
+        store.apply_line_changes(
+            updates={"L1": {"on_hand_count": 10.0, "notes": "recount"}, "L2": {}},
+            deletes=["L3"],
+        )
+
+        lines = {l["line_id"]: l for l in store.list_lines("S1")}
+        assert set(lines) == {"L1", "L2"}
+        assert lines["L1"]["on_hand_count"] == 10.0
+        assert lines["L1"]["notes"] == "recount"
+        assert lines["L2"]["on_hand_count"] == 2.0
+
+    def test_audit_records_written(self, store):
+        """Test audit entries are stored with the ids that are returned."""
+        _add_line(store, "L1", "2024-01-01T00:00:01Z", on_hand_count=1.0)
+
+        audit_ids = store.apply_line_changes(
+            updates={"L1": {"on_hand_count": 5.0}},
+            audits=[
+                dict(
+                    username="admin",
+                    action_type="edit_line",
+                    session_id="S1",
+                    line_id="L1",
+                    old_value={"on_hand_count": 1.0},
+                    new_value={"on_hand_count": 5.0},
+                )
+            ],
+        )
+
+        records = store.list_audit("S1")
+        assert [r["audit_id"] for r in records] == audit_ids
+        assert records[0]["action_type"] == "edit_line"
+        assert records[0]["new_value"] == {"on_hand_count": 5.0}
+
+    def test_empty_input_is_a_no_op(self, store):
+        """Test empty input returns no ids and leaves the file untouched."""
+        _add_line(store, "L1", "2024-01-01T00:00:01Z")
+        before = store.JSON_PATH.read_bytes()
+
+        assert store.apply_line_changes() == []
+        assert store.apply_line_changes(updates={"L1": {}}, deletes=[], audits=[]) == []
+        assert store.JSON_PATH.read_bytes() == before
+
+
+class TestApplyLineChangesMongo:
+    """Tests that Mongo line writes and audit inserts share one transaction."""
+
+    @pytest.fixture
+    def mongo(self, monkeypatch):
+        from pymongo.errors import OperationFailure
+
+        calls = []
+
+        class Collection:
+            def __init__(self, name):
+                self.name = name
+
+            def bulk_write(self, ops, ordered, session=None):
+                calls.append((self.name, len(ops), session))
+
+            def insert_many(self, docs, ordered, session=None):
+                calls.append((self.name, len(docs), session))
+
+        class Session:
+            transactions = True
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def with_transaction(self, callback):
+                if not Session.transactions:
+                    raise OperationFailure("Transaction numbers are only allowed on a replica set", code=20)
+                callback(self)
+
+        class Client:
+            def start_session(self):
+                return Session()
+
+        class FakeDb:
+            lines = Collection("lines")
+            audit = Collection("audit")
+
+        monkeypatch.setattr(storage, "PERSISTENCE_BACKEND", "mongodb")
+        monkeypatch.setattr(storage, "get_db", lambda: FakeDb())
+        monkeypatch.setattr(storage, "_get_client", lambda: Client())
+        return calls, Session
+
+    def _apply(self):
+        return storage.apply_line_changes(
+            updates={"L1": {"on_hand_count": 5.0}},
+            deletes=["L2"],
+            audits=[dict(username="admin", action_type="edit_line", session_id="S1", line_id="L1")],
+        )
+
+    def test_writes_share_a_transaction(self, mongo):
+        """Test both writes run inside the same session transaction."""
+        calls, _ = mongo
+        assert len(self._apply()) == 1
+        assert [(name, n) for name, n, _ in calls] == [("lines", 2), ("audit", 1)]
+        assert calls[0][2] is not None and calls[0][2] is calls[1][2]
+
+    def test_standalone_server_falls_back(self, mongo):
+        """Test a server without transactions still gets both writes."""
+        calls, session_cls = mongo
+        session_cls.transactions = False
+        self._apply()
+        assert calls == [("lines", 2, None), ("audit", 1, None)]
+
+
+class TestAuditColumns:
+    """Tests that audit rows carry every column the Audit page renders."""
+
+    def test_audit_doc_fields_match_columns(self):
+        """Test AUDIT_COLUMNS is exactly what _audit_doc writes besides _id."""
+        doc = storage._audit_doc("admin", "edit_line")
+        assert tuple(k for k in doc if k != "_id") == storage.AUDIT_COLUMNS
+
+    def test_listed_rows_have_all_columns(self, store):
+        """Test list_audit rows include every audit column."""
+        store.create_audit("admin", "create_session", session_id="S1")
+        rows = store.list_audit("S1")
+        assert len(rows) == 1
+        assert set(storage.AUDIT_COLUMNS) <= set(rows[0])
+
+    def test_mongo_projection_only_drops_id(self, monkeypatch):
+        """Test the Mongo query projects away _id and nothing else."""
+        calls = []
+
+        class Cursor(list):
+            def sort(self, *args):
+                return self
+
+        class Audit:
+            def find(self, query, projection):
+                calls.append(projection)
+                doc = storage._audit_doc("admin", "edit_line", session_id="S1")
+                return Cursor([{k: v for k, v in doc.items() if projection.get(k, 1)}])
+
+        class FakeDb:
+            audit = Audit()
+
+        monkeypatch.setattr(storage, "PERSISTENCE_BACKEND", "mongodb")
+        monkeypatch.setattr(storage, "get_db", lambda: FakeDb())
+
+        rows = storage.list_audit("S1")
+        assert calls == [{"_id": 0}]
+        assert tuple(rows[0]) == storage.AUDIT_COLUMNS
+
+
+class TestListLinesIter:
+    """Tests for list_lines_iter ordering and sparse rows."""
+
+    def test_newest_first_and_matches_list_lines(self, store):
+        """Test lines stream newest first, only for the requested session."""
+        _add_line(store, "L1", "2024-01-01T00:00:02Z")
+        _add_line(store, "L2", "2024-01-01T00:00:03Z")
+        _add_line(store, "L3", "2024-01-01T00:00:01Z")
+        _add_line(store, "X1", "2024-01-01T00:00:04Z", session_id="S2")
+
+        streamed = list(store.list_lines_iter("S1"))
+        assert [l["line_id"] for l in streamed] == ["L2", "L1", "L3"]
+        assert streamed == store.list_lines("S1")
+
+    def test_rows_missing_keys(self, store):
+        """Test rows stored without a timestamp or other fields still stream, last."""
+        _add_line(store, "L1", "2024-01-01T00:00:01Z")
+        payload = store._json_load()
+        payload["lines"].append({"line_id": "L0", "session_id": "S1"})
+        store._json_save(payload)
+
+        streamed = list(store.list_lines_iter("S1"))
+        assert [l["line_id"] for l in streamed] == ["L1", "L0"]
+        assert streamed[1] == {"line_id": "L0", "session_id": "S1"}
+
+
+class TestGetSettings:
+    """Tests for get_settings falling back to defaults."""
+
+    DEFAULTS = {"near_expiry_months": 6, "data_retention_sessions": 0}
+
+    def test_empty_store_returns_defaults(self, store):
+        """Test an empty settings store yields the defaults."""
+        assert store.get_settings(self.DEFAULTS) == self.DEFAULTS
+
+    def test_missing_key_falls_back(self, store):
+        """Test stored keys win and missing ones use their default."""
+        store.set_setting("near_expiry_months", 3)
+        store.set_setting("unrelated", "x")
+        assert store.get_settings(self.DEFAULTS) == {"near_expiry_months": 3, "data_retention_sessions": 0}
+
+    def test_settings_section_absent(self, store):
+        """Test a JSON file without a settings section yields the defaults."""
+        payload = store._json_load()
+        del payload["settings"]
+        store._json_save(payload)
+        assert store.get_settings(self.DEFAULTS) == self.DEFAULTS